@@ -62,6 +62,12 @@ setup(
             "pytest-asyncio>=0.21.0",
             "hypothesis>=6.88.0",
         ],
+        "fast": [
+            "orjson>=3.9.0",
+            "ciso8601>=2.3.0",
+            "google-re2>=1.1",
+            "pyahocorasick>=2.0",
+        ],
     },
     entry_points={
         "console_scripts": [
@@ -27,7 +27,15 @@ from .core.models import (
 
 from .parsers.base import PlatformParser
 from .formatters.base import PlatformFormatter
-from .core.payment import PaymentManager
+
+
+def __getattr__(name):
+    # PaymentManager pulls in the payment stack, so defer it until requested
+    if name == "PaymentManager":
+        from .payments import PaymentManager
+        globals()[name] = PaymentManager
+        return PaymentManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = [
     "ParsedExport",
@@ -5,12 +5,17 @@ This module provides the main CLI entry point using Click framework.
 """
 
 import click
+import contextlib
+import io
 import os
 import sys
 import subprocess
 import shutil
-from typing import Optional, List, Dict, Any
-from rich.console import Console
+import heapq
+import functools
+from operator import itemgetter
+from typing import Optional, List, Dict, Any, Tuple
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.text import Text
 from rich.table import Table
@@ -27,7 +32,21 @@ console = Console()
 
 def _show_platform_comparison():
     """Display comparison between Gemini and Ollama options."""
-    console.print("\n[bold blue]Platform Comparison[/bold blue]")
+    console.file.write(_render_platform_comparison(console.width, console.color_system))
+    console.file.flush()
+
+
+@functools.lru_cache(maxsize=None)
+def _render_platform_comparison(width: int, color_system: Optional[str]) -> str:
+    """Render the static platform comparison once per terminal width and color system."""
+    recorder = Console(
+        file=io.StringIO(),
+        width=width,
+        color_system=color_system,
+        force_terminal=color_system is not None
+    )
+    
+    recorder.print("\n[bold blue]Platform Comparison[/bold blue]")
     
     table = Table(title="Gemini vs Ollama")
     table.add_column("Feature", style="cyan", width=20)
@@ -42,22 +61,220 @@ def _show_platform_comparison():
     table.add_row("Cost", "Free tier available", "Free (uses local resources)")
     table.add_row("Model Choice", "Gemini models only", "Many open-source models")
     
-    console.print(table)
+    recorder.print(table)
     
-    console.print("\n[bold]Privacy Implications:[/bold]")
-    console.print("• [green]Gemini:[/green] Your context will be stored on Google's servers")
-    console.print("• [yellow]Ollama:[/yellow] Everything stays on your local machine")
+    recorder.print("\n[bold]Privacy Implications:[/bold]")
+    recorder.print("• [green]Gemini:[/green] Your context will be stored on Google's servers")
+    recorder.print("• [yellow]Ollama:[/yellow] Everything stays on your local machine")
     
-    console.print("\n[bold]Performance Trade-offs:[/bold]")
-    console.print("• [green]Gemini:[/green] Fast responses, advanced reasoning, large context window")
-    console.print("• [yellow]Ollama:[/yellow] Speed depends on hardware, various model capabilities")
+    recorder.print("\n[bold]Performance Trade-offs:[/bold]")
+    recorder.print("• [green]Gemini:[/green] Fast responses, advanced reasoning, large context window")
+    recorder.print("• [yellow]Ollama:[/yellow] Speed depends on hardware, various model capabilities")
+    
+    return recorder.file.getvalue()
+
+
+# (label, field, formatter) specs for the compatibility report tables
+_FORMAT_ANALYSIS_ROWS = (
+    ("Detected Version", "detected_version", str),
+    ("Compatibility", "compatibility_level", lambda level: level.value.replace('_', ' ').title()),
+    ("Confidence", "confidence", "{:.1%}".format),
+)
+
+_EXPORT_INFO_ROWS = (
+    ("Conversations", "conversations_count", str),
+    ("Export Date", "export_date", str),
+    ("Format Version", "format_version", str),
+)
+
+
+class _DummyProgress:
+    """No-op stand-in for a rich Progress when output is not a terminal."""
+    
+    def add_task(self, description: str, **kwargs) -> int:
+        return 0
+    
+    def update(self, task_id: int, **kwargs) -> None:
+        pass
+
+
+def _progress():
+    """Return a spinner progress context, or a no-op one when output is not a terminal."""
+    if not console.is_terminal:
+        return contextlib.nullcontext(_DummyProgress())
+    return Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console
+    )
+
+
+def _print_lines(lines: List[str]) -> None:
+    """Print markup lines as one renderable so the section is written in a single call."""
+    console.print(Group(*lines))
+
+
+def _metrics_table(title: Optional[str], columns: Tuple[str, str], rows: List[Tuple[str, str]]) -> Table:
+    """Build a two-column results table from pre-collected rows."""
+    table = Table(title=title)
+    table.add_column(columns[0], style="cyan")
+    table.add_column(columns[1], style="magenta")
+    for row in rows:
+        table.add_row(*row)
+    return table
+
+
+# The examples command's output never changes, so it is built once at import
+_EXAMPLES_RENDERABLE = Group(
+    Panel(
+        Text("Usage Examples", style="bold blue"),
+        subtitle="Common scenarios and commands"
+    ),
+    "\n[bold]1. Basic Export to Gemini:[/bold]",
+    "[cyan]llm-context-export export -i chatgpt_export.zip -t gemini -o ./gemini_output[/cyan]",
+    "[dim]Exports ChatGPT conversations to Gemini Saved Info format[/dim]",
+    "\n[bold]2. Interactive Export with Filtering:[/bold]",
+    "[cyan]llm-context-export export -i chatgpt_export.zip -t ollama -o ./ollama_output --interactive[/cyan]",
+    "[dim]Lets you choose which projects and topics to include[/dim]",
+    "\n[bold]3. Incremental Update:[/bold]",
+    "[cyan]llm-context-export export -i new_export.zip -t gemini -o ./updated --update ./previous/context.json[/cyan]",
+    "[dim]Adds only new conversations to existing context[/dim]",
+    "\n[bold]4. Generate Delta Package:[/bold]",
+    "[cyan]llm-context-export delta -c new_export.zip -p ./old_context.json -o ./delta[/cyan]",
+    "[dim]Creates package with only new information[/dim]",
+    "\n[bold]5. Validate Context Transfer:[/bold]",
+    "[cyan]llm-context-export validate -c ./output/context.json -t gemini --interactive[/cyan]",
+    "[dim]Generates test questions to verify successful transfer[/dim]",
+    "\n[bold]6. Compare Platforms:[/bold]",
+    "[cyan]llm-context-export compare[/cyan]",
+    "[dim]Shows detailed comparison between Gemini and Ollama[/dim]",
+    "\n[bold]7. Web Interface:[/bold]",
+    "[cyan]llm-context-export web[/cyan]",
+    "[dim]Starts local web interface for non-technical users[/dim]",
+    "\n[bold]8. Dry Run (Preview):[/bold]",
+    "[cyan]llm-context-export export -i export.zip -t gemini -o ./output --dry-run[/cyan]",
+    "[dim]Shows what would be exported without creating files[/dim]",
+    "\n[bold]9. Advanced Filtering:[/bold]",
+    "[cyan]llm-context-export export -i export.zip -t ollama -o ./output \\[/cyan]",
+    "[cyan]  --exclude-topics 'personal,private' --min-relevance 0.5[/cyan]",
+    "[dim]Excludes specific topics and low-relevance projects[/dim]",
+    "\n[bold]10. Compatibility Check:[/bold]",
+    "[cyan]llm-context-export compatibility -f export.zip -t ollama[/cyan]",
+    "[dim]Analyzes export file and checks platform compatibility[/dim]",
+    "\n[bold]11. Platform Requirements:[/bold]",
+    "[cyan]llm-context-export compatibility -t ollama[/cyan]",
+    "[dim]Checks if Ollama is properly installed and configured[/dim]",
+    "\n[bold]Getting Help:[/bold]",
+    "• [cyan]llm-context-export --help[/cyan] - Main help",
+    "• [cyan]llm-context-export <command> --help[/cyan] - Command-specific help",
+    "• [cyan]llm-context-export info --verbose[/cyan] - Detailed information",
+    "• [cyan]llm-context-export compatibility --help[/cyan] - Compatibility analysis help",
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _info_renderable(verbose: bool) -> Group:
+    """Build the info command's output once per verbosity; none of it depends on user input."""
+    lines = [
+        "\n[bold]Supported Source Platforms:[/bold]",
+        "• [green]ChatGPT[/green] (official export files - ZIP or JSON)",
+    ]
+    if verbose:
+        lines += [
+            "  - Supports all ChatGPT export format versions",
+            "  - Handles both individual JSON files and ZIP archives",
+            "  - Preserves message timestamps, roles, and metadata",
+        ]
+    
+    lines += [
+        "\n[bold]Supported Target Platforms:[/bold]",
+        "• [green]Google Gemini[/green] (Saved Info format)",
+    ]
+    if verbose:
+        lines += [
+            "  - Optimized text format for Gemini comprehension",
+            "  - Automatic size limit handling and prioritization",
+            "  - Step-by-step setup instructions included",
+        ]
+    
+    lines.append("• [yellow]Ollama[/yellow] (Local LLM with Modelfile)")
+    if verbose:
+        lines += [
+            "  - Generates valid Modelfile with system prompt",
+            "  - Optimized for Qwen and other open-source models",
+            "  - Handles large contexts with file splitting",
+            "  - Includes model creation and test commands",
+        ]
+    
+    lines += [
+        "\n[bold]Key Features:[/bold]",
+        "• [blue]Privacy-first:[/blue] All processing happens locally",
+        "• [blue]Smart extraction:[/blue] Identifies projects, preferences, and expertise",
+        "• [blue]Interactive filtering:[/blue] Choose what to include/exclude",
+        "• [blue]Incremental updates:[/blue] Add new conversations without re-processing",
+        "• [blue]Validation tests:[/blue] Verify successful context transfer",
+        "• [blue]Multiple interfaces:[/blue] CLI for developers, web UI for everyone",
+    ]
+    
+    if verbose:
+        lines += [
+            "\n[bold]What Gets Extracted:[/bold]",
+            "• Project descriptions and technical details",
+            "• Programming languages and frameworks used",
+            "• Tools and development preferences",
+            "• Working patterns and communication style",
+            "• Domain expertise and background knowledge",
+        ]
+    
+    lines += [
+        "\n[bold]Privacy & Security:[/bold]",
+        "• [green]Local processing:[/green] No data sent to external services",
+        "• [green]Encryption:[/green] Context packages encrypted at rest",
+        "• [green]Sensitive data detection:[/green] Prompts for redaction approval",
+        "• [green]Secure deletion:[/green] Complete removal when requested",
+    ]
+    
+    if verbose:
+        lines += [
+            "\n[bold]Limitations:[/bold]",
+            "• Target LLMs may interpret context differently",
+            "• Platform-specific features don't transfer",
+            "• Large contexts may be truncated",
+            "• Quality depends on conversation content",
+        ]
+    
+    lines += [
+        "\n[bold]Quick Start:[/bold]",
+        "1. Export your ChatGPT data (Settings → Data Export)",
+        "2. Choose platform: [cyan]llm-context-export compare[/cyan]",
+        "3. Export context: [cyan]llm-context-export export -i export.zip -t gemini -o ./output[/cyan]",
+        "4. Validate transfer: [cyan]llm-context-export validate -c ./output -t gemini[/cyan]",
+        "\n[dim]For detailed help: llm-context-export <command> --help[/dim]",
+        "[dim]Web interface: llm-context-export web[/dim]",
+    ]
+    
+    return Group(
+        Panel(
+            Text("LLM Context Exporter", style="bold blue"),
+            subtitle="Platform Information & Usage Guide"
+        ),
+        *lines
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _get_chatgpt_parser():
+    """Return a shared ChatGPT parser; it keeps no per-file state."""
+    from ..parsers.chatgpt import ChatGPTParser
+    
+    return ChatGPTParser()
 
 
 def _check_ollama_installation() -> bool:
     """Check if Ollama is installed and provide guidance if not."""
     from ..core.compatibility import CompatibilityManager
     
-    compatibility_manager = CompatibilityManager()
+    compatibility_manager = CompatibilityManager(cache_ollama_status=True)
     is_ready, status_info = compatibility_manager.verify_ollama_installation()
     
     if is_ready:
@@ -213,7 +430,9 @@ def _show_disclaimer():
               help='Minimum relevance score for projects (0.0-1.0)')
 @click.option('--dry-run', is_flag=True,
               help='Show what would be exported without creating files')
-def export(input, target, output, model, interactive, update, exclude_conversations, exclude_topics, min_relevance, dry_run):
+@click.option('--workers', type=click.IntRange(min=1), default=1,
+              help='Processes used to extract context from large exports (default: 1)')
+def export(input, target, output, model, interactive, update, exclude_conversations, exclude_topics, min_relevance, dry_run, workers):
     """Export ChatGPT conversations to target platform format."""
     
     # Show platform comparison if no target specified
@@ -262,11 +481,7 @@ def export(input, target, output, model, interactive, update, exclude_conversati
     if interactive:
         console.print("\n[yellow]Parsing export file for interactive filtering...[/yellow]")
         try:
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console
-            ) as progress:
+            with _progress() as progress:
                 task = progress.add_task("Parsing conversations...", total=None)
                 
                 from ..parsers.chatgpt import ChatGPTParser
@@ -316,16 +531,13 @@ def export(input, target, output, model, interactive, update, exclude_conversati
         filters=filters,
         interactive=interactive,
         incremental=bool(update),
-        previous_context_path=update
+        previous_context_path=update,
+        workers=workers
     )
     
     # Perform export
     try:
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
+        with _progress() as progress:
             task = progress.add_task("Exporting context...", total=None)
             
             handler = ExportHandler()
@@ -337,17 +549,14 @@ def export(input, target, output, model, interactive, update, exclude_conversati
             console.print("\n[green]✓ Export completed successfully![/green]")
             
             # Display results table
-            table = Table(title="Export Results")
-            table.add_column("Metric", style="cyan")
-            table.add_column("Value", style="magenta")
-            
             metadata = results["metadata"]
-            table.add_row("Conversations Parsed", str(metadata.get("conversations_parsed", "N/A")))
-            table.add_row("Projects Extracted", str(metadata.get("projects_extracted", "N/A")))
-            table.add_row("Languages Found", str(metadata.get("languages_found", "N/A")))
-            table.add_row("Filters Applied", "Yes" if metadata.get("filtered") else "No")
-            
-            console.print(table)
+            rows = [
+                ("Conversations Parsed", str(metadata.get("conversations_parsed", "N/A"))),
+                ("Projects Extracted", str(metadata.get("projects_extracted", "N/A"))),
+                ("Languages Found", str(metadata.get("languages_found", "N/A"))),
+                ("Filters Applied", "Yes" if metadata.get("filtered") else "No"),
+            ]
+            console.print(_metrics_table("Export Results", ("Metric", "Value"), rows))
             
             console.print(f"\n[green]Output files:[/green]")
             for file_path in results["output_files"]:
@@ -433,11 +642,7 @@ def validate(context, target, interactive):
         from ..validation.generator import ValidationGenerator
         
         # Load context pack
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
+        with _progress() as progress:
             task = progress.add_task("Loading context...", total=None)
             
             updater = IncrementalUpdater()
@@ -527,11 +732,7 @@ def delta(current, previous, output, dry_run):
         from ..core.extractor import ContextExtractor
         from ..core.incremental import IncrementalUpdater
         
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
+        with _progress() as progress:
             task = progress.add_task("Processing exports...", total=None)
             
             # Parse current export
@@ -562,17 +763,15 @@ def delta(current, previous, output, dry_run):
             progress.update(task, description="Complete!")
         
         # Display delta statistics
-        table = Table(title="Delta Package Contents")
-        table.add_column("Category", style="cyan")
-        table.add_column("New Items", style="magenta")
-        
-        table.add_row("Projects", str(len(delta_package.projects)))
-        table.add_row("Languages", str(len(delta_package.technical_context.languages)))
-        table.add_row("Frameworks", str(len(delta_package.technical_context.frameworks)))
-        table.add_row("Tools", str(len(delta_package.technical_context.tools)))
-        table.add_row("Domains", str(len(delta_package.technical_context.domains)))
-        
-        console.print(table)
+        delta_technical = delta_package.technical_context
+        rows = [
+            ("Projects", str(len(delta_package.projects))),
+            ("Languages", str(len(delta_technical.languages))),
+            ("Frameworks", str(len(delta_technical.frameworks))),
+            ("Tools", str(len(delta_technical.tools))),
+            ("Domains", str(len(delta_technical.domains))),
+        ]
+        console.print(_metrics_table("Delta Package Contents", ("Category", "New Items"), rows))
         
         if not dry_run:
             # Save delta package
@@ -596,19 +795,19 @@ def compare():
     """Compare Gemini vs Ollama platforms to help choose."""
     _show_platform_comparison()
     
-    console.print("\n[bold]Recommendations:[/bold]")
-    console.print("• Choose [green]Gemini[/green] if you want:")
-    console.print("  - Quick setup (copy-paste)")
-    console.print("  - Cloud-powered performance")
-    console.print("  - Don't mind data on Google servers")
-    
-    console.print("\n• Choose [yellow]Ollama[/yellow] if you want:")
-    console.print("  - Complete privacy (local processing)")
-    console.print("  - Offline access")
-    console.print("  - Control over model choice")
-    console.print("  - Don't mind technical setup")
-    
-    console.print(f"\n[dim]Use: llm-context-export export -i <file> -t <platform> -o <output>[/dim]")
+    _print_lines([
+        "\n[bold]Recommendations:[/bold]",
+        "• Choose [green]Gemini[/green] if you want:",
+        "  - Quick setup (copy-paste)",
+        "  - Cloud-powered performance",
+        "  - Don't mind data on Google servers",
+        "\n• Choose [yellow]Ollama[/yellow] if you want:",
+        "  - Complete privacy (local processing)",
+        "  - Offline access",
+        "  - Control over model choice",
+        "  - Don't mind technical setup",
+        f"\n[dim]Use: llm-context-export export -i <file> -t <platform> -o <output>[/dim]",
+    ])
 
 
 @cli.command()
@@ -676,69 +875,7 @@ def web(port, host, debug):
 @click.option('--verbose', '-v', is_flag=True, help='Show detailed information')
 def info(verbose):
     """Display information about supported platforms and features."""
-    console.print(Panel(
-        Text("LLM Context Exporter", style="bold blue"),
-        subtitle="Platform Information & Usage Guide"
-    ))
-    
-    console.print("\n[bold]Supported Source Platforms:[/bold]")
-    console.print("• [green]ChatGPT[/green] (official export files - ZIP or JSON)")
-    if verbose:
-        console.print("  - Supports all ChatGPT export format versions")
-        console.print("  - Handles both individual JSON files and ZIP archives")
-        console.print("  - Preserves message timestamps, roles, and metadata")
-    
-    console.print("\n[bold]Supported Target Platforms:[/bold]")
-    console.print("• [green]Google Gemini[/green] (Saved Info format)")
-    if verbose:
-        console.print("  - Optimized text format for Gemini comprehension")
-        console.print("  - Automatic size limit handling and prioritization")
-        console.print("  - Step-by-step setup instructions included")
-    
-    console.print("• [yellow]Ollama[/yellow] (Local LLM with Modelfile)")
-    if verbose:
-        console.print("  - Generates valid Modelfile with system prompt")
-        console.print("  - Optimized for Qwen and other open-source models")
-        console.print("  - Handles large contexts with file splitting")
-        console.print("  - Includes model creation and test commands")
-    
-    console.print("\n[bold]Key Features:[/bold]")
-    console.print("• [blue]Privacy-first:[/blue] All processing happens locally")
-    console.print("• [blue]Smart extraction:[/blue] Identifies projects, preferences, and expertise")
-    console.print("• [blue]Interactive filtering:[/blue] Choose what to include/exclude")
-    console.print("• [blue]Incremental updates:[/blue] Add new conversations without re-processing")
-    console.print("• [blue]Validation tests:[/blue] Verify successful context transfer")
-    console.print("• [blue]Multiple interfaces:[/blue] CLI for developers, web UI for everyone")
-    
-    if verbose:
-        console.print("\n[bold]What Gets Extracted:[/bold]")
-        console.print("• Project descriptions and technical details")
-        console.print("• Programming languages and frameworks used")
-        console.print("• Tools and development preferences")
-        console.print("• Working patterns and communication style")
-        console.print("• Domain expertise and background knowledge")
-    
-    console.print("\n[bold]Privacy & Security:[/bold]")
-    console.print("• [green]Local processing:[/green] No data sent to external services")
-    console.print("• [green]Encryption:[/green] Context packages encrypted at rest")
-    console.print("• [green]Sensitive data detection:[/green] Prompts for redaction approval")
-    console.print("• [green]Secure deletion:[/green] Complete removal when requested")
-    
-    if verbose:
-        console.print("\n[bold]Limitations:[/bold]")
-        console.print("• Target LLMs may interpret context differently")
-        console.print("• Platform-specific features don't transfer")
-        console.print("• Large contexts may be truncated")
-        console.print("• Quality depends on conversation content")
-    
-    console.print("\n[bold]Quick Start:[/bold]")
-    console.print("1. Export your ChatGPT data (Settings → Data Export)")
-    console.print("2. Choose platform: [cyan]llm-context-export compare[/cyan]")
-    console.print("3. Export context: [cyan]llm-context-export export -i export.zip -t gemini -o ./output[/cyan]")
-    console.print("4. Validate transfer: [cyan]llm-context-export validate -c ./output -t gemini[/cyan]")
-    
-    console.print(f"\n[dim]For detailed help: llm-context-export <command> --help[/dim]")
-    console.print(f"[dim]Web interface: llm-context-export web[/dim]")
+    console.print(_info_renderable(verbose))
 
 
 # Add admin commands as a subgroup
@@ -749,22 +886,22 @@ cli.add_command(admin)
 @click.option('--file', '-f', help='ChatGPT export file to analyze')
 @click.option('--target', '-t', type=click.Choice(['gemini', 'ollama']), 
               help='Target platform for compatibility check')
-def compatibility(file, target):
+@click.option('--cache', is_flag=True,
+              help='Reuse parse results from earlier runs (keeps a copy of the parsed export in the local cache)')
+def compatibility(file, target, cache):
     """Check compatibility and generate detailed compatibility report."""
     console.print(Panel(
         Text("Compatibility Analysis", style="bold cyan"),
         subtitle="Platform Compatibility Report"
     ))
     
-    from ..core.compatibility import CompatibilityManager
-    from ..parsers.chatgpt import ChatGPTParser
-    
-    compatibility_manager = CompatibilityManager()
-    
     # If no file provided, just check target platform requirements
     if not file:
         if target == 'ollama':
+            from ..core.compatibility import CompatibilityManager
+            
             console.print("\n[bold]Checking Ollama Installation:[/bold]")
+            compatibility_manager = CompatibilityManager(cache_ollama_status=True)
             is_ready, status_info = compatibility_manager.verify_ollama_installation()
             
             if is_ready:
@@ -781,7 +918,7 @@ def compatibility(file, target):
             table.add_row(
                 "Ollama Binary", 
                 "✓ Found" if status_info["ollama_found"] else "✗ Missing",
-                status_info.get("version", "Not available")
+                status_info.get("version") or "Not available"
             )
             table.add_row(
                 "Ollama Service",
@@ -820,30 +957,43 @@ def compatibility(file, target):
         console.print(f"[red]✗ Error: File not found: {file}[/red]")
         sys.exit(1)
     
+    from ..core.compatibility import CompatibilityManager, ParsedExportCache
+    from ..parsers.chatgpt import ChatGPTParser
+    
+    # The manager collects per-run unsupported data, so it is not shared
+    compatibility_manager = CompatibilityManager(cache_ollama_status=True)
+    parser = _get_chatgpt_parser()
+    # Cached parse results hold conversation content, so caching is opt-in
+    parse_cache = ParsedExportCache() if cache else None
+    
     console.print(f"[yellow]Analyzing file:[/yellow] {file}")
     if target:
         console.print(f"[yellow]Target platform:[/yellow] {target}")
     
     try:
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
+        with _progress() as progress:
             task = progress.add_task("Analyzing export file...", total=None)
             
-            # Get format diagnostics
-            parser = ChatGPTParser()
-            diagnostic = compatibility_manager.detect_format_with_diagnostics(file, ChatGPTParser)
-            
-            progress.update(task, description="Parsing conversations...")
+            # Reuse the diagnostics and parse result from an earlier run on the same file
+            cached = parse_cache.get(file, ChatGPTParser.__name__) if parse_cache else None
             
-            # Parse the export
-            try:
-                parsed_export = parser.parse_export(file)
-            except Exception as e:
-                console.print(f"[red]✗ Error parsing file: {str(e)}[/red]")
-                sys.exit(1)
+            if cached is not None:
+                diagnostic, parsed_export = cached
+            else:
+                # Get format diagnostics
+                diagnostic = compatibility_manager.detect_format_with_diagnostics(file, ChatGPTParser)
+                
+                progress.update(task, description="Parsing conversations...")
+                
+                # Parse the export
+                try:
+                    parsed_export = parser.parse_export(file)
+                except Exception as e:
+                    console.print(f"[red]✗ Error parsing file: {str(e)}[/red]")
+                    sys.exit(1)
+                
+                if parse_cache:
+                    parse_cache.put(file, ChatGPTParser.__name__, diagnostic, parsed_export)
             
             progress.update(task, description="Generating compatibility report...")
             
@@ -851,56 +1001,43 @@ def compatibility(file, target):
             if target:
                 report = compatibility_manager.generate_compatibility_report(parsed_export, target)
             else:
-                # Generate reports for both platforms
-                gemini_report = compatibility_manager.generate_compatibility_report(parsed_export, "gemini")
-                ollama_report = compatibility_manager.generate_compatibility_report(parsed_export, "ollama")
-                report = {
-                    "export_info": gemini_report["export_info"],
-                    "platform_features": gemini_report["platform_features"],
-                    "unsupported_data": gemini_report["unsupported_data"],
-                    "gemini_status": gemini_report["target_platform_status"],
-                    "ollama_status": ollama_report["target_platform_status"],
-                    "recommendations": gemini_report["recommendations"] + ollama_report["recommendations"]
-                }
+                # Generate one report covering both platforms
+                report = compatibility_manager.generate_multi_platform_report(
+                    parsed_export, ["gemini", "ollama"]
+                )
             
             progress.update(task, description="Complete!")
         
         # Display format diagnostic
         console.print("\n[bold]Format Analysis:[/bold]")
-        format_table = Table()
-        format_table.add_column("Property", style="cyan")
-        format_table.add_column("Value", style="magenta")
-        
-        format_table.add_row("Detected Version", diagnostic.detected_version)
-        format_table.add_row("Compatibility", diagnostic.compatibility_level.value.replace('_', ' ').title())
-        format_table.add_row("Confidence", f"{diagnostic.confidence:.1%}")
+        format_rows = [
+            (label, fmt(getattr(diagnostic, field))) for label, field, fmt in _FORMAT_ANALYSIS_ROWS
+        ]
         if diagnostic.fallback_version:
-            format_table.add_row("Fallback Version", diagnostic.fallback_version)
+            format_rows.append(("Fallback Version", diagnostic.fallback_version))
         
-        console.print(format_table)
+        console.print(_metrics_table(None, ("Property", "Value"), format_rows))
         
+        diagnostic_lines = []
         if diagnostic.issues:
-            console.print("\n[bold red]Issues Found:[/bold red]")
-            for issue in diagnostic.issues:
-                console.print(f"• {issue}")
+            diagnostic_lines.append("\n[bold red]Issues Found:[/bold red]")
+            diagnostic_lines.extend(f"• {issue}" for issue in diagnostic.issues)
         
         if diagnostic.suggestions:
-            console.print("\n[bold yellow]Suggestions:[/bold yellow]")
-            for suggestion in diagnostic.suggestions:
-                console.print(f"• {suggestion}")
+            diagnostic_lines.append("\n[bold yellow]Suggestions:[/bold yellow]")
+            diagnostic_lines.extend(f"• {suggestion}" for suggestion in diagnostic.suggestions)
+        
+        if diagnostic_lines:
+            _print_lines(diagnostic_lines)
         
         # Display export info
         console.print("\n[bold]Export Information:[/bold]")
-        export_table = Table()
-        export_table.add_column("Metric", style="cyan")
-        export_table.add_column("Value", style="magenta")
-        
         export_info = report["export_info"]
-        export_table.add_row("Conversations", str(export_info["conversations_count"]))
-        export_table.add_row("Export Date", export_info["export_date"])
-        export_table.add_row("Format Version", export_info["format_version"])
-        
-        console.print(export_table)
+        console.print(_metrics_table(
+            None,
+            ("Metric", "Value"),
+            [(label, fmt(export_info[key])) for label, key, fmt in _EXPORT_INFO_ROWS]
+        ))
         
         # Display platform features
         if report.get("platform_features"):
@@ -912,45 +1049,50 @@ def compatibility(file, target):
             
             for feature in report["platform_features"]:
                 transfers = "✓ Yes" if feature["supported_in_target"] else "✗ No"
-                workaround = feature.get("workaround", "None available")[:50] + "..." if len(feature.get("workaround", "")) > 50 else feature.get("workaround", "None available")
+                workaround = feature.get("workaround") or "None available"
+                if len(workaround) > 50:
+                    workaround = workaround[:50] + "..."
                 features_table.add_row(feature["name"], transfers, workaround)
             
             console.print(features_table)
         
         # Display unsupported data summary
+        report_lines = []
         unsupported = report.get("unsupported_data", {})
         if unsupported.get("total_types", 0) > 0:
-            console.print(f"\n[bold yellow]Unsupported Data Types: {unsupported['total_types']}[/bold yellow]")
-            console.print(f"[dim]Total occurrences: {unsupported['total_occurrences']}[/dim]")
+            report_lines.append(f"\n[bold yellow]Unsupported Data Types: {unsupported['total_types']}[/bold yellow]")
+            report_lines.append(f"[dim]Total occurrences: {unsupported['total_occurrences']}[/dim]")
             
             if len(unsupported["entries"]) <= 5:
                 # Show all entries if few
-                for entry in unsupported["entries"]:
-                    console.print(f"• {entry['data_type']} ({entry['count']}x): {entry['reason']}")
+                shown_entries = unsupported["entries"]
             else:
                 # Show top 5 most frequent
-                sorted_entries = sorted(unsupported["entries"], key=lambda x: x["count"], reverse=True)
-                for entry in sorted_entries[:5]:
-                    console.print(f"• {entry['data_type']} ({entry['count']}x): {entry['reason']}")
-                console.print(f"[dim]... and {len(unsupported['entries']) - 5} more types[/dim]")
+                shown_entries = heapq.nlargest(5, unsupported["entries"], key=itemgetter("count"))
+            report_lines.extend(
+                f"• {entry['data_type']} ({entry['count']}x): {entry['reason']}" for entry in shown_entries
+            )
+            if len(unsupported["entries"]) > 5:
+                report_lines.append(f"[dim]... and {len(unsupported['entries']) - 5} more types[/dim]")
         
         # Display target platform status
         if target:
             platform_status = report.get("target_platform_status", {})
-            console.print(f"\n[bold]{target.title()} Platform Status:[/bold]")
+            report_lines.append(f"\n[bold]{target.title()} Platform Status:[/bold]")
             if platform_status.get("ready"):
-                console.print("[green]✓ Ready for export[/green]")
+                report_lines.append("[green]✓ Ready for export[/green]")
             else:
-                console.print("[red]✗ Setup required[/red]")
+                report_lines.append("[red]✗ Setup required[/red]")
                 details = platform_status.get("details", {})
-                for issue in details.get("issues", []):
-                    console.print(f"[red]• {issue}[/red]")
+                report_lines.extend(f"[red]• {issue}[/red]" for issue in details.get("issues", []))
         
         # Display recommendations
         if report.get("recommendations"):
-            console.print("\n[bold]Recommendations:[/bold]")
-            for rec in report["recommendations"][:5]:  # Show top 5
-                console.print(f"• {rec}")
+            report_lines.append("\n[bold]Recommendations:[/bold]")
+            report_lines.extend(f"• {rec}" for rec in report["recommendations"][:5])  # Show top 5
+        
+        if report_lines:
+            _print_lines(report_lines)
         
     except Exception as e:
         console.print(f"[red]✗ Error during analysis: {str(e)}[/red]")
@@ -961,61 +1103,7 @@ def compatibility(file, target):
 @cli.command()
 def examples():
     """Show detailed usage examples for common scenarios."""
-    console.print(Panel(
-        Text("Usage Examples", style="bold blue"),
-        subtitle="Common scenarios and commands"
-    ))
-    
-    console.print("\n[bold]1. Basic Export to Gemini:[/bold]")
-    console.print("[cyan]llm-context-export export -i chatgpt_export.zip -t gemini -o ./gemini_output[/cyan]")
-    console.print("[dim]Exports ChatGPT conversations to Gemini Saved Info format[/dim]")
-    
-    console.print("\n[bold]2. Interactive Export with Filtering:[/bold]")
-    console.print("[cyan]llm-context-export export -i chatgpt_export.zip -t ollama -o ./ollama_output --interactive[/cyan]")
-    console.print("[dim]Lets you choose which projects and topics to include[/dim]")
-    
-    console.print("\n[bold]3. Incremental Update:[/bold]")
-    console.print("[cyan]llm-context-export export -i new_export.zip -t gemini -o ./updated --update ./previous/context.json[/cyan]")
-    console.print("[dim]Adds only new conversations to existing context[/dim]")
-    
-    console.print("\n[bold]4. Generate Delta Package:[/bold]")
-    console.print("[cyan]llm-context-export delta -c new_export.zip -p ./old_context.json -o ./delta[/cyan]")
-    console.print("[dim]Creates package with only new information[/dim]")
-    
-    console.print("\n[bold]5. Validate Context Transfer:[/bold]")
-    console.print("[cyan]llm-context-export validate -c ./output/context.json -t gemini --interactive[/cyan]")
-    console.print("[dim]Generates test questions to verify successful transfer[/dim]")
-    
-    console.print("\n[bold]6. Compare Platforms:[/bold]")
-    console.print("[cyan]llm-context-export compare[/cyan]")
-    console.print("[dim]Shows detailed comparison between Gemini and Ollama[/dim]")
-    
-    console.print("\n[bold]7. Web Interface:[/bold]")
-    console.print("[cyan]llm-context-export web[/cyan]")
-    console.print("[dim]Starts local web interface for non-technical users[/dim]")
-    
-    console.print("\n[bold]8. Dry Run (Preview):[/bold]")
-    console.print("[cyan]llm-context-export export -i export.zip -t gemini -o ./output --dry-run[/cyan]")
-    console.print("[dim]Shows what would be exported without creating files[/dim]")
-    
-    console.print("\n[bold]9. Advanced Filtering:[/bold]")
-    console.print("[cyan]llm-context-export export -i export.zip -t ollama -o ./output \\[/cyan]")
-    console.print("[cyan]  --exclude-topics 'personal,private' --min-relevance 0.5[/cyan]")
-    console.print("[dim]Excludes specific topics and low-relevance projects[/dim]")
-    
-    console.print("\n[bold]10. Compatibility Check:[/bold]")
-    console.print("[cyan]llm-context-export compatibility -f export.zip -t ollama[/cyan]")
-    console.print("[dim]Analyzes export file and checks platform compatibility[/dim]")
-    
-    console.print("\n[bold]11. Platform Requirements:[/bold]")
-    console.print("[cyan]llm-context-export compatibility -t ollama[/cyan]")
-    console.print("[dim]Checks if Ollama is properly installed and configured[/dim]")
-    
-    console.print("\n[bold]Getting Help:[/bold]")
-    console.print("• [cyan]llm-context-export --help[/cyan] - Main help")
-    console.print("• [cyan]llm-context-export <command> --help[/cyan] - Command-specific help")
-    console.print("• [cyan]llm-context-export info --verbose[/cyan] - Detailed information")
-    console.print("• [cyan]llm-context-export compatibility --help[/cyan] - Compatibility analysis help")
+    console.print(_EXAMPLES_RENDERABLE)
 
 
 if __name__ == '__main__':
@@ -22,16 +22,29 @@ from .models import (
     ExportConfig,
 )
 
-from ..models.payment import (
-    PaymentIntent,
-    BetaUser,
-    UsageStats,
-    Feedback,
-)
+# Heavier components are imported on first attribute access (PEP 562) so that
+# lightweight CLI commands don't pay for the extractor and filter stacks.
+# Payment APIs live in llm_context_exporter.payments.
+_LAZY_IMPORTS = {
+    "ContextExtractor": ".extractor",
+    "FilterEngine": ".filter",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    import importlib
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
-from .extractor import ContextExtractor
-from .filter import FilterEngine
-from .payment import PaymentManager
 
 __all__ = [
     "ParsedExport",
@@ -48,11 +61,6 @@ __all__ = [
     "ValidationQuestion",
     "FilterConfig",
     "ExportConfig",
-    "PaymentIntent",
-    "BetaUser",
-    "UsageStats",
-    "Feedback",
     "ContextExtractor",
     "FilterEngine",
-    "PaymentManager",
 ]
\ No newline at end of file
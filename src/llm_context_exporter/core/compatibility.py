@@ -6,18 +6,59 @@ unknown versions, feature detection, and installation verification.
 """
 
 import os
+import socket
+import copy
+import bisect
+import functools
+import json
+import time
+import gzip
+import pickle
+import hashlib
 import subprocess
 import shutil
 import logging
-from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, NamedTuple, Optional, Any, Tuple
+from collections import OrderedDict
+from dataclasses import dataclass, replace
 from enum import Enum
+from urllib.parse import urlsplit
+
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - pyahocorasick is an optional speedup
+    ahocorasick = None
 
 from ..models.core import ParsedExport, UniversalContextPack
 
 
 logger = logging.getLogger(__name__)
 
+# Default location for on-disk caches shared by CLI invocations
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".llm-context-exporter", "cache")
+
+# How long cached Ollama probe results stay fresh (seconds)
+OLLAMA_VERSION_TTL = 24 * 60 * 60
+OLLAMA_SERVICE_TTL = 60
+
+# Where the Ollama daemon listens unless OLLAMA_HOST says otherwise
+OLLAMA_DEFAULT_HOST = "127.0.0.1"
+OLLAMA_DEFAULT_PORT = 11434
+
+# How long a manager reuses its own last Ollama verification (seconds)
+OLLAMA_RESULT_TTL = 30
+
+# Bytes read from the start of an export for format and structure sniffing
+HEADER_PEEK_SIZE = 4096
+
+# How long cached parse results are kept before being swept (seconds)
+PARSED_EXPORT_TTL = 7 * 24 * 60 * 60
+
+# Bumped whenever the layout of cached diagnostics or models changes, so
+# entries pickled by older versions are never loaded
+PARSED_EXPORT_CACHE_VERSION = 3
+
 
 class CompatibilityLevel(Enum):
     """Compatibility levels for format versions."""
@@ -27,7 +68,7 @@ class CompatibilityLevel(Enum):
     UNSUPPORTED = "unsupported"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FormatDiagnostic:
     """Diagnostic information about format detection."""
     detected_version: str
@@ -38,7 +79,7 @@ class FormatDiagnostic:
     fallback_version: Optional[str] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PlatformFeature:
     """Information about a platform-specific feature."""
     name: str
@@ -48,7 +89,7 @@ class PlatformFeature:
     workaround: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class UnsupportedDataLog:
     """Log entry for unsupported data types."""
     data_type: str
@@ -58,15 +99,327 @@ class UnsupportedDataLog:
     count: int = 1
 
 
+# Lowercase indicator phrases for each detection tag
+_FEATURE_INDICATORS: Dict[str, List[str]] = {
+    "web_browsing": [
+        "browsed", "searched the web", "found online", "according to my search",
+        "based on current information", "from the web"
+    ],
+    "tool_usage": ["using the", "plugin", "tool:", "executed code", "ran the"],
+    # Distinguishes code interpreter runs from plugin usage
+    "code_execution": ["code", "python", "execute"],
+    "image_generation": [
+        "generated an image", "created an image", "dall-e", "image generation"
+    ],
+    "file_upload": [
+        "uploaded file", "analyze this file", "document you provided",
+        "in the file you shared"
+    ],
+}
+
+# Every tag an indicator implies, including those of indicators it contains
+# (e.g. "executed code" also implies "code" and "execute")
+_INDICATOR_TAGS: Dict[str, frozenset] = {
+    indicator: frozenset(
+        tag for tag, candidates in _FEATURE_INDICATORS.items()
+        if any(candidate in indicator for candidate in candidates)
+    )
+    for indicators in _FEATURE_INDICATORS.values()
+    for indicator in indicators
+}
+
+# With pyahocorasick, all indicators are found in one linear pass over a
+# message. Each indicator carries every tag it implies, so an indicator
+# containing another (e.g. "executed code") needs no separate match.
+def _build_indicator_automaton():
+    """Build the indicator automaton, or return None without pyahocorasick."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for indicator, tags in _INDICATOR_TAGS.items():
+        automaton.add_word(indicator, tags)
+    automaton.make_automaton()
+    return automaton
+
+
+_INDICATOR_AUTOMATON = _build_indicator_automaton()
+
+
+def _detect_feature_tags(content: str) -> set:
+    """Find the indicator tags in lowercased message content."""
+    if _INDICATOR_AUTOMATON is not None:
+        tags = set()
+        for _, indicator_tags in _INDICATOR_AUTOMATON.iter(content):
+            tags |= indicator_tags
+        return tags
+    
+    tags = {
+        tag for tag, indicators in _FEATURE_INDICATORS.items()
+        if tag != "code_execution" and any(indicator in content for indicator in indicators)
+    }
+    # The code execution hint only matters for tool usage
+    if "tool_usage" in tags and any(
+        indicator in content for indicator in _FEATURE_INDICATORS["code_execution"]
+    ):
+        tags.add("code_execution")
+    return tags
+
+
+def _detect_feature_names(content: str) -> List[str]:
+    """
+    Detect platform features mentioned in message content.
+    
+    Args:
+        content: Message content, in any case
+        
+    Returns:
+        Names of the detected features, in report order
+    """
+    tags = _detect_feature_tags(content.lower())
+    if not tags:
+        return []
+    
+    names = []
+    if "web_browsing" in tags:
+        names.append("Web Browsing")
+    if "tool_usage" in tags:
+        # Could be plugin or code interpreter
+        names.append("Code Interpreter" if "code_execution" in tags else "Plugin Usage")
+    if "image_generation" in tags:
+        names.append("DALL-E Integration")
+    if "file_upload" in tags:
+        names.append("File Uploads")
+    return names
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_date_version(version: str) -> Optional[Tuple[int, int, int]]:
+    """Parse a date-style version like "2024-06-01" into (year, month, day), or None."""
+    if not isinstance(version, str) or version.count('-') != 2:
+        return None
+    try:
+        year, month, day = version.split('-')
+        return int(year), int(month), int(day)
+    except ValueError:
+        return None
+
+
+class _FallbackTable(NamedTuple):
+    """Supported versions of a parser, preprocessed for fallback lookups."""
+    known: Tuple[str, ...]
+    latest: Optional[str]
+    oldest: Optional[str]
+    dates: Tuple[Tuple[int, int, int], ...]
+    dated_versions: Tuple[str, ...]
+
+
+@functools.lru_cache(maxsize=None)
+def _fallback_table(supported_versions: Tuple[str, ...]) -> _FallbackTable:
+    """Build the fallback lookup table for a parser's supported versions."""
+    known = tuple(v for v in supported_versions if v != "unknown")
+    
+    # Keep the first version listed for each date, sorted by date for bisect
+    versions_by_date: Dict[Tuple[int, int, int], str] = {}
+    for version in known:
+        v_date = _parse_date_version(version)
+        if v_date is not None:
+            versions_by_date.setdefault(v_date, version)
+    dates = tuple(sorted(versions_by_date))
+    
+    return _FallbackTable(
+        known=known,
+        latest=max(known) if known else None,  # Assumes version strings are sortable
+        oldest=min(known) if known else None,
+        dates=dates,
+        dated_versions=tuple(versions_by_date[date] for date in dates)
+    )
+
+
+def _peek_header(file_path: str, length: int = HEADER_PEEK_SIZE,
+                 st: Optional[os.stat_result] = None) -> Tuple[bytes, int]:
+    """
+    Read the first bytes of a file with a single open.
+    
+    Args:
+        file_path: Path to the file
+        length: Maximum number of bytes to read
+        st: Stat result the caller already has, to avoid another stat call
+        
+    Returns:
+        Tuple of (header_bytes, file_size)
+    """
+    with open(file_path, 'rb') as f:
+        file_size = st.st_size if st is not None else os.fstat(f.fileno()).st_size
+        return f.read(length), file_size
+
+
+def _ollama_address() -> Tuple[str, int]:
+    """Resolve the Ollama daemon address from OLLAMA_HOST, falling back to the defaults."""
+    host = os.environ.get("OLLAMA_HOST", "").strip()
+    if not host:
+        return OLLAMA_DEFAULT_HOST, OLLAMA_DEFAULT_PORT
+    
+    try:
+        parts = urlsplit(host if "://" in host else f"//{host}")
+        hostname, port = parts.hostname, parts.port
+    except ValueError:
+        return OLLAMA_DEFAULT_HOST, OLLAMA_DEFAULT_PORT
+    
+    # Bind-all addresses are reached through the loopback interface
+    if not hostname or hostname in ("0.0.0.0", "::"):
+        hostname = OLLAMA_DEFAULT_HOST
+    return hostname, port or OLLAMA_DEFAULT_PORT
+
+
+class _StatusCache:
+    """
+    Small JSON file cache for Ollama probe results.
+    
+    Each section (e.g. "version", "service") is stored together with the key
+    it was computed for and the time it was written, so entries are ignored
+    once the binary path or host changes or the TTL has passed.
+    """
+    
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or os.path.join(CACHE_DIR, "ollama-status.json")
+    
+    def get(self, section: str, key: str, ttl: Optional[float]) -> Optional[Dict[str, Any]]:
+        """Return a cached section value, or None if missing or stale (ttl=None ignores age)."""
+        entry = self._read().get(section)
+        if not isinstance(entry, dict) or entry.get("key") != key:
+            return None
+        if ttl is not None and time.time() - entry.get("checked_at", 0) > ttl:
+            return None
+        return entry.get("value")
+    
+    def put(self, section: str, key: str, value: Dict[str, Any]) -> None:
+        """Store a section value, replacing the cache file atomically."""
+        data = self._read()
+        data[section] = {"key": key, "checked_at": time.time(), "value": value}
+        
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.debug(f"Could not write Ollama status cache: {e}")
+    
+    def _read(self) -> Dict[str, Any]:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+
+class ParsedExportCache:
+    """
+    On-disk cache of format diagnostics and parsed exports.
+    
+    Entries are keyed by the export's absolute path, size and modification
+    time, so replacing or editing the file invalidates them. They are stored
+    as gzip-compressed pickles readable only by the current user, and are
+    swept once they are older than PARSED_EXPORT_TTL since they hold
+    conversation content. For the same reason the CLI only uses this cache
+    when asked to with --cache.
+    """
+    
+    def __init__(self, cache_dir: Optional[str] = None):
+        self.cache_dir = cache_dir or os.path.join(CACHE_DIR, "parsed")
+    
+    def get(self, file_path: str, parser_name: str) -> Optional[Tuple["FormatDiagnostic", Any]]:
+        """Return the cached (diagnostic, parsed_export) for a file, or None on a miss."""
+        entry_path = self._entry_path(file_path, parser_name)
+        if entry_path is None:
+            return None
+        
+        try:
+            with gzip.open(entry_path, 'rb') as f:
+                diagnostic, parsed_export = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable parse cache entry {entry_path}: {e}")
+            return None
+        
+        return diagnostic, parsed_export
+    
+    def put(self, file_path: str, parser_name: str, diagnostic: "FormatDiagnostic",
+            parsed_export: Any) -> None:
+        """Store the diagnostic and parse result for a file, replacing any older entry."""
+        entry_path = self._entry_path(file_path, parser_name)
+        if entry_path is None:
+            return
+        
+        try:
+            os.makedirs(self.cache_dir, mode=0o700, exist_ok=True)
+            # makedirs leaves an existing directory's mode alone
+            os.chmod(self.cache_dir, 0o700)
+            self.sweep()
+            
+            tmp_path = f"{entry_path}.{os.getpid()}.tmp"
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with gzip.open(os.fdopen(fd, 'wb'), 'wb', compresslevel=1) as f:
+                pickle.dump((diagnostic, parsed_export), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, entry_path)
+        except (OSError, pickle.PicklingError) as e:
+            logger.debug(f"Could not write parse cache entry: {e}")
+    
+    def sweep(self) -> None:
+        """Remove cache entries older than PARSED_EXPORT_TTL."""
+        cutoff = time.time() - PARSED_EXPORT_TTL
+        try:
+            with os.scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    if entry.is_file() and entry.stat().st_mtime < cutoff:
+                        os.remove(entry.path)
+        except OSError as e:
+            logger.debug(f"Could not sweep parse cache: {e}")
+    
+    def _entry_path(self, file_path: str, parser_name: str) -> Optional[str]:
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        
+        key = (
+            f"{PARSED_EXPORT_CACHE_VERSION}|{parser_name}|{os.path.abspath(file_path)}|"
+            f"{stat.st_size}|{stat.st_mtime_ns}"
+        )
+        digest = hashlib.sha256(key.encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.pkl.gz")
+
+
 class CompatibilityManager:
     """
     Manages platform compatibility features including format detection,
     version fallback, and feature flagging.
     """
     
-    def __init__(self):
+    # Format diagnostics shared by all managers, keyed by parser class, the
+    # file's absolute path, mtime and size, and whether deep diagnostics are on
+    _FORMAT_CACHE_SIZE = 128
+    _format_cache: "OrderedDict[Tuple[Any, ...], FormatDiagnostic]" = OrderedDict()
+    
+    def __init__(self, cache_ollama_status: bool = False):
+        """
+        Initialize the compatibility manager.
+        
+        Args:
+            cache_ollama_status: Cache Ollama probe results on disk between runs
+        """
         self.unsupported_data_log: List[UnsupportedDataLog] = []
+        self._log_index: Dict[Tuple[str, str], UnsupportedDataLog] = {}
+        self._log_total_occurrences = 0
+        self._summary_cache: Optional[Dict[str, Any]] = None
         self.platform_features: Dict[str, List[PlatformFeature]] = {}
+        self._status_cache = _StatusCache() if cache_ollama_status else None
+        self._base_report_cache: Optional[Tuple[ParsedExport, List[PlatformFeature], Dict[str, Any]]] = None
+        self._feature_cache: Optional[Tuple[ParsedExport, List[PlatformFeature]]] = None
+        self._ollama_cache: Optional[Tuple[float, Tuple[bool, Dict[str, Any]]]] = None
         self._initialize_known_features()
     
     def _initialize_known_features(self):
@@ -111,6 +464,11 @@ class CompatibilityManager:
         ]
         
         self.platform_features["chatgpt"] = chatgpt_features
+        self._features_by_name: Dict[str, PlatformFeature] = {
+            feature.name: feature
+            for features in self.platform_features.values()
+            for feature in features
+        }
     
     def detect_format_with_diagnostics(self, file_path: str, parser_class) -> FormatDiagnostic:
         """
@@ -123,9 +481,48 @@ class CompatibilityManager:
         Returns:
             FormatDiagnostic with detailed information
         """
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return self._detect_format(file_path, parser_class)
+        
+        cache_key = (
+            parser_class, os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size,
+            bool(os.getenv("LLM_CTX_DEEP_DIAG"))
+        )
+        diagnostic = self._format_cache.get(cache_key)
+        if diagnostic is None:
+            diagnostic = self._detect_format(file_path, parser_class, stat)
+            self._format_cache[cache_key] = diagnostic
+            if len(self._format_cache) > self._FORMAT_CACHE_SIZE:
+                self._format_cache.popitem(last=False)
+        else:
+            self._format_cache.move_to_end(cache_key)
+        
+        # Hand out copies so callers can't modify the cached lists
+        return replace(diagnostic, issues=list(diagnostic.issues), suggestions=list(diagnostic.suggestions))
+    
+    @classmethod
+    def clear_format_cache(cls) -> None:
+        """Forget all memoized format diagnostics."""
+        cls._format_cache.clear()
+    
+    def _detect_format(self, file_path: str, parser_class,
+                       st: Optional[os.stat_result] = None) -> FormatDiagnostic:
+        """Run format detection and file structure analysis without the cache."""
         try:
             parser = parser_class()
-            detected_version = parser.detect_format_version(file_path)
+            
+            # Read the header once and share it between version detection
+            # and file structure analysis
+            try:
+                header, file_size = _peek_header(file_path, st=st)
+            except OSError as e:
+                header, file_size, header_error = None, 0, e
+            
+            detected_version = parser.detect_format_version_from_header(header) if header is not None else None
+            if detected_version is None:
+                detected_version = parser.detect_format_version(file_path)
             supported_versions = parser.get_supported_versions()
             
             # Determine compatibility level
@@ -165,8 +562,15 @@ class CompatibilityManager:
                 suggestions.append("This export format is too old or too new")
                 suggestions.append("Try exporting again or use a different export format")
             
-            # Add file structure diagnostics
-            structure_issues = self._analyze_file_structure(file_path)
+            # Add file structure diagnostics. A fully supported version was
+            # recognized from the content, so only the size check applies
+            # unless deep diagnostics are requested.
+            if header is None:
+                structure_issues = [f"Could not analyze file structure: {str(header_error)}"]
+            elif compatibility_level == CompatibilityLevel.FULLY_SUPPORTED and not os.getenv("LLM_CTX_DEEP_DIAG"):
+                structure_issues = self._analyze_file_size(file_size)
+            else:
+                structure_issues = self._analyze_header_structure(file_path, header, file_size)
             issues.extend(structure_issues)
             
             return FormatDiagnostic(
@@ -193,94 +597,80 @@ class CompatibilityManager:
     
     def _find_fallback_version(self, detected_version: str, supported_versions: List[str]) -> Optional[str]:
         """Find a compatible fallback version for backward compatibility."""
+        if detected_version != "unknown" and detected_version in supported_versions:
+            return detected_version
+        
+        table = _fallback_table(tuple(supported_versions))
+        
         if detected_version == "unknown":
             # For unknown versions, try the most recent supported version
-            if supported_versions:
-                # Remove "unknown" from the list and get the latest
-                known_versions = [v for v in supported_versions if v != "unknown"]
-                if known_versions:
-                    return max(known_versions)  # Assumes version strings are sortable
+            if table.latest is not None:
+                return table.latest
         
         # For specific versions, try to find the closest older supported version
         # This is a simple heuristic - could be improved with proper version parsing
-        try:
-            if detected_version.count('-') == 2:  # Date format like "2024-06-01"
-                year, month, day = detected_version.split('-')
-                detected_date = (int(year), int(month), int(day))
-                
-                best_fallback = None
-                best_date = None
-                
-                for version in supported_versions:
-                    if version == "unknown":
-                        continue
-                    try:
-                        v_year, v_month, v_day = version.split('-')
-                        v_date = (int(v_year), int(v_month), int(v_day))
-                        
-                        # Find the newest version that's older than or equal to detected
-                        if v_date <= detected_date:
-                            if best_date is None or v_date > best_date:
-                                best_fallback = version
-                                best_date = v_date
-                    except (ValueError, AttributeError):
-                        continue
-                
-                # If no older version found, try the oldest supported version
-                if best_fallback is None:
-                    known_versions = [v for v in supported_versions if v != "unknown"]
-                    if known_versions:
-                        return min(known_versions)
-                
-                return best_fallback
-        except (ValueError, AttributeError):
-            pass
+        detected_date = _parse_date_version(detected_version)
+        if detected_date is not None:
+            # Find the newest version that's older than or equal to detected
+            index = bisect.bisect_right(table.dates, detected_date) - 1
+            if index >= 0:
+                return table.dated_versions[index]
+            
+            # If no older version found, try the oldest supported version
+            return table.oldest
         
         # If no smart fallback found, return the first supported version
-        known_versions = [v for v in supported_versions if v != "unknown"]
-        return known_versions[0] if known_versions else None
+        return table.known[0] if table.known else None
     
-    def _analyze_file_structure(self, file_path: str) -> List[str]:
-        """Analyze file structure for diagnostic information."""
-        issues = []
-        
+    def _analyze_file_structure(self, file_path: str, st: Optional[os.stat_result] = None,
+                                header: Optional[bytes] = None) -> List[str]:
+        """Analyze file structure for diagnostic information, reusing a known stat and header."""
         try:
-            file_size = os.path.getsize(file_path)
-            
-            # Check file size
-            if file_size == 0:
-                issues.append("File is empty")
-            elif file_size > 1024 * 1024 * 1024:  # 1GB
-                issues.append("File is very large (>1GB) - processing may be slow")
-            
-            # Check file extension
-            _, ext = os.path.splitext(file_path.lower())
-            if ext not in ['.json', '.zip']:
-                issues.append(f"Unexpected file extension: {ext}")
-            
-            # Try to peek at file content
-            with open(file_path, 'rb') as f:
-                header = f.read(100)
-                
-                # Check for ZIP signature
-                if header.startswith(b'PK'):
-                    if ext != '.zip':
-                        issues.append("File appears to be ZIP but has wrong extension")
-                
-                # Check for JSON start
-                elif header.strip().startswith(b'{') or header.strip().startswith(b'['):
-                    if ext != '.json':
-                        issues.append("File appears to be JSON but has wrong extension")
-                
-                # Check for binary data
-                elif b'\x00' in header:
-                    issues.append("File contains binary data - may be corrupted")
-                
+            if header is None:
+                header, file_size = _peek_header(file_path, st=st)
+            else:
+                file_size = st.st_size if st is not None else os.path.getsize(file_path)
         except Exception as e:
-            issues.append(f"Could not analyze file structure: {str(e)}")
+            return [f"Could not analyze file structure: {str(e)}"]
+        
+        return self._analyze_header_structure(file_path, header, file_size)
+    
+    def _analyze_header_structure(self, file_path: str, header: bytes, file_size: int) -> List[str]:
+        """Analyze file size, extension and an already-read header for diagnostic information."""
+        issues = self._analyze_file_size(file_size)
+        
+        # Check file extension
+        _, ext = os.path.splitext(file_path.lower())
+        if ext not in ['.json', '.zip']:
+            issues.append(f"Unexpected file extension: {ext}")
+        
+        # Peek at the first bytes of the file content
+        header = header[:100]
+        
+        # Check for ZIP signature
+        if header.startswith(b'PK'):
+            if ext != '.zip':
+                issues.append("File appears to be ZIP but has wrong extension")
+        
+        # Check for JSON start
+        elif header.lstrip().startswith((b'{', b'[')):
+            if ext != '.json':
+                issues.append("File appears to be JSON but has wrong extension")
+        
+        # Check for binary data
+        elif b'\x00' in header:
+            issues.append("File contains binary data - may be corrupted")
         
         return issues
     
+    def _analyze_file_size(self, file_size: int) -> List[str]:
+        """Check the file size for diagnostic information."""
+        if file_size == 0:
+            return ["File is empty"]
+        elif file_size > 1024 * 1024 * 1024:  # 1GB
+            return ["File is very large (>1GB) - processing may be slow"]
+        return []
+    
     def attempt_fallback_parsing(self, file_path: str, parser_class, fallback_version: str) -> Optional[ParsedExport]:
         """
         Attempt to parse with fallback version compatibility.
@@ -294,19 +684,10 @@ class CompatibilityManager:
             ParsedExport if successful, None if failed
         """
         try:
-            parser = parser_class()
-            
-            # Temporarily override version detection to use fallback
-            original_detect = parser.detect_format_version
-            parser.detect_format_version = lambda path: fallback_version
-            
-            try:
-                result = parser.parse_export(file_path)
-                logger.info(f"Successfully parsed with fallback version {fallback_version}")
-                return result
-            finally:
-                # Restore original method
-                parser.detect_format_version = original_detect
+            parser = parser_class(force_version=fallback_version)
+            result = parser.parse_export(file_path)
+            logger.info(f"Successfully parsed with fallback version {fallback_version}")
+            return result
                 
         except Exception as e:
             logger.warning(f"Fallback parsing with version {fallback_version} failed: {str(e)}")
@@ -322,58 +703,31 @@ class CompatibilityManager:
         Returns:
             List of identified platform features
         """
+        # Repeated reports for the same export reuse the previous scan
+        cached = self._feature_cache
+        if cached is not None and cached[0] is parsed_export:
+            return list(cached[1])
+        
+        features_by_name = self._features_by_name
         identified_features = []
+        seen_names = set()
         
-        # Analyze conversations for platform-specific features
+        # Analyze conversations for platform-specific features with a single
+        # indicator scan per message, stopping once every feature is found
         for conversation in parsed_export.conversations:
+            if len(seen_names) == len(features_by_name):
+                break
             for message in conversation.messages:
-                content = message.content.lower()
-                
-                # Check for web browsing indicators
-                if any(indicator in content for indicator in [
-                    "browsed", "searched the web", "found online", "according to my search",
-                    "based on current information", "from the web"
-                ]):
-                    feature = next((f for f in self.platform_features["chatgpt"] 
-                                  if f.name == "Web Browsing"), None)
-                    if feature and feature not in identified_features:
-                        identified_features.append(feature)
-                
-                # Check for plugin usage
-                if any(indicator in content for indicator in [
-                    "using the", "plugin", "tool:", "executed code", "ran the"
-                ]):
-                    # Could be plugin or code interpreter
-                    if "code" in content or "python" in content or "execute" in content:
-                        feature = next((f for f in self.platform_features["chatgpt"] 
-                                      if f.name == "Code Interpreter"), None)
-                    else:
-                        feature = next((f for f in self.platform_features["chatgpt"] 
-                                      if f.name == "Plugin Usage"), None)
-                    
-                    if feature and feature not in identified_features:
-                        identified_features.append(feature)
-                
-                # Check for image generation
-                if any(indicator in content for indicator in [
-                    "generated an image", "created an image", "dall-e", "image generation"
-                ]):
-                    feature = next((f for f in self.platform_features["chatgpt"] 
-                                  if f.name == "DALL-E Integration"), None)
-                    if feature and feature not in identified_features:
-                        identified_features.append(feature)
-                
-                # Check for file uploads
-                if any(indicator in content for indicator in [
-                    "uploaded file", "analyze this file", "document you provided",
-                    "in the file you shared"
-                ]):
-                    feature = next((f for f in self.platform_features["chatgpt"] 
-                                  if f.name == "File Uploads"), None)
-                    if feature and feature not in identified_features:
+                for name in _detect_feature_names(message.content):
+                    if name in seen_names:
+                        continue
+                    feature = features_by_name.get(name)
+                    if feature:
+                        seen_names.add(name)
                         identified_features.append(feature)
         
-        return identified_features
+        self._feature_cache = (parsed_export, identified_features)
+        return list(identified_features)
     
     def log_unsupported_data(self, data_type: str, location: str, reason: str, 
                            sample_data: Optional[str] = None):
@@ -387,11 +741,8 @@ class CompatibilityManager:
             sample_data: Optional sample for debugging (will be truncated)
         """
         # Check if we already have a log entry for this type/location
-        existing_entry = None
-        for entry in self.unsupported_data_log:
-            if entry.data_type == data_type and entry.location == location:
-                existing_entry = entry
-                break
+        key = (data_type, location)
+        existing_entry = self._log_index.get(key)
         
         if existing_entry:
             existing_entry.count += 1
@@ -401,12 +752,17 @@ class CompatibilityManager:
             if sample_data:
                 truncated_sample = sample_data[:100] + "..." if len(sample_data) > 100 else sample_data
             
-            self.unsupported_data_log.append(UnsupportedDataLog(
+            entry = UnsupportedDataLog(
                 data_type=data_type,
                 location=location,
                 reason=reason,
                 sample_data=truncated_sample
-            ))
+            )
+            self.unsupported_data_log.append(entry)
+            self._log_index[key] = entry
+        
+        self._log_total_occurrences += 1
+        self._summary_cache = None
         
         logger.warning(f"Unsupported data type '{data_type}' at {location}: {reason}")
     
@@ -415,9 +771,18 @@ class CompatibilityManager:
         if not self.unsupported_data_log:
             return {"total_types": 0, "entries": []}
         
+        # Rebuilt only after log_unsupported_data records something new;
+        # callers get their own copy so they may modify it freely
+        if self._summary_cache is None:
+            self._summary_cache = self._build_unsupported_data_summary()
+        summary = self._summary_cache
+        return {**summary, "entries": [dict(entry) for entry in summary["entries"]]}
+    
+    def _build_unsupported_data_summary(self) -> Dict[str, Any]:
+        """Serialize the unsupported data log."""
         return {
             "total_types": len(self.unsupported_data_log),
-            "total_occurrences": sum(entry.count for entry in self.unsupported_data_log),
+            "total_occurrences": self._log_total_occurrences,
             "entries": [
                 {
                     "data_type": entry.data_type,
@@ -434,9 +799,27 @@ class CompatibilityManager:
         """
         Verify Ollama installation and provide guidance if not found.
         
+        The result is reused for OLLAMA_RESULT_TTL seconds by this manager.
+        
         Returns:
             Tuple of (is_installed, status_info)
         """
+        if self._ollama_cache is not None:
+            checked_at, result = self._ollama_cache
+            if time.monotonic() - checked_at < OLLAMA_RESULT_TTL:
+                return copy.deepcopy(result)
+        
+        result = self._verify_ollama_installation()
+        # Keep a private copy so callers can modify the returned status freely
+        self._ollama_cache = (time.monotonic(), copy.deepcopy(result))
+        return result
+    
+    def invalidate_ollama_cache(self) -> None:
+        """Forget the last Ollama verification so the next call probes again."""
+        self._ollama_cache = None
+    
+    def _verify_ollama_installation(self) -> Tuple[bool, Dict[str, Any]]:
+        """Probe the Ollama installation, using the on-disk status cache if enabled."""
         status_info = {
             "ollama_found": False,
             "ollama_running": False,
@@ -447,7 +830,8 @@ class CompatibilityManager:
         }
         
         # Check if Ollama binary is available
-        if shutil.which("ollama") is None:
+        binary_path = shutil.which("ollama")
+        if binary_path is None:
             status_info["issues"].append("Ollama not found in PATH")
             status_info["suggestions"].extend([
                 "Visit https://ollama.ai to download and install Ollama",
@@ -457,35 +841,86 @@ class CompatibilityManager:
             return False, status_info
         
         status_info["ollama_found"] = True
+        cache_key = f"{binary_path}|{os.environ.get('OLLAMA_HOST', '')}"
+        
+        cached_version = self._get_cached_status("version", cache_key, OLLAMA_VERSION_TTL)
+        service = self._get_cached_status("service", cache_key, OLLAMA_SERVICE_TTL)
+        
+        # A refused connection answers "not running" without spawning
+        # `ollama list`; the version is still probed to help debug the install
+        service_issues = []
+        service_suggestions = []
+        if service is None and not self._probe_ollama_daemon():
+            service = {"running": False, "qwen_available": False}
+            self._store_cached_status("service", cache_key, service)
+        
+        # Run the probes that are not answered by the cache concurrently, so
+        # the slowest probe bounds the wait rather than their sum
+        probes = {}
+        if cached_version is None:
+            probes["version"] = (["ollama", "--version"], 10)
+        if service is None:
+            probes["service"] = (["ollama", "list"], 3)
+        
+        futures = {}
+        if probes:
+            with ThreadPoolExecutor(max_workers=len(probes)) as executor:
+                for name, (command, timeout) in probes.items():
+                    futures[name] = executor.submit(
+                        subprocess.run, command, capture_output=True, text=True, timeout=timeout
+                    )
+        
+        if service is None:
+            try:
+                result = futures["service"].result()
+                running = result.returncode == 0
+                service = {
+                    "running": running,
+                    "qwen_available": running and "qwen" in result.stdout.lower()
+                }
+                self._store_cached_status("service", cache_key, service)
+            except subprocess.TimeoutExpired:
+                service = self._get_cached_status("service", cache_key, None)
+                if service is None:
+                    service_issues.append("Ollama command timed out")
+                    service_suggestions.append("Ollama may be starting up - try again in a moment")
+            except (subprocess.CalledProcessError, FileNotFoundError):
+                service = self._get_cached_status("service", cache_key, None)
+                if service is None:
+                    service_issues.append("Could not communicate with Ollama")
+                    service_suggestions.append("Make sure Ollama is properly installed and running")
         
         # Check Ollama version
-        try:
-            result = subprocess.run(
-                ["ollama", "--version"], 
-                capture_output=True, 
-                text=True, 
-                timeout=10
-            )
-            if result.returncode == 0:
-                status_info["version"] = result.stdout.strip()
-            else:
-                status_info["issues"].append("Could not get Ollama version")
-        except (subprocess.TimeoutExpired, subprocess.CalledProcessError, FileNotFoundError):
-            status_info["issues"].append("Ollama command failed")
+        if cached_version is not None:
+            status_info["version"] = cached_version["version"]
+        elif "version" in futures:
+            try:
+                result = futures["version"].result()
+                if result.returncode == 0:
+                    status_info["version"] = result.stdout.strip()
+                    self._store_cached_status("version", cache_key, {"version": status_info["version"]})
+                else:
+                    status_info["issues"].append("Could not get Ollama version")
+            except (subprocess.TimeoutExpired, subprocess.CalledProcessError, FileNotFoundError):
+                stale_version = self._get_cached_status("version", cache_key, None)
+                if stale_version is not None:
+                    status_info["version"] = stale_version["version"]
+                else:
+                    status_info["issues"].append("Ollama command failed")
+        else:
+            stale_version = self._get_cached_status("version", cache_key, None)
+            if stale_version is not None:
+                status_info["version"] = stale_version["version"]
         
-        # Check if Ollama is running by trying to list models
-        try:
-            result = subprocess.run(
-                ["ollama", "list"], 
-                capture_output=True, 
-                text=True, 
-                timeout=15
-            )
-            if result.returncode == 0:
+        status_info["issues"].extend(service_issues)
+        status_info["suggestions"].extend(service_suggestions)
+        
+        if service is not None:
+            if service["running"]:
                 status_info["ollama_running"] = True
                 
                 # Check if Qwen model is available
-                if "qwen" in result.stdout.lower():
+                if service["qwen_available"]:
                     status_info["qwen_available"] = True
                 else:
                     status_info["issues"].append("Qwen model not found")
@@ -496,12 +931,6 @@ class CompatibilityManager:
                     "Start Ollama service: ollama serve",
                     "Or run Ollama in the background"
                 ])
-        except subprocess.TimeoutExpired:
-            status_info["issues"].append("Ollama command timed out")
-            status_info["suggestions"].append("Ollama may be starting up - try again in a moment")
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            status_info["issues"].append("Could not communicate with Ollama")
-            status_info["suggestions"].append("Make sure Ollama is properly installed and running")
         
         # Determine overall status
         is_ready = (status_info["ollama_found"] and 
@@ -513,6 +942,25 @@ class CompatibilityManager:
         
         return is_ready, status_info
     
+    def _probe_ollama_daemon(self) -> bool:
+        """Check whether the Ollama daemon accepts TCP connections."""
+        try:
+            with socket.create_connection(_ollama_address(), timeout=0.5):
+                return True
+        except OSError:
+            return False
+    
+    def _get_cached_status(self, section: str, key: str, ttl: Optional[float]) -> Optional[Dict[str, Any]]:
+        """Read a cached Ollama probe result if status caching is enabled."""
+        if self._status_cache is None:
+            return None
+        return self._status_cache.get(section, key, ttl)
+    
+    def _store_cached_status(self, section: str, key: str, value: Dict[str, Any]) -> None:
+        """Record an Ollama probe result if status caching is enabled."""
+        if self._status_cache is not None:
+            self._status_cache.put(section, key, value)
+    
     def generate_compatibility_report(self, parsed_export: ParsedExport, 
                                     target_platform: str) -> Dict[str, Any]:
         """
@@ -525,31 +973,57 @@ class CompatibilityManager:
         Returns:
             Compatibility report dictionary
         """
-        # Identify platform features
-        platform_features = self.identify_platform_features(parsed_export)
+        platform_features, base_report = self._build_base_report(parsed_export)
+        unsupported_summary = self.get_unsupported_data_summary()
+        target_status = self._build_target_status(target_platform)
         
-        # Get unsupported data summary
+        return {
+            **base_report,
+            "unsupported_data": unsupported_summary,
+            "target_platform_status": target_status,
+            "recommendations": self._generate_recommendations(
+                platform_features, unsupported_summary, target_status
+            )
+        }
+    
+    def generate_multi_platform_report(self, parsed_export: ParsedExport,
+                                       target_platforms: List[str]) -> Dict[str, Any]:
+        """
+        Generate one compatibility report covering several target platforms.
+        
+        The platform-agnostic analysis runs once; only the target status and
+        its recommendations are computed per platform.
+        
+        Args:
+            parsed_export: Parsed export data
+            target_platforms: Target platforms to check (gemini, ollama)
+            
+        Returns:
+            Compatibility report dictionary with a "<platform>_status" entry per target
+        """
+        platform_features, base_report = self._build_base_report(parsed_export)
         unsupported_summary = self.get_unsupported_data_summary()
         
-        # Check target platform requirements
-        target_status = {}
-        if target_platform == "ollama":
-            is_ready, ollama_status = self.verify_ollama_installation()
-            target_status = {
-                "platform": "ollama",
-                "ready": is_ready,
-                "details": ollama_status
-            }
-        elif target_platform == "gemini":
-            target_status = {
-                "platform": "gemini",
-                "ready": True,  # Gemini doesn't require local installation
-                "details": {
-                    "notes": ["Gemini is cloud-based and doesn't require local setup"]
-                }
-            }
+        report = {**base_report, "unsupported_data": unsupported_summary}
+        recommendations = []
+        for target_platform in target_platforms:
+            target_status = self._build_target_status(target_platform)
+            report[f"{target_platform}_status"] = target_status
+            recommendations.extend(self._generate_recommendations(
+                platform_features, unsupported_summary, target_status
+            ))
+        report["recommendations"] = recommendations
         
-        return {
+        return report
+    
+    def _build_base_report(self, parsed_export: ParsedExport) -> Tuple[List[PlatformFeature], Dict[str, Any]]:
+        """Build the target-independent part of a report, reusing it for the same export."""
+        cached = self._base_report_cache
+        if cached is not None and cached[0] is parsed_export:
+            return cached[1], self._copy_base_report(cached[2])
+        
+        platform_features = self.identify_platform_features(parsed_export)
+        base_report = {
             "export_info": {
                 "format_version": parsed_export.format_version,
                 "conversations_count": len(parsed_export.conversations),
@@ -564,14 +1038,38 @@ class CompatibilityManager:
                     "workaround": feature.workaround
                 }
                 for feature in platform_features
-            ],
-            "unsupported_data": unsupported_summary,
-            "target_platform_status": target_status,
-            "recommendations": self._generate_recommendations(
-                platform_features, unsupported_summary, target_status
-            )
+            ]
+        }
+        
+        self._base_report_cache = (parsed_export, platform_features, base_report)
+        return platform_features, self._copy_base_report(base_report)
+    
+    def _copy_base_report(self, base_report: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy a cached base report so callers may modify their report freely."""
+        return {
+            "export_info": dict(base_report["export_info"]),
+            "platform_features": [dict(feature) for feature in base_report["platform_features"]]
         }
     
+    def _build_target_status(self, target_platform: str) -> Dict[str, Any]:
+        """Check the requirements of a single target platform."""
+        if target_platform == "ollama":
+            is_ready, ollama_status = self.verify_ollama_installation()
+            return {
+                "platform": "ollama",
+                "ready": is_ready,
+                "details": ollama_status
+            }
+        elif target_platform == "gemini":
+            return {
+                "platform": "gemini",
+                "ready": True,  # Gemini doesn't require local installation
+                "details": {
+                    "notes": ["Gemini is cloud-based and doesn't require local setup"]
+                }
+            }
+        return {}
+    
     def _generate_recommendations(self, platform_features: List[PlatformFeature], 
                                 unsupported_summary: Dict[str, Any], 
                                 target_status: Dict[str, Any]) -> List[str]:
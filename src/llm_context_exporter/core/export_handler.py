@@ -5,12 +5,18 @@ This module coordinates parsing, extraction, filtering, formatting,
 and incremental updates to provide a complete export workflow.
 """
 
+import logging
 import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import replace
+from functools import reduce
+from itertools import chain
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable, List, Tuple
 from datetime import datetime
 
 from ..parsers.chatgpt import ChatGPTParser
+from . import serialization
 from .extractor import ContextExtractor
 from .filter import FilterEngine
 from .incremental import IncrementalUpdater
@@ -22,10 +28,14 @@ from .models import (
     FilterConfig,
     UniversalContextPack,
     ParsedExport,
+    Conversation,
+    Message,
     GeminiOutput,
     OllamaOutput
 )
 
+logger = logging.getLogger(__name__)
+
 
 class ExportHandler:
     """
@@ -49,6 +59,14 @@ class ExportHandler:
         self.gemini_formatter = GeminiFormatter()
         self.ollama_formatter = OllamaFormatter()
         self.validation_generator = ValidationGenerator()
+        
+        # Most recent parse, keyed by absolute path, mtime and size, so that
+        # get_filterable_items followed by export parses the file only once
+        self._parsed_cache: Optional[Tuple[Tuple[str, int, int], ParsedExport]] = None
+        
+        # Context extracted from the cached parse. It is only reused while
+        # that exact ParsedExport is still the cached one.
+        self._context_cache: Optional[Tuple[ParsedExport, UniversalContextPack]] = None
     
     def export(self, config: ExportConfig) -> Dict[str, Any]:
         """
@@ -69,70 +87,122 @@ class ExportHandler:
         
         try:
             # Step 1: Parse input file
-            print(f"Parsing ChatGPT export: {config.input_path}")
-            parsed_export = self.parser.parse_export(config.input_path)
+            logger.info("Parsing ChatGPT export: %s", config.input_path)
+            parsed_export = self._parse_export(config.input_path)
             results["metadata"]["conversations_parsed"] = len(parsed_export.conversations)
             
             # Step 2: Handle incremental updates if requested
             if config.incremental and config.previous_context_path:
-                print("Processing incremental update...")
+                logger.info("Processing incremental update...")
                 context_pack = self._handle_incremental_update(parsed_export, config)
             else:
-                print("Extracting context from conversations...")
-                context_pack = self.extractor.extract_context(parsed_export.conversations)
+                logger.info("Extracting context from conversations...")
+                context_pack = self._extract_parsed_context(parsed_export, config.workers)
             
             results["metadata"]["projects_extracted"] = len(context_pack.projects)
             results["metadata"]["languages_found"] = len(context_pack.technical_context.languages)
             
             # Step 3: Apply filters if specified
             if config.filters:
-                print("Applying filters...")
+                logger.info("Applying filters...")
                 context_pack = self.filter_engine.apply_filters(context_pack, config.filters)
                 results["metadata"]["filtered"] = True
             
-            # Step 4: Format for target platform
-            print(f"Formatting for {config.target_platform}...")
+            # Step 4: Format for target platform. The output directory is
+            # created once here and shared by every save step below.
+            output_dir = Path(config.output_path)
+            output_dir.mkdir(parents=True, exist_ok=True)
+            
+            logger.info("Formatting for %s...", config.target_platform)
             if config.target_platform == "gemini":
                 output = self.gemini_formatter.format_context(context_pack)
-                output_files = self._save_gemini_output(output, config.output_path)
+                save_output = self._save_gemini_output
             elif config.target_platform == "ollama":
                 base_model = config.base_model or "qwen"
                 output = self.ollama_formatter.format_context(context_pack, base_model)
-                output_files = self._save_ollama_output(output, config.output_path)
+                save_output = self._save_ollama_output
             else:
                 raise ValueError(f"Unsupported target platform: {config.target_platform}")
             
-            results["output_files"] = output_files
-            
             # Step 5: Generate validation tests
-            print("Generating validation tests...")
+            logger.info("Generating validation tests...")
             validation_suite = self.validation_generator.generate_tests(
                 context_pack, 
                 config.target_platform
             )
-            validation_file = self._save_validation_tests(validation_suite, config.output_path)
-            results["output_files"].append(validation_file)
             
-            # Step 6: Save context pack for future incremental updates
-            context_file = os.path.join(config.output_path, "context_pack.json")
-            self.incremental_updater.save_context_pack(context_pack, context_file)
-            results["output_files"].append(context_file)
+            # The parsed export holds the raw conversations, so it is only
+            # kept for users already doing incremental updates, and never
+            # with conversations they excluded
+            parsed_export_file = None
+            if config.incremental:
+                parsed_export_file = str(output_dir / "parsed_export.ndjson")
+                if config.filters:
+                    parsed_export = replace(
+                        parsed_export,
+                        conversations=self.filter_engine.apply_conversation_exclusions(
+                            parsed_export.conversations, config.filters
+                        )
+                    )
             
-            # Step 7: Update version history
-            self.incremental_updater.save_version_history(context_pack, config.output_path)
+            # Steps 6-7: The platform output, validation tests, context pack
+            # and parsed export (for future incremental updates) and version
+            # history are separate files, so they are written concurrently
+            context_file = str(output_dir / "context_pack.json")
+            with ThreadPoolExecutor(max_workers=5) as executor:
+                output_future = executor.submit(save_output, output, output_dir)
+                validation_future = executor.submit(
+                    self._save_validation_tests, validation_suite, output_dir
+                )
+                context_future = executor.submit(
+                    self.incremental_updater.save_context_pack, context_pack, context_file
+                )
+                parsed_export_future = None
+                if parsed_export_file:
+                    parsed_export_future = executor.submit(
+                        self.incremental_updater.save_parsed_export, parsed_export, parsed_export_file
+                    )
+                history_future = executor.submit(
+                    self.incremental_updater.save_version_history, context_pack, config.output_path
+                )
+                
+                results["output_files"] = output_future.result()
+                results["output_files"].append(validation_future.result())
+                context_future.result()
+                results["output_files"].append(context_file)
+                if parsed_export_future:
+                    parsed_export_future.result()
+                    results["output_files"].append(parsed_export_file)
+                history_future.result()
             
             results["success"] = True
             results["metadata"]["export_completed"] = datetime.now().isoformat()
             
-            print(f"Export completed successfully! Files saved to: {config.output_path}")
+            logger.info("Export completed successfully! Files saved to: %s", config.output_path)
             
         except Exception as e:
             error_msg = f"Export failed: {str(e)}"
-            print(f"Error: {error_msg}")
+            logger.error("%s", error_msg)
             results["errors"].append(error_msg)
         
         return results
     
+    def _parse_export(self, input_path: str) -> ParsedExport:
+        """Parse an export, reusing the previous result if the file is unchanged."""
+        try:
+            stat = os.stat(input_path)
+        except OSError:
+            # Let the parser report the missing file
+            return self.parser.parse_export(input_path)
+        
+        key = (os.path.abspath(input_path), stat.st_mtime_ns, stat.st_size)
+        if self._parsed_cache is not None and self._parsed_cache[0] == key:
+            return self._parsed_cache[1]
+        
+        parsed_export = self.parser.parse_export(input_path)
+        self._parsed_cache = (key, parsed_export)
+        return parsed_export
+    
     def _handle_incremental_update(
         self, 
         current_export: ParsedExport, 
@@ -145,60 +215,53 @@ class ExportHandler:
         )
         
         if not previous_context:
-            print("Warning: Could not load previous context, performing full export")
-            return self.extractor.extract_context(current_export.conversations)
+            logger.warning("Could not load previous context, performing full export")
+            return self._extract_context(current_export.conversations, config.workers)
         
-        # Load previous export if available
-        previous_export_path = os.path.join(
-            os.path.dirname(config.previous_context_path),
-            "parsed_export.json"
-        )
+        # Load previous export if available, preferring the streamable
+        # newline-delimited form written by save_parsed_export
+        previous_dir = os.path.dirname(config.previous_context_path)
+        previous_export_path = os.path.join(previous_dir, "parsed_export.ndjson")
+        if not os.path.exists(previous_export_path):
+            previous_export_path = os.path.join(previous_dir, "parsed_export.json")
         
         if os.path.exists(previous_export_path):
             # Detect new conversations
             try:
-                import json
-                with open(previous_export_path, 'r') as f:
-                    prev_data = json.load(f)
+                prev_info, prev_records = self._open_previous_export(previous_export_path)
                 
-                # Reconstruct previous export (simplified)
-                from .models import Conversation, Message
+                # Only conversations that are still in the current export and
+                # look unchanged need a full comparison. Deleted ones can't
+                # affect detection, and ones with a newer timestamp or a
+                # different message count are reported as new either way, so
+                # their messages are never built.
+                current_by_id = {conv.id: conv for conv in current_export.conversations}
                 prev_conversations = []
-                for conv_data in prev_data.get('conversations', []):
-                    messages = [
-                        Message(
-                            role=msg['role'],
-                            content=msg['content'],
-                            timestamp=datetime.fromisoformat(msg['timestamp']),
-                            metadata=msg.get('metadata', {})
-                        )
-                        for msg in conv_data['messages']
-                    ]
-                    
-                    prev_conversations.append(Conversation(
-                        id=conv_data['id'],
-                        title=conv_data['title'],
-                        created_at=datetime.fromisoformat(conv_data['created_at']),
-                        updated_at=datetime.fromisoformat(conv_data['updated_at']),
-                        messages=messages
-                    ))
+                for conv_data in prev_records:
+                    current_conv = current_by_id.get(conv_data['id'])
+                    if current_conv is None:
+                        continue
+                    if (current_conv.updated_at > serialization.parse_datetime(conv_data['updated_at'])
+                            or len(current_conv.messages) != len(conv_data['messages'])):
+                        continue
+                    prev_conversations.append(self._conversation_from_data(conv_data))
                 
                 previous_export = ParsedExport(
-                    format_version=prev_data['format_version'],
-                    export_date=datetime.fromisoformat(prev_data['export_date']),
+                    format_version=prev_info['format_version'],
+                    export_date=serialization.parse_datetime(prev_info['export_date']),
                     conversations=prev_conversations,
-                    metadata=prev_data.get('metadata', {})
+                    metadata=prev_info.get('metadata', {})
                 )
                 
                 new_conversations = self.incremental_updater.detect_new_conversations(
                     current_export, previous_export
                 )
                 
-                print(f"Found {len(new_conversations)} new or updated conversations")
+                logger.info("Found %d new or updated conversations", len(new_conversations))
                 
                 if new_conversations:
                     # Extract context from new conversations
-                    new_context = self.extractor.extract_context(new_conversations)
+                    new_context = self._extract_context(new_conversations, config.workers)
                     
                     # Merge with existing context
                     merged_context = self.incremental_updater.merge_contexts(
@@ -216,96 +279,200 @@ class ExportHandler:
                     
                     return merged_context
                 else:
-                    print("No new conversations found, using existing context")
+                    logger.info("No new conversations found, using existing context")
                     return previous_context
                     
             except Exception as e:
-                print(f"Warning: Could not process incremental update: {e}")
-                print("Falling back to full export")
+                logger.warning("Could not process incremental update, falling back to full export: %s", e)
         
         # Fallback to full export
-        return self.extractor.extract_context(current_export.conversations)
+        return self._extract_context(current_export.conversations, config.workers)
     
-    def _save_gemini_output(self, output: GeminiOutput, output_dir: str) -> list:
-        """Save Gemini Gem-formatted output to files."""
-        os.makedirs(output_dir, exist_ok=True)
-        files = []
+    def _extract_parsed_context(self, parsed_export: ParsedExport, workers: int = 1) -> UniversalContextPack:
+        """Extract context from a whole export, reusing an earlier extraction of it."""
+        if self._context_cache is not None and self._context_cache[0] is parsed_export:
+            return self._context_cache[1]
+        
+        context_pack = self._extract_context(parsed_export.conversations, workers)
+        self._context_cache = (parsed_export, context_pack)
+        return context_pack
+    
+    def _extract_context(self, conversations: List[Conversation], workers: int = 1) -> UniversalContextPack:
+        """
+        Extract context, sharding the conversations across processes when asked.
+        
+        Each shard is extracted independently and the partial packs are folded
+        together with the incremental merge, so results can differ slightly
+        from a single-process run (e.g. a project discussed in several shards
+        is merged rather than summarized once). Small inputs always run in
+        this process.
+        
+        Args:
+            conversations: Conversations to extract context from
+            workers: Number of worker processes
+            
+        Returns:
+            UniversalContextPack for all conversations
+        """
+        if workers <= 1 or len(conversations) < 2 * workers:
+            return self.extractor.extract_context(conversations)
         
-        # Save Gem instructions (main file to paste into Gem)
-        instructions_file = os.path.join(output_dir, "gemini_gem_instructions.txt")
-        with open(instructions_file, 'w', encoding='utf-8') as f:
-            f.write(output.formatted_text)
-        files.append(instructions_file)
+        chunk_size = -(-len(conversations) // workers)
+        chunks = [
+            conversations[start:start + chunk_size]
+            for start in range(0, len(conversations), chunk_size)
+        ]
         
-        # Save Gem description (separate file for easy copy-paste)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            partials = list(executor.map(self.extractor.extract_context, chunks))
+        
+        merged = reduce(self.incremental_updater.merge_contexts, partials)
+        
+        # The shards make up one fresh extraction, not a chain of updates
+        first = partials[0]
+        return replace(
+            merged,
+            version=first.version,
+            created_at=first.created_at,
+            metadata={
+                **first.metadata,
+                "total_conversations": len(conversations),
+                "extraction_workers": workers
+            }
+        )
+    
+    def _open_previous_export(self, path: str) -> Tuple[Dict[str, Any], Iterable[Dict[str, Any]]]:
+        """
+        Open a previously saved parsed export.
+        
+        Newline-delimited exports are streamed one conversation at a time;
+        single-document JSON exports are loaded whole.
+        
+        Args:
+            path: Path to parsed_export.ndjson or parsed_export.json
+            
+        Returns:
+            Tuple of (export info, iterable of raw conversation dicts)
+        """
+        if path.endswith(".ndjson"):
+            records = serialization.iter_lines(path)
+            return next(records), records
+        
+        data = serialization.load_file(path)
+        return data, data.get('conversations', [])
+    
+    def _conversation_from_data(self, conv_data: Dict[str, Any]) -> Conversation:
+        """
+        Rebuild a conversation saved in a previous parsed export for comparison.
+        
+        Previous conversations are only used by detect_new_conversations,
+        which looks at the timestamps, the message count and each message's
+        role and content. Per-message timestamps and metadata are not read,
+        so they are not parsed or copied; each message carries the
+        conversation's updated_at instead.
+        
+        Args:
+            conv_data: Conversation as saved by save_parsed_export
+            
+        Returns:
+            Conversation suitable for change detection only
+        """
+        updated_at = serialization.parse_datetime(conv_data['updated_at'])
+        messages = [
+            Message(role=msg['role'], content=msg['content'], timestamp=updated_at)
+            for msg in conv_data['messages']
+        ]
+        
+        return Conversation(
+            id=conv_data['id'],
+            title=conv_data['title'],
+            created_at=serialization.parse_datetime(conv_data['created_at']),
+            updated_at=updated_at,
+            messages=messages
+        )
+    
+    def _save_gemini_output(self, output: GeminiOutput, output_dir: Path) -> list:
+        """Save Gemini Gem-formatted output to files."""
+        contents = {
+            # Gem instructions (main file to paste into Gem)
+            "gemini_gem_instructions.txt": output.formatted_text
+        }
+        
+        # Gem description (separate file for easy copy-paste)
         if output.metadata.get("gem_description"):
-            description_file = os.path.join(output_dir, "gem_description.txt")
-            with open(description_file, 'w', encoding='utf-8') as f:
-                f.write(output.metadata["gem_description"])
-            files.append(description_file)
-        
-        # Save setup guide
-        guide_file = os.path.join(output_dir, "gem_setup_guide.md")
-        with open(guide_file, 'w', encoding='utf-8') as f:
-            f.write(output.instructions)
-        files.append(guide_file)
-        
-        return files
+            contents["gem_description.txt"] = output.metadata["gem_description"]
+        
+        # Setup guide
+        contents["gem_setup_guide.md"] = output.instructions
+        
+        return self._write_text_files(output_dir, contents)
     
-    def _save_ollama_output(self, output: OllamaOutput, output_dir: str) -> list:
+    def _save_ollama_output(self, output: OllamaOutput, output_dir: Path) -> list:
         """Save Ollama-formatted output to files."""
-        os.makedirs(output_dir, exist_ok=True)
-        files = []
-        
-        # Save Modelfile
-        modelfile_path = os.path.join(output_dir, "Modelfile")
-        with open(modelfile_path, 'w', encoding='utf-8') as f:
-            f.write(output.modelfile_content)
-        files.append(modelfile_path)
-        
-        # Save supplementary files
-        for filename, content in output.supplementary_files.items():
-            file_path = os.path.join(output_dir, filename)
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-            files.append(file_path)
-        
-        # Save setup commands
-        setup_file = os.path.join(output_dir, "setup_commands.sh")
-        with open(setup_file, 'w', encoding='utf-8') as f:
-            f.write("#!/bin/bash\n")
-            f.write("# Ollama Model Setup Commands\n\n")
-            for cmd in output.setup_commands:
-                f.write(f"{cmd}\n")
-        files.append(setup_file)
-        
-        # Save test commands
-        test_file = os.path.join(output_dir, "test_commands.sh")
-        with open(test_file, 'w', encoding='utf-8') as f:
-            f.write("#!/bin/bash\n")
-            f.write("# Ollama Model Test Commands\n\n")
-            for cmd in output.test_commands:
-                f.write(f"{cmd}\n")
-        files.append(test_file)
-        
-        return files
+        contents = {"Modelfile": output.modelfile_content}
+        
+        # Supplementary files
+        contents.update(output.supplementary_files)
+        
+        # Setup and test commands
+        contents["setup_commands.sh"] = (
+            "#!/bin/bash\n# Ollama Model Setup Commands\n\n"
+            + "".join(f"{cmd}\n" for cmd in output.setup_commands)
+        )
+        contents["test_commands.sh"] = (
+            "#!/bin/bash\n# Ollama Model Test Commands\n\n"
+            + "".join(f"{cmd}\n" for cmd in output.test_commands)
+        )
+        
+        return self._write_text_files(output_dir, contents)
     
-    def _save_validation_tests(self, validation_suite, output_dir: str) -> str:
-        """Save validation tests to file."""
-        os.makedirs(output_dir, exist_ok=True)
+    def _write_text_files(self, output_dir: Path, contents: Dict[str, str]) -> List[str]:
+        """
+        Write several UTF-8 text files into a directory.
+        
+        Contents are encoded up front and the files written concurrently,
+        since each write is I/O bound and releases the GIL.
         
-        validation_file = os.path.join(output_dir, "validation_tests.md")
-        with open(validation_file, 'w', encoding='utf-8') as f:
-            f.write(f"# Validation Tests for {validation_suite.target_platform.upper()}\n\n")
-            f.write("Use these questions to validate that your context was successfully transferred.\n\n")
+        Args:
+            output_dir: Existing directory to write into
+            contents: Mapping of file name to text, in output order
             
-            for i, question in enumerate(validation_suite.questions, 1):
-                f.write(f"## Question {i} ({question.category})\n\n")
-                f.write(f"**Question:** {question.question}\n\n")
-                f.write(f"**Expected Answer:** {question.expected_answer_summary}\n\n")
-                f.write("---\n\n")
+        Returns:
+            Paths of the written files, in the order given
+        """
+        payloads = [
+            (output_dir / filename, text.encode('utf-8'))
+            for filename, text in contents.items()
+        ]
+        
+        if len(payloads) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(payloads))) as executor:
+                # Consume the results so write errors are raised here
+                list(executor.map(lambda item: item[0].write_bytes(item[1]), payloads))
+        else:
+            for path, data in payloads:
+                path.write_bytes(data)
+        
+        return [str(path) for path, _ in payloads]
+    
+    def _save_validation_tests(self, validation_suite, output_dir: Path) -> str:
+        """Save validation tests to file."""
+        parts = [
+            f"# Validation Tests for {validation_suite.target_platform.upper()}\n\n",
+            "Use these questions to validate that your context was successfully transferred.\n\n"
+        ]
+        parts.extend(
+            f"## Question {i} ({question.category})\n\n"
+            f"**Question:** {question.question}\n\n"
+            f"**Expected Answer:** {question.expected_answer_summary}\n\n"
+            "---\n\n"
+            for i, question in enumerate(validation_suite.questions, 1)
+        )
+        
+        validation_file = output_dir / "validation_tests.md"
+        validation_file.write_bytes("".join(parts).encode('utf-8'))
         
-        return validation_file
+        return str(validation_file)
     
     def get_filterable_items(self, input_path: str) -> Dict[str, Any]:
         """
@@ -319,10 +486,10 @@ class ExportHandler:
         """
         try:
             # Parse export
-            parsed_export = self.parser.parse_export(input_path)
+            parsed_export = self._parse_export(input_path)
             
             # Extract context to get projects/topics
-            context_pack = self.extractor.extract_context(parsed_export.conversations)
+            context_pack = self._extract_parsed_context(parsed_export)
             
             # Get filterable items
             filterable_items = self.filter_engine.get_filterable_items(context_pack)
@@ -345,11 +512,12 @@ class ExportHandler:
                     }
                     for project in context_pack.projects
                 ],
-                "topics": list(set(
-                    context_pack.technical_context.languages +
-                    context_pack.technical_context.frameworks +
+                # Deduplicated in first-seen order so the output is stable
+                "topics": list(dict.fromkeys(chain(
+                    context_pack.technical_context.languages,
+                    context_pack.technical_context.frameworks,
                     context_pack.technical_context.domains
-                )),
+                ))),
                 "filterable_items": [
                     {
                         "id": item.id,
@@ -5,13 +5,25 @@ This module contains the core logic for identifying projects, user preferences,
 and technical context from conversation history.
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from datetime import datetime
 import re
 from collections import defaultdict, Counter
+from itertools import chain
+
+try:
+    import re2 as _regex_engine
+except ImportError:  # pragma: no cover - google-re2 is an optional speedup
+    _regex_engine = re
+
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - pyahocorasick is an optional speedup
+    ahocorasick = None
 
 from .models import (
     Conversation, 
+    Message,
     UniversalContextPack, 
     UserProfile, 
     ProjectBrief, 
@@ -20,6 +32,16 @@ from .models import (
 )
 
 
+def _compile_ignorecase(pattern: str):
+    """
+    Compile a case-insensitive pattern with RE2 when it is installed.
+    
+    The flag is written inline because google-re2's compile() takes an
+    options object rather than re flags.
+    """
+    return _regex_engine.compile('(?i)' + pattern)
+
+
 class ContextExtractor:
     """
     Analyzes conversations and extracts structured domain knowledge.
@@ -33,25 +55,29 @@ class ContextExtractor:
     def __init__(self):
         """Initialize the context extractor with pattern matchers."""
         self._setup_patterns()
+        
+        # Technology scan of the text shared by the extract_* calls of the
+        # extract_context run in progress, as (text, mentions)
+        self._shared_scan = None
     
     def _setup_patterns(self):
         """Set up regex patterns for extraction."""
         # Programming languages
-        self.language_patterns = re.compile(
-            r'\b(python|javascript|typescript|java|c\+\+|c#|go|rust|ruby|php|swift|kotlin|scala|r|matlab|sql)\b',
-            re.IGNORECASE
-        )
+        languages = r'python|javascript|typescript|java|c\+\+|c#|go|rust|ruby|php|swift|kotlin|scala|r|matlab|sql'
+        self.language_patterns = _compile_ignorecase(rf'\b({languages})\b')
         
         # Frameworks and libraries
-        self.framework_patterns = re.compile(
-            r'\b(react|vue|angular|django|flask|fastapi|spring|express|rails|laravel|tensorflow|pytorch|pandas|numpy)\b',
-            re.IGNORECASE
-        )
+        frameworks = r'react|vue|angular|django|flask|fastapi|spring|express|rails|laravel|tensorflow|pytorch|pandas|numpy'
+        self.framework_patterns = _compile_ignorecase(rf'\b({frameworks})\b')
         
         # Tools (moved docker here from frameworks)
-        self.tool_patterns = re.compile(
-            r'\b(git|github|gitlab|vscode|vs code|pycharm|intellij|aws|azure|gcp|postgres|postgresql|mysql|mongodb|redis|nginx|apache|docker|kubernetes)\b',
-            re.IGNORECASE
+        tools = r'git|github|gitlab|vscode|vs code|pycharm|intellij|aws|azure|gcp|postgres|postgresql|mysql|mongodb|redis|nginx|apache|docker|kubernetes'
+        self.tool_patterns = _compile_ignorecase(rf'\b({tools})\b')
+        
+        # All three in one pass. No word appears in more than one list, so
+        # this finds exactly the matches of the three separate patterns.
+        self.technology_patterns = _compile_ignorecase(
+            rf'\b(?:(?P<language>{languages})|(?P<framework>{frameworks})|(?P<tool>{tools}))\b'
         )
         
         # Project indicators
@@ -66,11 +92,50 @@ class ContextExtractor:
             r'\bworking\s+with\b.*\b(team|client|company)\b',
             r'\bstarted\b.*\b(project|app|system)\b',
         ]
+        self.project_indicator_pattern = _compile_ignorecase(
+            '|'.join(f'(?:{pattern})' for pattern in self.project_indicators)
+        )
+        
+        # Generic conversation titles, matched anywhere in the title
+        self.generic_title_pattern = _compile_ignorecase(r'new chat|untitled|conversation|chat')
+        
+        # Words after which a project name may follow, and filler words
+        # removed from the name
+        self.project_name_triggers = frozenset({
+            'building', 'creating', 'developing', 'working', 'project', 'app', 'application', 'system'
+        })
+        self.project_name_filler_pattern = _compile_ignorecase(
+            r'\b(a|an|the|for|to|with|on|called|named)\b'
+        )
+        
+        # Domain keywords mapping, matched as substrings of lowercased text
+        self.domain_keywords = {
+            'web development': ('web', 'frontend', 'backend', 'html', 'css', 'javascript', 'react', 'vue', 'angular'),
+            'data science': ('data', 'analysis', 'pandas', 'numpy', 'machine learning', 'ml', 'ai', 'statistics'),
+            'mobile development': ('mobile', 'ios', 'android', 'swift', 'kotlin', 'react native', 'flutter'),
+            'devops': ('docker', 'kubernetes', 'aws', 'azure', 'deployment', 'ci/cd', 'infrastructure'),
+            'database': ('database', 'sql', 'postgres', 'mysql', 'mongodb', 'redis'),
+        }
+        
+        # With pyahocorasick, all domain keywords are found in one linear
+        # pass. Overlapping keywords are reported too, as with 'in'.
+        self._domain_automaton = None
+        if ahocorasick is not None:
+            self._domain_automaton = ahocorasick.Automaton()
+            for domain, keywords in self.domain_keywords.items():
+                for keyword in keywords:
+                    self._domain_automaton.add_word(keyword, domain)
+            self._domain_automaton.make_automaton()
+        
+        # Challenge indicators
+        self.challenge_pattern = _compile_ignorecase(
+            r'\b(?:problem\s+with|issue\s+with|struggling\s+with|difficulty\s+with|challenge\s+with'
+            r'|error\s+with|bug\s+in|failing\s+to|can\'t\s+get|having\s+trouble)\b'
+        )
         
         # Role indicators - order matters, longer phrases first
-        self.role_patterns = re.compile(
-            r'\bi\'?m\s+a\s+(senior\s+software\s+engineer|junior\s+software\s+engineer|senior\s+data\s+scientist|junior\s+data\s+scientist|senior\s+architect|junior\s+developer|senior\s+engineer|data\s+scientist|software\s+engineer|product\s+manager|senior\s+developer|junior\s+engineer|lead\s+developer|tech\s+lead|software\s+architect|system\s+architect|developer|architect|analyst|programmer|engineer|scientist|manager|designer|student|researcher|consultant|lead|senior|junior|intern)',
-            re.IGNORECASE
+        self.role_patterns = _compile_ignorecase(
+            r'\bi\'?m\s+a\s+(senior\s+software\s+engineer|junior\s+software\s+engineer|senior\s+data\s+scientist|junior\s+data\s+scientist|senior\s+architect|junior\s+developer|senior\s+engineer|data\s+scientist|software\s+engineer|product\s+manager|senior\s+developer|junior\s+engineer|lead\s+developer|tech\s+lead|software\s+architect|system\s+architect|developer|architect|analyst|programmer|engineer|scientist|manager|designer|student|researcher|consultant|lead|senior|junior|intern)'
         )
     
     def extract_context(self, conversations: List[Conversation]) -> UniversalContextPack:
@@ -83,15 +148,27 @@ class ContextExtractor:
         Returns:
             UniversalContextPack with profile, projects, and preferences
         """
-        # Extract individual components
-        user_profile = self.extract_profile(conversations)
-        projects = self.extract_projects(conversations)
-        preferences = self.extract_preferences(conversations)
-        technical_context = self.extract_technical_context(conversations)
+        # One clock reading for project recency and the pack's timestamps
+        now = datetime.now()
+        
+        # Collect the user messages, build their text and scan it once for
+        # all extractors
+        user_messages = self._get_user_messages(conversations)
+        all_text = self._get_user_messages_text(conversations, user_messages)
+        self._shared_scan = (all_text, self._scan_technologies(all_text))
+        
+        try:
+            # Extract individual components
+            user_profile = self.extract_profile(conversations, all_text)
+            projects = self.extract_projects(conversations, now)
+            preferences = self.extract_preferences(conversations, all_text, user_messages)
+            technical_context = self.extract_technical_context(conversations, all_text)
+        finally:
+            self._shared_scan = None
         
         return UniversalContextPack(
             version="1.0",
-            created_at=datetime.now(),
+            created_at=now,
             source_platform="chatgpt",
             user_profile=user_profile,
             projects=projects,
@@ -99,21 +176,26 @@ class ContextExtractor:
             technical_context=technical_context,
             metadata={
                 "total_conversations": len(conversations),
-                "extraction_date": datetime.now().isoformat(),
+                "extraction_date": now.isoformat(),
                 "extractor_version": "1.0"
             }
         )
     
-    def extract_projects(self, conversations: List[Conversation]) -> List[ProjectBrief]:
+    def extract_projects(self, conversations: List[Conversation], now: Optional[datetime] = None) -> List[ProjectBrief]:
         """
         Identify and summarize user projects.
         
         Args:
             conversations: List of conversations to analyze
+            now: Time that project recency is measured from, defaults to
+                the current time
             
         Returns:
             List of identified projects
         """
+        if now is None:
+            now = datetime.now()
+        
         projects = []
         project_conversations = defaultdict(list)
         
@@ -125,7 +207,7 @@ class ContextExtractor:
         
         # Create project briefs
         for project_name, convs in project_conversations.items():
-            project = self._create_project_brief(project_name, convs)
+            project = self._create_project_brief(project_name, convs, now)
             if project:
                 projects.append(project)
         
@@ -134,26 +216,30 @@ class ContextExtractor:
         
         return projects
     
-    def extract_profile(self, conversations: List[Conversation]) -> UserProfile:
+    def extract_profile(self, conversations: List[Conversation], all_text: Optional[str] = None) -> UserProfile:
         """
         Extract user background and role.
         
         Args:
             conversations: List of conversations to analyze
+            all_text: Joined user messages, built from conversations if omitted
             
         Returns:
             UserProfile with role and expertise
         """
-        all_text = self._get_user_messages_text(conversations)
+        if all_text is None:
+            all_text = self._get_user_messages_text(conversations)
         
         # Extract role
         role_match = self.role_patterns.search(all_text)
         role = role_match.group(1) if role_match else None
         
+        mentions = self._scan_technologies(all_text)
+        
         # Extract expertise areas (most mentioned technologies)
         tech_mentions = Counter()
-        tech_mentions.update(self.language_patterns.findall(all_text))
-        tech_mentions.update(self.framework_patterns.findall(all_text))
+        tech_mentions.update(mentions['language'])
+        tech_mentions.update(mentions['framework'])
         
         expertise_areas = [tech for tech, count in tech_mentions.most_common(10) if count >= 1]
         
@@ -166,48 +252,60 @@ class ContextExtractor:
             background_summary=background_summary
         )
     
-    def extract_preferences(self, conversations: List[Conversation]) -> UserPreferences:
+    def extract_preferences(
+        self,
+        conversations: List[Conversation],
+        all_text: Optional[str] = None,
+        user_messages: Optional[List[Message]] = None
+    ) -> UserPreferences:
         """
         Extract user working patterns and preferences.
         
         Args:
             conversations: List of conversations to analyze
+            all_text: Joined user messages, built from conversations if omitted
+            user_messages: User messages in conversation order, collected
+                from conversations if omitted
             
         Returns:
             UserPreferences with coding style and patterns
         """
-        all_text = self._get_user_messages_text(conversations)
+        if user_messages is None:
+            user_messages = self._get_user_messages(conversations)
+        if all_text is None:
+            all_text = self._get_user_messages_text(conversations, user_messages)
+        mentions = self._scan_technologies(all_text)
         
         # Extract coding style preferences
         coding_style = {}
         
         # Determine primary language based on frequency
-        language_mentions = Counter(self.language_patterns.findall(all_text))
+        language_mentions = mentions['language']
         if language_mentions:
             primary_lang = language_mentions.most_common(1)[0][0]
             coding_style['primary_language'] = primary_lang.title()
         
         # Extract style preferences
-        if 'functional' in all_text.lower():
+        text_lower = all_text.lower()
+        if 'functional' in text_lower:
             coding_style['paradigm'] = 'functional'
-        elif 'object-oriented' in all_text.lower() or 'oop' in all_text.lower():
+        elif 'object-oriented' in text_lower or 'oop' in text_lower:
             coding_style['paradigm'] = 'object-oriented'
         
         # Extract testing preferences
-        if 'test-driven' in all_text.lower() or 'tdd' in all_text.lower():
+        if 'test-driven' in text_lower or 'tdd' in text_lower:
             coding_style['testing_approach'] = 'test-driven'
-        elif 'unit test' in all_text.lower():
+        elif 'unit test' in text_lower:
             coding_style['testing_approach'] = 'unit testing'
         
         # Extract preferred tools
-        tool_mentions = self.tool_patterns.findall(all_text)
-        preferred_tools = list(set(tool_mentions))
+        preferred_tools = list(mentions['tool'])
         
         # Analyze communication style
-        communication_style = self._analyze_communication_style(conversations)
+        communication_style = self._analyze_communication_style(user_messages)
         
         # Extract work patterns
-        work_patterns = self._extract_work_patterns(conversations)
+        work_patterns = self._extract_work_patterns(conversations, user_messages)
         
         return UserPreferences(
             coding_style=coding_style,
@@ -216,21 +314,24 @@ class ContextExtractor:
             work_patterns=work_patterns
         )
     
-    def extract_technical_context(self, conversations: List[Conversation]) -> TechnicalContext:
+    def extract_technical_context(self, conversations: List[Conversation], all_text: Optional[str] = None) -> TechnicalContext:
         """
         Extract technical knowledge and expertise.
         
         Args:
             conversations: List of conversations to analyze
+            all_text: Joined user messages, built from conversations if omitted
             
         Returns:
             TechnicalContext with languages, frameworks, tools, and domains
         """
-        all_text = self._get_user_messages_text(conversations)
+        if all_text is None:
+            all_text = self._get_user_messages_text(conversations)
+        mentions = self._scan_technologies(all_text)
         
-        languages = list(set(self.language_patterns.findall(all_text)))
-        frameworks = list(set(self.framework_patterns.findall(all_text)))
-        tools = list(set(self.tool_patterns.findall(all_text)))
+        languages = list(mentions['language'])
+        frameworks = list(mentions['framework'])
+        tools = list(mentions['tool'])
         
         # Identify domains based on conversation topics
         domains = self._identify_domains(conversations)
@@ -242,50 +343,72 @@ class ContextExtractor:
             domains=domains
         )
     
-    def _get_user_messages_text(self, conversations: List[Conversation]) -> str:
+    def _scan_technologies(self, text: str) -> Dict[str, Counter]:
+        """
+        Count language, framework and tool mentions in a single pass.
+        
+        Args:
+            text: Text to scan
+            
+        Returns:
+            Counters of the matched text, as written, keyed by 'language',
+            'framework' and 'tool'. Callers must not modify them, since the
+            scan of the shared text is handed to every extractor.
+        """
+        if self._shared_scan is not None and self._shared_scan[0] is text:
+            return self._shared_scan[1]
+        
+        mentions = {'language': Counter(), 'framework': Counter(), 'tool': Counter()}
+        for match in self.technology_patterns.finditer(text):
+            mentions[match.lastgroup][match.group(match.lastgroup)] += 1
+        return mentions
+    
+    def _get_user_messages(self, conversations: List[Conversation]) -> List[Message]:
+        """Collect the user messages of all conversations, in order."""
+        return [
+            msg for conv in conversations
+            for msg in conv.messages if msg.role == 'user'
+        ]
+    
+    def _get_user_messages_text(
+        self,
+        conversations: List[Conversation],
+        user_messages: Optional[List[Message]] = None
+    ) -> str:
         """Extract all user message content as a single string."""
-        user_messages = []
-        for conv in conversations:
-            for msg in conv.messages:
-                if msg.role == 'user':
-                    user_messages.append(msg.content)
-        return ' '.join(user_messages)
+        if user_messages is None:
+            user_messages = self._get_user_messages(conversations)
+        return ' '.join([msg.content for msg in user_messages])
     
     def _identify_project_in_conversation(self, conversation: Conversation) -> str:
         """Try to identify a project name from conversation title and content."""
-        # First check if there are any user messages at all
-        user_messages = [msg for msg in conversation.messages if msg.role == 'user']
-        if not user_messages:
+        # First check if there are any user messages at all, stopping at the
+        # first one instead of collecting them
+        if not any(msg.role == 'user' for msg in conversation.messages):
             return None
             
-        # Check conversation title first
-        title = conversation.title.lower()
-        
-        # Skip generic titles
-        generic_titles = ['new chat', 'untitled', 'conversation', 'chat']
-        if any(generic in title for generic in generic_titles):
+        # Check conversation title first, skipping generic titles
+        if self.generic_title_pattern.search(conversation.title):
             # Look for project indicators in messages
             for msg in conversation.messages[:5]:  # Check first few messages
-                if msg.role == 'user':
-                    for pattern in self.project_indicators:
-                        if re.search(pattern, msg.content, re.IGNORECASE):
-                            # Extract potential project name
-                            return self._extract_project_name_from_text(msg.content)
+                if msg.role == 'user' and self.project_indicator_pattern.search(msg.content):
+                    # Extract potential project name
+                    return self._extract_project_name_from_text(msg.content)
             return None
         
-        return title.title()
+        return conversation.title.title()
     
     def _extract_project_name_from_text(self, text: str) -> str:
         """Extract a potential project name from text."""
         # This is a simplified heuristic - could be improved with NLP
         words = text.split()
         for i, word in enumerate(words):
-            if word.lower() in ['building', 'creating', 'developing', 'working', 'project', 'app', 'application', 'system']:
+            if word.lower() in self.project_name_triggers:
                 # Look for the next few words that might be a project name
                 if i + 1 < len(words):
                     potential_name = ' '.join(words[i+1:i+4])
                     # Clean up common words
-                    potential_name = re.sub(r'\b(a|an|the|for|to|with|on|called|named)\b', '', potential_name, flags=re.IGNORECASE)
+                    potential_name = self.project_name_filler_pattern.sub('', potential_name)
                     potential_name = potential_name.strip()
                     if potential_name:
                         return potential_name.title()
@@ -297,28 +420,26 @@ class ContextExtractor:
             
         return "Unnamed Project"
     
-    def _create_project_brief(self, project_name: str, conversations: List[Conversation]) -> ProjectBrief:
+    def _create_project_brief(self, project_name: str, conversations: List[Conversation], now: datetime) -> ProjectBrief:
         """Create a project brief from related conversations."""
         if not conversations:
             return None
         
         # Extract tech stack from conversations
-        all_text = ' '.join([
+        all_text = ' '.join(
             msg.content for conv in conversations 
             for msg in conv.messages if msg.role == 'user'
-        ])
+        )
         
-        tech_stack = list(set(
-            self.language_patterns.findall(all_text) + 
-            self.framework_patterns.findall(all_text)
-        ))
+        mentions = self._scan_technologies(all_text)
+        tech_stack = list(mentions['language'].keys() | mentions['framework'].keys())
         
         # Generate description (simplified)
         description = f"Project involving {', '.join(tech_stack[:3]) if tech_stack else 'development'}"
         
         # Calculate relevance score based on recency and frequency
         last_discussed = max(conv.updated_at for conv in conversations)
-        days_since_last = (datetime.now() - last_discussed).days
+        days_since_last = (now - last_discussed).days
         # Higher score for more recent and more frequent discussions
         # Clamp to [0.0, 1.0] range to satisfy Pydantic validation
         relevance_score = min(1.0, len(conversations) * 0.1 + max(0, 1.0 - (days_since_last / 365.0)))
@@ -353,18 +474,14 @@ class ContextExtractor:
         
         return '. '.join(summary_parts) + '.' if summary_parts else "No background information available."
     
-    def _analyze_communication_style(self, conversations: List[Conversation]) -> str:
-        """Analyze user's communication style from messages."""
-        user_messages = [
-            msg.content for conv in conversations 
-            for msg in conv.messages if msg.role == 'user'
-        ]
-        
+    def _analyze_communication_style(self, user_messages: List[Message]) -> str:
+        """Analyze user's communication style from their messages."""
         if not user_messages:
             return "Unknown"
         
         # Simple heuristics for communication style
-        avg_length = sum(len(msg.split()) for msg in user_messages) / len(user_messages)
+        total_words = sum(len(msg.content.split()) for msg in user_messages)
+        avg_length = total_words / len(user_messages)
         
         if avg_length > 50:
             return "Detailed and thorough"
@@ -377,78 +494,61 @@ class ContextExtractor:
         """Identify technical domains from conversation topics."""
         domains = set()
         
-        all_text = ' '.join([
-            conv.title + ' ' + ' '.join([msg.content for msg in conv.messages])
+        # Titles and messages are joined in a single join, without building
+        # a joined string per conversation first
+        all_text = ' '.join(chain.from_iterable(
+            chain((conv.title,), (msg.content for msg in conv.messages))
             for conv in conversations
-        ]).lower()
-        
-        # Domain keywords mapping
-        domain_keywords = {
-            'web development': ['web', 'frontend', 'backend', 'html', 'css', 'javascript', 'react', 'vue', 'angular'],
-            'data science': ['data', 'analysis', 'pandas', 'numpy', 'machine learning', 'ml', 'ai', 'statistics'],
-            'mobile development': ['mobile', 'ios', 'android', 'swift', 'kotlin', 'react native', 'flutter'],
-            'devops': ['docker', 'kubernetes', 'aws', 'azure', 'deployment', 'ci/cd', 'infrastructure'],
-            'database': ['database', 'sql', 'postgres', 'mysql', 'mongodb', 'redis'],
-        }
+        )).lower()
         
-        for domain, keywords in domain_keywords.items():
-            if any(keyword in all_text for keyword in keywords):
+        if self._domain_automaton is not None:
+            # Stop as soon as every domain has been seen
+            for _, domain in self._domain_automaton.iter(all_text):
                 domains.add(domain)
+                if len(domains) == len(self.domain_keywords):
+                    break
+        else:
+            # Each domain stops at its first keyword found in the text
+            for domain, keywords in self.domain_keywords.items():
+                if any(keyword in all_text for keyword in keywords):
+                    domains.add(domain)
         
         return list(domains)
     
     def _extract_challenges_from_conversations(self, conversations: List[Conversation]) -> List[str]:
-        """Extract key challenges mentioned in conversations."""
-        challenges = []
-        
-        # Challenge indicators
-        challenge_patterns = [
-            r'\bproblem\s+with\b',
-            r'\bissue\s+with\b',
-            r'\bstruggling\s+with\b',
-            r'\bdifficulty\s+with\b',
-            r'\bchallenge\s+with\b',
-            r'\berror\s+with\b',
-            r'\bbug\s+in\b',
-            r'\bfailing\s+to\b',
-            r'\bcan\'t\s+get\b',
-            r'\bhaving\s+trouble\b',
-        ]
+        """Extract up to three distinct challenges mentioned in conversations."""
+        # Insertion-ordered set of the first distinct challenges found
+        challenges = {}
+        find_challenges = self.challenge_pattern.finditer
         
         for conv in conversations:
             for msg in conv.messages:
-                if msg.role == 'user':
-                    for pattern in challenge_patterns:
-                        matches = re.finditer(pattern, msg.content, re.IGNORECASE)
-                        for match in matches:
-                            # Extract the context around the challenge
-                            start = max(0, match.start() - 20)
-                            end = min(len(msg.content), match.end() + 50)
-                            context = msg.content[start:end].strip()
-                            
-                            # Clean up and add if not too generic
-                            if len(context) > 10 and len(context) < 100:
-                                challenges.append(context)
-        
-        # Remove duplicates and limit to top 3
-        unique_challenges = list(set(challenges))[:3]
-        return unique_challenges
+                if msg.role != 'user':
+                    continue
+                content = msg.content
+                for match in find_challenges(content):
+                    # Extract the context around the challenge. Slicing
+                    # clamps the end to the content length by itself.
+                    start, end = match.span()
+                    context = content[max(0, start - 20):end + 50].strip()
+                    
+                    # Clean up and add if not too generic
+                    if len(context) > 10 and len(context) < 100:
+                        challenges[context] = None
+                        if len(challenges) == 3:
+                            return list(challenges)
+        
+        return list(challenges)
     
-    def _extract_work_patterns(self, conversations: List[Conversation]) -> Dict[str, Any]:
-        """Extract work patterns and habits from conversations."""
+    def _extract_work_patterns(self, conversations: List[Conversation], user_messages: List[Message]) -> Dict[str, Any]:
+        """Extract work patterns and habits from conversations and their user messages."""
         patterns = {}
         
         # Analyze conversation timing to infer work schedule
-        timestamps = []
-        for conv in conversations:
-            for msg in conv.messages:
-                if msg.role == 'user':
-                    timestamps.append(msg.timestamp)
+        hour_counter = Counter([msg.timestamp.hour for msg in user_messages])
         
-        if timestamps:
+        if hour_counter:
             # Find most common hours
-            hours = [ts.hour for ts in timestamps]
-            hour_counter = Counter(hours)
             most_active_hour = hour_counter.most_common(1)[0][0]
             
             if 9 <= most_active_hour <= 17:
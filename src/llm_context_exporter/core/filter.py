@@ -5,23 +5,105 @@ This module provides functionality for users to selectively include/exclude
 conversations, topics, and other content from their context packages.
 """
 
-from typing import List, Dict, Any
+import functools
+from itertools import filterfalse
+from dataclasses import dataclass, field, replace
+from typing import List, Dict, Any, FrozenSet, Iterator, Optional, Tuple
 from datetime import datetime
-import json
 import os
 
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - pyahocorasick is an optional speedup
+    ahocorasick = None
+
+from . import serialization
 from .models import UniversalContextPack, FilterConfig, Conversation, ProjectBrief, TechnicalContext
 
 
+@dataclass(slots=True, eq=False)
 class FilterableItem:
     """Represents an item that can be filtered (conversation, project, etc.)."""
+    item_id: str
+    item_type: str  # 'conversation', 'project', 'topic'
+    title: str
+    description: str
+    metadata: Optional[Dict[str, Any]] = None
+    
+    def __post_init__(self):
+        """Default missing metadata to an empty dict."""
+        if self.metadata is None:
+            self.metadata = {}
+
+
+@functools.lru_cache(maxsize=2048)
+def _title(topic: str) -> str:
+    """Title-case a topic name, reusing the result for names seen before."""
+    return topic.title()
+
+
+def _serialize_date_range(date_range: Optional[Tuple[datetime, datetime]]) -> Optional[List[Optional[str]]]:
+    """Format a filter date range for JSON, or None if there is no range."""
+    if not date_range:
+        return None
+    return [bound.isoformat() if bound else None for bound in date_range]
+
+
+@dataclass(frozen=True, slots=True)
+class _CompiledFilters:
+    """Filter configuration prepared once for a whole filtering pass."""
+    excluded_exact: FrozenSet[str]
+    excluded_substrings: Tuple[str, ...]
+    min_relevance_score: float
+    date_range: Optional[Tuple[datetime, datetime]]
+    # Aho-Corasick automaton over excluded_substrings, when worthwhile
+    automaton: Any = None
+    # Verdicts for items already checked in this pass. The same names
+    # recur across projects' tech stacks and the technical context.
+    checked_topics: Dict[str, bool] = field(default_factory=dict, init=False, repr=False, compare=False)
+    
+    # Below this many topics, plain substring checks beat the automaton
+    AUTOMATON_MIN_TOPICS = 4
+    
+    @classmethod
+    def from_config(cls, filters: FilterConfig) -> "_CompiledFilters":
+        """Lowercase the excluded topics once, dropping duplicates."""
+        excluded_lower = tuple(dict.fromkeys(topic.lower() for topic in filters.excluded_topics))
+        
+        automaton = None
+        # An empty topic matches everything, which the automaton can't express
+        if (ahocorasick is not None and len(excluded_lower) >= cls.AUTOMATON_MIN_TOPICS
+                and all(excluded_lower)):
+            automaton = ahocorasick.Automaton()
+            for topic in excluded_lower:
+                automaton.add_word(topic, topic)
+            automaton.make_automaton()
+        
+        return cls(
+            excluded_exact=frozenset(excluded_lower),
+            excluded_substrings=excluded_lower,
+            min_relevance_score=filters.min_relevance_score,
+            date_range=filters.date_range,
+            automaton=automaton
+        )
+    
+    def excludes_topic(self, item: str) -> bool:
+        """Check if an item matches any excluded topic (case-insensitive)."""
+        excluded = self.checked_topics.get(item)
+        if excluded is None:
+            excluded = self.checked_topics[item] = self._match_topic(item.lower())
+        return excluded
     
-    def __init__(self, item_id: str, item_type: str, title: str, description: str, metadata: Dict[str, Any] = None):
-        self.item_id = item_id
-        self.item_type = item_type  # 'conversation', 'project', 'topic'
-        self.title = title
-        self.description = description
-        self.metadata = metadata or {}
+    def _match_topic(self, item_lower: str) -> bool:
+        """Match a lowercased item against the excluded topics."""
+        # Exact matches are a set lookup; otherwise check if an excluded
+        # topic is contained in the item
+        if item_lower in self.excluded_exact:
+            return True
+        if self.automaton is not None:
+            # One pass over the item finds any excluded topic it contains
+            return next(self.automaton.iter(item_lower), None) is not None
+        return any(excluded in item_lower for excluded in self.excluded_substrings)
 
 
 class FilterEngine:
@@ -32,6 +114,16 @@ class FilterEngine:
     from their exported context while maintaining coherence.
     """
     
+    # What excluding an item removes, by the prefix of its item ID
+    ITEM_ID_KINDS = {
+        "conversation": "conversation",
+        "project": "topic",
+        "domain": "topic",
+        "language": "topic",
+        "framework": "topic",
+        "tool": "topic",
+    }
+    
     def __init__(self, preferences_file: str = None):
         """
         Initialize the filter engine.
@@ -40,6 +132,9 @@ class FilterEngine:
             preferences_file: Path to save/load filter preferences
         """
         self.preferences_file = preferences_file or os.path.expanduser("~/.llm_context_exporter_filters.json")
+        
+        # Last loaded preferences, keyed by the file's mtime and size
+        self._preferences_cache: Optional[Tuple[Tuple[int, int], FilterConfig]] = None
     
     def apply_filters(self, context: UniversalContextPack, filters: FilterConfig) -> UniversalContextPack:
         """
@@ -52,11 +147,87 @@ class FilterEngine:
         Returns:
             Filtered context pack
         """
-        # Filter projects based on various criteria
-        filtered_projects = self._filter_projects(context.projects, filters)
+        return self._build_filtered_context(context, context, filters)
+    
+    def apply_filters_delta(
+        self,
+        context: UniversalContextPack,
+        previous_filtered: UniversalContextPack,
+        previous_filters: FilterConfig,
+        filters: FilterConfig
+    ) -> UniversalContextPack:
+        """
+        Re-apply filters after a change, reusing the previous result when possible.
+        
+        Filtering only ever drops items, so when the new filters are at
+        least as strict as the previous ones (topics only added, threshold
+        not lowered, date range not widened) the previous result is
+        filtered further and items already dropped are never looked at
+        again. Any loosening re-admits items, so the original context is
+        filtered from scratch instead.
+        
+        Args:
+            context: Original, unfiltered context pack
+            previous_filtered: Result of filtering context with previous_filters
+            previous_filters: Filter configuration used for previous_filtered
+            filters: New filter configuration
+            
+        Returns:
+            Filtered context pack, the same as apply_filters(context, filters)
+        """
+        if self._is_stricter(filters, previous_filters):
+            return self._build_filtered_context(context, previous_filtered, filters)
+        return self._build_filtered_context(context, context, filters)
+    
+    def _is_stricter(self, filters: FilterConfig, previous: FilterConfig) -> bool:
+        """Check if filters keep no item that previous would have dropped."""
+        new_topics = {topic.lower() for topic in filters.excluded_topics}
+        if not new_topics.issuperset(topic.lower() for topic in previous.excluded_topics):
+            return False
+        
+        if filters.min_relevance_score < previous.min_relevance_score:
+            return False
+        
+        if previous.date_range:
+            if not filters.date_range:
+                return False
+            start_date, end_date = filters.date_range
+            previous_start, previous_end = previous.date_range
+            if start_date < previous_start or end_date > previous_end:
+                return False
+        
+        return True
+    
+    def _build_filtered_context(
+        self,
+        context: UniversalContextPack,
+        source: UniversalContextPack,
+        filters: FilterConfig
+    ) -> UniversalContextPack:
+        """
+        Filter the projects and technical context of source.
         
-        # Filter technical context based on excluded topics
-        filtered_technical_context = self._filter_technical_context(context.technical_context, filters)
+        Everything that isn't filtered, and the original counts in the
+        metadata, comes from context.
+        """
+        if filters.is_noop():
+            # Nothing can be dropped, so skip matching every item
+            technical_context = source.technical_context
+            filtered_projects = list(source.projects)
+            filtered_technical_context = TechnicalContext(
+                languages=list(technical_context.languages),
+                frameworks=list(technical_context.frameworks),
+                tools=list(technical_context.tools),
+                domains=list(technical_context.domains)
+            )
+        else:
+            compiled = _CompiledFilters.from_config(filters)
+            
+            # Filter projects based on various criteria
+            filtered_projects = self._filter_projects(source.projects, compiled)
+            
+            # Filter technical context based on excluded topics
+            filtered_technical_context = self._filter_technical_context(source.technical_context, compiled)
         
         # Create filtered context pack
         filtered_context = UniversalContextPack(
@@ -75,10 +246,7 @@ class FilterEngine:
                 "filtered_project_count": len(filtered_projects),
                 "excluded_conversation_ids": filters.excluded_conversation_ids,
                 "excluded_topics": filters.excluded_topics,
-                "date_range": [
-                    filters.date_range[0].isoformat() if filters.date_range and filters.date_range[0] else None,
-                    filters.date_range[1].isoformat() if filters.date_range and filters.date_range[1] else None
-                ] if filters.date_range else None,
+                "date_range": _serialize_date_range(filters.date_range),
                 "min_relevance_score": filters.min_relevance_score
             }
         )
@@ -95,11 +263,24 @@ class FilterEngine:
         Returns:
             List of filterable items with metadata
         """
-        items = []
+        return list(self.iter_filterable_items(context))
+    
+    def iter_filterable_items(self, context: UniversalContextPack) -> Iterator[FilterableItem]:
+        """
+        Yield the items that can be filtered, in get_filterable_items order.
+        
+        Items are built only as they are consumed, so callers that need
+        just a page (e.g. via itertools.islice) don't build the rest.
         
+        Args:
+            context: Context pack to analyze
+            
+        Yields:
+            Filterable items with metadata
+        """
         # Add projects as filterable items
         for project in context.projects:
-            items.append(FilterableItem(
+            yield FilterableItem(
                 item_id=f"project_{project.name}",
                 item_type="project",
                 title=project.name,
@@ -110,49 +291,27 @@ class FilterEngine:
                     "relevance_score": project.relevance_score,
                     "current_status": project.current_status
                 }
-            ))
-        
-        # Add technical domains as filterable topics
-        for domain in context.technical_context.domains:
-            items.append(FilterableItem(
-                item_id=f"domain_{domain}",
-                item_type="topic",
-                title=domain.title(),
-                description=f"Technical domain: {domain}",
-                metadata={"type": "domain"}
-            ))
-        
-        # Add programming languages as filterable topics
-        for language in context.technical_context.languages:
-            items.append(FilterableItem(
-                item_id=f"language_{language}",
-                item_type="topic", 
-                title=language.title(),
-                description=f"Programming language: {language}",
-                metadata={"type": "language"}
-            ))
-        
-        # Add frameworks as filterable topics
-        for framework in context.technical_context.frameworks:
-            items.append(FilterableItem(
-                item_id=f"framework_{framework}",
-                item_type="topic",
-                title=framework,
-                description=f"Framework/Library: {framework}",
-                metadata={"type": "framework"}
-            ))
-        
-        # Add tools as filterable topics
-        for tool in context.technical_context.tools:
-            items.append(FilterableItem(
-                item_id=f"tool_{tool}",
-                item_type="topic",
-                title=tool,
-                description=f"Development tool: {tool}",
-                metadata={"type": "tool"}
-            ))
+            )
         
-        return items
+        # Add technical domains, programming languages, frameworks and tools
+        # as filterable topics. Domains and languages are title-cased;
+        # framework and tool names keep their own casing.
+        technical_context = context.technical_context
+        topic_groups = (
+            ("domain", technical_context.domains, "Technical domain", True),
+            ("language", technical_context.languages, "Programming language", True),
+            ("framework", technical_context.frameworks, "Framework/Library", False),
+            ("tool", technical_context.tools, "Development tool", False),
+        )
+        for topic_type, topics, label, title_case in topic_groups:
+            for topic in topics:
+                yield FilterableItem(
+                    item_id=f"{topic_type}_{topic}",
+                    item_type="topic",
+                    title=_title(topic) if title_case else topic,
+                    description=f"{label}: {topic}",
+                    metadata={"type": topic_type}
+                )
     
     def get_filterable_conversations(self, conversations: List[Conversation]) -> List[FilterableItem]:
         """
@@ -201,17 +360,30 @@ class FilterEngine:
             filter_data = {
                 "excluded_conversation_ids": filters.excluded_conversation_ids,
                 "excluded_topics": filters.excluded_topics,
-                "date_range": [
-                    filters.date_range[0].isoformat() if filters.date_range and filters.date_range[0] else None,
-                    filters.date_range[1].isoformat() if filters.date_range and filters.date_range[1] else None
-                ] if filters.date_range else None,
+                "date_range": _serialize_date_range(filters.date_range),
                 "min_relevance_score": filters.min_relevance_score,
                 "saved_at": datetime.now().isoformat()
             }
             
-            os.makedirs(os.path.dirname(self.preferences_file), exist_ok=True)
-            with open(self.preferences_file, 'w') as f:
-                json.dump(filter_data, f, indent=2)
+            dirname = os.path.dirname(self.preferences_file)
+            if dirname and not os.path.isdir(dirname):
+                os.makedirs(dirname, exist_ok=True)
+            # A save within the filesystem's mtime resolution wouldn't change
+            # the cache key, so drop the cached copy explicitly
+            self._preferences_cache = None
+            # Write a temporary file and swap it in, so a crash mid-write
+            # leaves the previous preferences intact
+            tmp_path = f"{self.preferences_file}.{os.getpid()}.tmp"
+            try:
+                with open(tmp_path, 'wb') as f:
+                    f.write(serialization.dumps(filter_data))
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.preferences_file)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+                raise
                 
         except Exception as e:
             # Don't fail the entire operation if preferences can't be saved
@@ -221,15 +393,24 @@ class FilterEngine:
         """
         Load previously saved filter preferences.
         
+        The parsed file is reused until its modification time or size
+        changes. Each call returns its own FilterConfig, so callers may
+        modify the result.
+        
         Returns:
             FilterConfig with saved preferences, or empty config if none exist
         """
         try:
-            if not os.path.exists(self.preferences_file):
+            try:
+                stat = os.stat(self.preferences_file)
+            except FileNotFoundError:
                 return FilterConfig()
             
-            with open(self.preferences_file, 'r') as f:
-                filter_data = json.load(f)
+            key = (stat.st_mtime_ns, stat.st_size)
+            if self._preferences_cache is not None and self._preferences_cache[0] == key:
+                return self._copy_filter_config(self._preferences_cache[1])
+            
+            filter_data = serialization.load_file(self.preferences_file)
             
             date_range = None
             if filter_data.get("date_range") and filter_data["date_range"][0] and filter_data["date_range"][1]:
@@ -238,17 +419,27 @@ class FilterEngine:
                     datetime.fromisoformat(filter_data["date_range"][1])
                 )
             
-            return FilterConfig(
+            filters = FilterConfig(
                 excluded_conversation_ids=filter_data.get("excluded_conversation_ids", []),
                 excluded_topics=filter_data.get("excluded_topics", []),
                 date_range=date_range,
                 min_relevance_score=filter_data.get("min_relevance_score", 0.0)
             )
+            self._preferences_cache = (key, filters)
+            return self._copy_filter_config(filters)
             
         except Exception as e:
             print(f"Warning: Could not load filter preferences: {e}")
             return FilterConfig()
     
+    def _copy_filter_config(self, filters: FilterConfig) -> FilterConfig:
+        """Copy a filter configuration, including its mutable lists."""
+        return replace(
+            filters,
+            excluded_conversation_ids=list(filters.excluded_conversation_ids),
+            excluded_topics=list(filters.excluded_topics)
+        )
+    
     def create_filter_from_exclusions(self, excluded_items: List[str]) -> FilterConfig:
         """
         Create a filter configuration from a list of excluded item IDs.
@@ -263,18 +454,13 @@ class FilterEngine:
         excluded_topics = []
         
         for item_id in excluded_items:
-            if item_id.startswith("conversation_"):
-                # Extract conversation ID
-                conversation_id = item_id.replace("conversation_", "")
-                excluded_conversations.append(conversation_id)
-            elif item_id.startswith("project_"):
-                # Extract project name as topic
-                project_name = item_id.replace("project_", "")
-                excluded_topics.append(project_name)
-            elif item_id.startswith("domain_") or item_id.startswith("language_") or item_id.startswith("framework_") or item_id.startswith("tool_"):
-                # Extract technical topic
-                topic = item_id.split("_", 1)[1]
-                excluded_topics.append(topic)
+            # Split off the item type; the rest is the conversation ID or topic
+            prefix, _, value = item_id.partition("_")
+            kind = self.ITEM_ID_KINDS.get(prefix)
+            if kind == "conversation":
+                excluded_conversations.append(value)
+            elif kind == "topic":
+                excluded_topics.append(value)
         
         return FilterConfig(
             excluded_conversation_ids=excluded_conversations,
@@ -298,61 +484,45 @@ class FilterEngine:
         if not filters.excluded_conversation_ids:
             return conversations
         
-        filtered_conversations = []
-        excluded_ids_set = set(filters.excluded_conversation_ids)
-        
-        for conversation in conversations:
-            if conversation.id not in excluded_ids_set:
-                filtered_conversations.append(conversation)
-        
-        return filtered_conversations
+        excluded_ids = frozenset(filters.excluded_conversation_ids)
+        return [conversation for conversation in conversations if conversation.id not in excluded_ids]
     
-    def _filter_projects(self, projects: List[ProjectBrief], filters: FilterConfig) -> List[ProjectBrief]:
+    def _filter_projects(self, projects: List[ProjectBrief], filters: _CompiledFilters) -> List[ProjectBrief]:
         """Filter projects based on filter configuration."""
         filtered_projects = []
+        min_relevance_score = filters.min_relevance_score
+        date_range = filters.date_range
         
+        # The numeric checks run first so that only projects passing them
+        # pay for the topic matching over names, tech stacks and challenges
         for project in projects:
-            # Check if project should be excluded
-            if self._should_exclude_project(project, filters):
-                continue
-            
             # Check relevance score threshold
-            if project.relevance_score < filters.min_relevance_score:
+            if project.relevance_score < min_relevance_score:
                 continue
             
             # Check date range
-            if filters.date_range:
-                start_date, end_date = filters.date_range
-                if not (start_date <= project.last_discussed <= end_date):
-                    continue
+            if date_range and not (date_range[0] <= project.last_discussed <= date_range[1]):
+                continue
+            
+            # Check if project should be excluded
+            if self._should_exclude_project(project, filters):
+                continue
             
             filtered_projects.append(project)
         
         return filtered_projects
     
-    def _filter_technical_context(self, technical_context: TechnicalContext, filters: FilterConfig) -> TechnicalContext:
+    def _filter_technical_context(self, technical_context: TechnicalContext, filters: _CompiledFilters) -> TechnicalContext:
         """Filter technical context based on excluded topics."""
+        excludes_topic = filters.excludes_topic
         
-        # Create lists excluding filtered topics
-        filtered_languages = [
-            lang for lang in technical_context.languages
-            if not self._is_topic_excluded(lang, filters.excluded_topics)
-        ]
-        
-        filtered_frameworks = [
-            fw for fw in technical_context.frameworks
-            if not self._is_topic_excluded(fw, filters.excluded_topics)
-        ]
-        
-        filtered_tools = [
-            tool for tool in technical_context.tools
-            if not self._is_topic_excluded(tool, filters.excluded_topics)
-        ]
+        def keep(topics: List[str]) -> List[str]:
+            return list(filterfalse(excludes_topic, topics))
         
-        filtered_domains = [
-            domain for domain in technical_context.domains
-            if not self._is_topic_excluded(domain, filters.excluded_topics)
-        ]
+        filtered_languages = keep(technical_context.languages)
+        filtered_frameworks = keep(technical_context.frameworks)
+        filtered_tools = keep(technical_context.tools)
+        filtered_domains = keep(technical_context.domains)
         
         return TechnicalContext(
             languages=filtered_languages,
@@ -361,34 +531,24 @@ class FilterEngine:
             domains=filtered_domains
         )
     
-    def _should_exclude_project(self, project: ProjectBrief, filters: FilterConfig) -> bool:
+    def _should_exclude_project(self, project: ProjectBrief, filters: _CompiledFilters) -> bool:
         """Check if a project should be excluded based on filters."""
         # Check if project name is in excluded topics
-        if self._is_topic_excluded(project.name, filters.excluded_topics):
+        if filters.excludes_topic(project.name):
             return True
         
         # Check if any of the project's tech stack is excluded
         for tech in project.tech_stack:
-            if self._is_topic_excluded(tech, filters.excluded_topics):
+            if filters.excludes_topic(tech):
                 return True
         
         # Check if any key challenges mention excluded topics
         for challenge in project.key_challenges:
-            if self._is_topic_excluded(challenge, filters.excluded_topics):
+            if filters.excludes_topic(challenge):
                 return True
         
         return False
     
-    def _is_topic_excluded(self, item: str, excluded_topics: List[str]) -> bool:
-        """Check if an item matches any excluded topic (case-insensitive)."""
-        item_lower = item.lower()
-        for excluded_topic in excluded_topics:
-            excluded_lower = excluded_topic.lower()
-            # Check for exact match or if the excluded topic is contained in the item
-            if excluded_lower == item_lower or excluded_lower in item_lower:
-                return True
-        return False
-    
     def get_filter_summary(self, original_context: UniversalContextPack, filtered_context: UniversalContextPack) -> Dict[str, Any]:
         """
         Generate a summary of what was filtered out.
@@ -400,12 +560,14 @@ class FilterEngine:
         Returns:
             Dictionary with filtering statistics
         """
+        kept_names = {fp.name for fp in filtered_context.projects}
+        
         return {
             "projects_removed": len(original_context.projects) - len(filtered_context.projects),
             "projects_remaining": len(filtered_context.projects),
             "removed_project_names": [
                 p.name for p in original_context.projects 
-                if p.name not in [fp.name for fp in filtered_context.projects]
+                if p.name not in kept_names
             ],
             "filter_applied_at": filtered_context.metadata.get("filter_applied_at"),
             "coherence_maintained": len(filtered_context.projects) > 0  # Simple coherence check
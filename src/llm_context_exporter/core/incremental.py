@@ -11,7 +11,9 @@ from datetime import datetime
 from typing import List, Dict, Any, Optional, Tuple, Set
 from pathlib import Path
 import hashlib
+import itertools
 
+from . import serialization
 from .models import (
     Conversation,
     UniversalContextPack,
@@ -259,8 +261,7 @@ class IncrementalUpdater:
         history = []
         if history_file.exists():
             try:
-                with open(history_file, 'r') as f:
-                    history = json.load(f)
+                history = serialization.load_file(history_file)
             except (json.JSONDecodeError, IOError):
                 # If file is corrupted, start fresh
                 history = []
@@ -284,8 +285,7 @@ class IncrementalUpdater:
         
         # Save updated history
         os.makedirs(output_dir, exist_ok=True)
-        with open(history_file, 'w') as f:
-            json.dump(history, f, indent=2, default=str)
+        serialization.dump_file(history, history_file)
     
     def load_previous_context(self, context_path: str) -> Optional[UniversalContextPack]:
         """
@@ -301,8 +301,7 @@ class IncrementalUpdater:
             return None
         
         try:
-            with open(context_path, 'r') as f:
-                data = json.load(f)
+            data = serialization.load_file(context_path)
             
             # Convert datetime strings back to datetime objects
             data['created_at'] = datetime.fromisoformat(data['created_at'])
@@ -329,6 +328,45 @@ class IncrementalUpdater:
             print(f"Error loading previous context: {e}")
             return None
     
+    def save_parsed_export(self, parsed_export: ParsedExport, output_path: str) -> None:
+        """
+        Save a parsed export for comparison by a later incremental update.
+        
+        The file is newline-delimited JSON: a header line with the export's
+        format version, date and metadata, then one line per conversation, so
+        it can be streamed back without loading the whole export.
+        
+        Args:
+            parsed_export: The parsed export to save
+            output_path: Path where to save the export
+        """
+        header = {
+            "format_version": parsed_export.format_version,
+            "export_date": parsed_export.export_date.isoformat(),
+            "metadata": parsed_export.metadata
+        }
+        conversations = (
+            {
+                "id": conv.id,
+                "title": conv.title,
+                "created_at": conv.created_at.isoformat(),
+                "updated_at": conv.updated_at.isoformat(),
+                "messages": [
+                    {
+                        "role": msg.role,
+                        "content": msg.content,
+                        "timestamp": msg.timestamp.isoformat(),
+                        "metadata": msg.metadata
+                    }
+                    for msg in conv.messages
+                ]
+            }
+            for conv in parsed_export.conversations
+        )
+        
+        os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+        serialization.dump_lines(itertools.chain([header], conversations), output_path)
+    
     def save_context_pack(self, context: UniversalContextPack, output_path: str) -> None:
         """
         Save a context pack to JSON file.
@@ -337,49 +375,12 @@ class IncrementalUpdater:
             context: The context pack to save
             output_path: Path where to save the context pack
         """
-        # Convert to dictionary for JSON serialization
-        data = {
-            "version": context.version,
-            "created_at": context.created_at.isoformat(),
-            "source_platform": context.source_platform,
-            "user_profile": {
-                "role": context.user_profile.role,
-                "expertise_areas": context.user_profile.expertise_areas,
-                "background_summary": context.user_profile.background_summary
-            },
-            "projects": [
-                {
-                    "name": p.name,
-                    "description": p.description,
-                    "tech_stack": p.tech_stack,
-                    "key_challenges": p.key_challenges,
-                    "current_status": p.current_status,
-                    "last_discussed": p.last_discussed.isoformat(),
-                    "relevance_score": p.relevance_score
-                }
-                for p in context.projects
-            ],
-            "preferences": {
-                "coding_style": context.preferences.coding_style,
-                "communication_style": context.preferences.communication_style,
-                "preferred_tools": context.preferences.preferred_tools,
-                "work_patterns": context.preferences.work_patterns
-            },
-            "technical_context": {
-                "languages": context.technical_context.languages,
-                "frameworks": context.technical_context.frameworks,
-                "tools": context.technical_context.tools,
-                "domains": context.technical_context.domains
-            },
-            "metadata": context.metadata
-        }
-        
         # Ensure output directory exists
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
         
-        # Save to file
-        with open(output_path, 'w') as f:
-            json.dump(data, f, indent=2, default=str)
+        # Save to file. The dataclasses are serialized directly, with
+        # datetimes written as ISO 8601 strings.
+        serialization.dump_file(context, output_path)
     
     def _conversation_updated(self, current: Conversation, previous: Conversation) -> bool:
         """Check if a conversation has been updated since the previous export."""
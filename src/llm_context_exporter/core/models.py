@@ -13,7 +13,7 @@ from enum import Enum
 
 # Input Models (from parsing)
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     """Individual message in a conversation."""
     role: str  # 'user' or 'assistant'
@@ -22,7 +22,7 @@ class Message:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class Conversation:
     """Single conversation thread."""
     id: str
@@ -139,6 +139,15 @@ class FilterConfig:
     excluded_topics: List[str] = field(default_factory=list)
     date_range: Optional[Tuple[datetime, datetime]] = None
     min_relevance_score: float = 0.0
+    
+    def is_noop(self) -> bool:
+        """Check if these filters exclude nothing (relevance scores are never negative)."""
+        return (
+            not self.excluded_conversation_ids
+            and not self.excluded_topics
+            and self.date_range is None
+            and self.min_relevance_score <= 0.0
+        )
 
 
 @dataclass
@@ -152,6 +161,7 @@ class ExportConfig:
     interactive: bool = False
     incremental: bool = False
     previous_context_path: Optional[str] = None
+    workers: int = 1  # Processes used for context extraction
 
 
 # Enums for better type safety
@@ -0,0 +1,138 @@
+"""
+JSON serialization helpers for context packs and saved exports.
+
+Uses orjson (and ciso8601 for timestamps) when installed and falls back to
+the standard library otherwise. Both paths read and write UTF-8 bytes so files produced by one
+can always be read by the other.
+"""
+
+import json
+from dataclasses import fields, is_dataclass
+from datetime import date, datetime, time
+from enum import Enum
+from typing import Any, Iterable, Iterator
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+try:
+    from ciso8601 import parse_datetime as _parse_datetime
+except ImportError:  # pragma: no cover - ciso8601 is an optional speedup
+    _parse_datetime = datetime.fromisoformat
+
+
+def _default(obj: Any) -> Any:
+    """Convert values the json module can't encode, the way orjson does."""
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: getattr(obj, f.name) for f in fields(obj)}
+    if isinstance(obj, (date, time)):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    return str(obj)
+
+
+def loads(data: bytes) -> Any:
+    """
+    Deserialize a JSON document.
+    
+    Args:
+        data: UTF-8 encoded JSON
+    
+    Returns:
+        The decoded Python object
+    
+    Raises:
+        ValueError: If the document is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Serialize an object to indented JSON.
+    
+    Dataclasses are written as objects and dates as ISO 8601 strings;
+    any other value JSON can't represent is written with str().
+    
+    Args:
+        obj: Object to serialize
+    
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            obj,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        )
+    return json.dumps(obj, indent=2, default=_default).encode('utf-8')
+
+
+def parse_datetime(value: str) -> datetime:
+    """
+    Parse an ISO 8601 timestamp as written by isoformat().
+    
+    Args:
+        value: Timestamp string
+    
+    Returns:
+        The parsed datetime, naive unless the string carries an offset
+    
+    Raises:
+        ValueError: If the string is not a valid timestamp
+    """
+    return _parse_datetime(value)
+
+
+def load_file(path: str) -> Any:
+    """Read and deserialize a JSON file."""
+    with open(path, 'rb') as f:
+        return loads(f.read())
+
+
+def dump_file(obj: Any, path: str) -> None:
+    """Serialize an object to a JSON file."""
+    with open(path, 'wb') as f:
+        f.write(dumps(obj))
+
+
+def dump_lines(objects: Iterable[Any], path: str) -> None:
+    """
+    Write objects as newline-delimited JSON, one compact document per line.
+    
+    Args:
+        objects: Objects to serialize, consumed one at a time
+        path: Output file path
+    """
+    with open(path, 'wb') as f:
+        for obj in objects:
+            if orjson is not None:
+                f.write(orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS))
+            else:
+                f.write(json.dumps(obj, separators=(',', ':'), default=_default).encode('utf-8'))
+            f.write(b"\n")
+
+
+def iter_lines(path: str) -> Iterator[Any]:
+    """
+    Stream the documents of a newline-delimited JSON file.
+    
+    Only one line is held in memory at a time, so files far larger than
+    memory can be processed. Blank lines are skipped.
+    
+    Args:
+        path: Path to the file
+        
+    Yields:
+        Each decoded document in file order
+    """
+    with open(path, 'rb') as f:
+        for line in f:
+            if line.strip():
+                yield loads(line)
@@ -39,21 +39,21 @@ class GeminiFormatter(PlatformFormatter):
             SizeLimitExceededError: If output exceeds platform limits
         """
         try:
-            # Check if we need to prioritize content
-            size_check = self.check_size_constraints(context)
+            # Render once; the rendered text is both the size check and the
+            # output, so it is only regenerated if content was prioritized
             working_context = context
+            formatted_text = self._generate_formatted_text(context)
             
-            if not size_check["fits"]:
+            if len(formatted_text) > self.MAX_TEXT_LENGTH:
                 working_context = self.prioritize_content(context, self.RECOMMENDED_LENGTH)
                 # Re-check after prioritization
-                new_size_check = self.check_size_constraints(working_context)
-                if not new_size_check["fits"]:
+                formatted_text = self._generate_formatted_text(working_context)
+                if len(formatted_text) > self.MAX_TEXT_LENGTH:
                     raise SizeLimitExceededError(
                         f"Context still too large after prioritization: "
-                        f"{new_size_check['current_size']} > {self.MAX_TEXT_LENGTH}"
+                        f"{len(formatted_text)} > {self.MAX_TEXT_LENGTH}"
                     )
             
-            formatted_text = self._generate_formatted_text(working_context)
             gem_description = self._generate_gem_description(working_context)
             instructions = self._generate_instructions(gem_description)
             validation_tests = self._generate_validation_tests(working_context)
@@ -4,7 +4,7 @@ Ollama formatter implementation.
 This module formats UniversalContextPack data for Ollama Modelfiles.
 """
 
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 from ..models.core import UniversalContextPack
 from ..models.output import OllamaOutput, ValidationSuite
 from ..validation.generator import ValidationGenerator
@@ -39,15 +39,16 @@ class OllamaFormatter(PlatformFormatter):
             SizeLimitExceededError: If output exceeds platform limits
         """
         try:
-            # Check if context needs to be split due to size constraints
-            size_check = self.check_size_constraints(context)
+            # Check if context needs to be split due to size constraints. The
+            # prompt rendered for the check is reused for the Modelfile.
+            system_prompt = self._generate_system_prompt(context)
             
-            if not size_check["fits"]:
+            if len(system_prompt) > self.MAX_SYSTEM_PROMPT_LENGTH:
                 # Split large context into base Modelfile and supplementary files
                 modelfile_content, supplementary_files = self.split_large_context(context, base_model)
             else:
                 # Generate standard Modelfile
-                modelfile_content = self._generate_modelfile(context, base_model)
+                modelfile_content = self._generate_modelfile(context, base_model, system_prompt)
                 supplementary_files = {}
             
             setup_commands = self._generate_setup_commands(base_model)
@@ -155,9 +156,11 @@ class OllamaFormatter(PlatformFormatter):
         
         return trimmed_context
     
-    def _generate_modelfile(self, context: UniversalContextPack, base_model: str) -> str:
-        """Generate the Modelfile content."""
-        system_prompt = self._generate_system_prompt(context)
+    def _generate_modelfile(self, context: UniversalContextPack, base_model: str,
+                            system_prompt: Optional[str] = None) -> str:
+        """Generate the Modelfile content, reusing an already rendered system prompt."""
+        if system_prompt is None:
+            system_prompt = self._generate_system_prompt(context)
         
         # Escape quotes in the system prompt
         escaped_prompt = system_prompt.replace('"""', '\\"\\"\\"').replace('"', '\\"')
@@ -50,6 +50,7 @@ class ExportConfig(BaseModel):
     interactive: bool = Field(default=False, description="Enable interactive filtering mode")
     incremental: bool = Field(default=False, description="Enable incremental update mode")
     previous_context_path: Optional[str] = Field(None, description="Path to previous context for incremental updates")
+    workers: int = Field(default=1, ge=1, description="Number of processes used for context extraction")
     
     @field_validator('input_path')
     @classmethod
@@ -27,6 +27,16 @@ class PlatformParser(ABC):
     to handle their specific export formats.
     """
     
+    def __init__(self, force_version: Optional[str] = None):
+        """
+        Initialize the parser.
+        
+        Args:
+            force_version: Format version to parse with instead of detecting it,
+                used for backward-compatible fallback parsing
+        """
+        self._force_version = force_version
+    
     @abstractmethod
     def parse_export(self, file_path: str) -> ParsedExport:
         """
@@ -71,6 +81,21 @@ class PlatformParser(ABC):
         """
         pass
     
+    def detect_format_version_from_header(self, header: bytes) -> Optional[str]:
+        """
+        Detect the export format version from the first bytes of the file.
+        
+        Parsers that can recognize their format from a header override this
+        so callers that already read the header avoid reopening the file.
+        
+        Args:
+            header: Leading bytes of the export file
+            
+        Returns:
+            Format version string, or None if the header is not enough to decide
+        """
+        return None
+    
     def validate_file(self, file_path: str) -> bool:
         """
         Validate that the file can be parsed by this parser.
@@ -47,36 +47,40 @@ class ChatGPTParser(PlatformParser):
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"Export file not found: {file_path}")
         
-        compatibility_manager = CompatibilityManager()
-        
         try:
-            # Get detailed format diagnostics
-            diagnostic = compatibility_manager.detect_format_with_diagnostics(file_path, self.__class__)
-            
-            # Log diagnostic information
-            if diagnostic.issues:
-                for issue in diagnostic.issues:
-                    print(f"Warning: {issue}")
-            
-            # Handle different compatibility levels
-            if diagnostic.compatibility_level == CompatibilityLevel.UNSUPPORTED:
-                raise UnsupportedFormatError(
-                    f"Unsupported format version: {diagnostic.detected_version}. "
-                    f"Suggestions: {'; '.join(diagnostic.suggestions)}"
-                )
-            
-            format_version = diagnostic.detected_version
-            
-            # Try fallback parsing if needed
-            if diagnostic.compatibility_level == CompatibilityLevel.BACKWARD_COMPATIBLE:
-                print(f"Attempting backward-compatible parsing with version {diagnostic.fallback_version}")
-                fallback_result = compatibility_manager.attempt_fallback_parsing(
-                    file_path, self.__class__, diagnostic.fallback_version
-                )
-                if fallback_result:
-                    return fallback_result
-                else:
-                    print("Fallback parsing failed, trying with detected version")
+            if self._force_version:
+                # Fallback parsing already settled on a version
+                format_version = self._force_version
+            else:
+                compatibility_manager = CompatibilityManager()
+                
+                # Get detailed format diagnostics
+                diagnostic = compatibility_manager.detect_format_with_diagnostics(file_path, self.__class__)
+                
+                # Log diagnostic information
+                if diagnostic.issues:
+                    for issue in diagnostic.issues:
+                        print(f"Warning: {issue}")
+                
+                # Handle different compatibility levels
+                if diagnostic.compatibility_level == CompatibilityLevel.UNSUPPORTED:
+                    raise UnsupportedFormatError(
+                        f"Unsupported format version: {diagnostic.detected_version}. "
+                        f"Suggestions: {'; '.join(diagnostic.suggestions)}"
+                    )
+                
+                format_version = diagnostic.detected_version
+                
+                # Try fallback parsing if needed
+                if diagnostic.compatibility_level == CompatibilityLevel.BACKWARD_COMPATIBLE:
+                    print(f"Attempting backward-compatible parsing with version {diagnostic.fallback_version}")
+                    fallback_result = compatibility_manager.attempt_fallback_parsing(
+                        file_path, self.__class__, diagnostic.fallback_version
+                    )
+                    if fallback_result:
+                        return fallback_result
+                    else:
+                        print("Fallback parsing failed, trying with detected version")
             
             # Parse based on file type
             if self._is_zip_file(file_path):
@@ -104,6 +108,9 @@ class ChatGPTParser(PlatformParser):
         Raises:
             ParseError: If version cannot be determined
         """
+        if self._force_version:
+            return self._force_version
+        
         try:
             if self._is_zip_file(file_path):
                 return self._detect_version_from_zip(file_path)
@@ -114,6 +121,24 @@ class ChatGPTParser(PlatformParser):
             # This provides backward compatibility
             return "unknown"
     
+    def detect_format_version_from_header(self, header: bytes) -> Optional[str]:
+        """
+        Detect the export format version from the first bytes of a JSON export.
+        
+        Args:
+            header: Leading bytes of the export file
+            
+        Returns:
+            Format version string, or None for ZIP archives, which need the
+            archive directory to locate the conversations file
+        """
+        if header.startswith(b'PK'):
+            return None
+        
+        # Match the 1024-character sample used by _detect_version_from_json
+        sample_data = header.decode('utf-8', errors='ignore')[:1024]
+        return self._infer_version_from_content(sample_data)
+    
     def get_supported_versions(self) -> List[str]:
         """Get list of supported format versions."""
         return self.SUPPORTED_VERSIONS.copy()
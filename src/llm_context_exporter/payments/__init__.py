@@ -0,0 +1,23 @@
+"""
+Payment and beta program APIs for the LLM Context Exporter.
+
+These live outside the core package so that context export does not load
+the payment stack.
+"""
+
+from ..models.payment import (
+    PaymentIntent,
+    BetaUser,
+    UsageStats,
+    Feedback,
+)
+
+from ..core.payment import PaymentManager
+
+__all__ = [
+    "PaymentIntent",
+    "BetaUser",
+    "UsageStats",
+    "Feedback",
+    "PaymentManager",
+]
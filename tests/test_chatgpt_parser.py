@@ -212,6 +212,17 @@ class TestChatGPTParser(TestCase):
         version = self.parser.detect_format_version(zip_file)
         self.assertEqual(version, "2023-06-01")
     
+    def test_format_version_detection_from_header(self):
+        """Test format version detection from an already-read file header."""
+        header = json.dumps([{"create_time": 123, "update_time": 456}]).encode('utf-8')
+        self.assertEqual(self.parser.detect_format_version_from_header(header), "2023-06-01")
+        
+        header = json.dumps([{"mapping": {"node-1": {}}}]).encode('utf-8')
+        self.assertEqual(self.parser.detect_format_version_from_header(header), "2024-01-01")
+        
+        # ZIP archives need the archive directory, so the header can't decide
+        self.assertIsNone(self.parser.detect_format_version_from_header(b'PK\x03\x04rest'))
+    
     def test_error_handling_file_not_found(self):
         """Test error handling for non-existent files."""
         with self.assertRaises(FileNotFoundError):
@@ -6,17 +6,27 @@ import pytest
 import tempfile
 import json
 import os
+import stat
+import time
+import subprocess
 from unittest.mock import patch, MagicMock
 from datetime import datetime
 
 from llm_context_exporter.core.compatibility import (
     CompatibilityManager, CompatibilityLevel, FormatDiagnostic, 
-    PlatformFeature, UnsupportedDataLog
+    PlatformFeature, UnsupportedDataLog, ParsedExportCache
 )
 from llm_context_exporter.parsers.chatgpt import ChatGPTParser
 from llm_context_exporter.core.models import ParsedExport, Conversation, Message
 
 
+def _ollama_side_effect(version_result, list_result):
+    """Dispatch mocked Ollama commands by argv, since the probes run concurrently."""
+    def run(command, **kwargs):
+        return version_result if "--version" in command else list_result
+    return run
+
+
 class TestCompatibilityManager:
     """Test the CompatibilityManager class."""
     
@@ -94,6 +104,73 @@ class TestCompatibilityManager:
         finally:
             os.unlink(temp_path)
     
+    def test_detect_format_with_diagnostics_is_memoized(self):
+        """Test that diagnostics are reused until the file changes."""
+        CompatibilityManager.clear_format_cache()
+        manager = CompatibilityManager()
+        
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            json.dump([{"id": "conv1", "title": "Test", "messages": []}], f)
+            temp_path = f.name
+        
+        try:
+            with patch.object(ChatGPTParser, 'detect_format_version_from_header', return_value="2024-01-01") as mock_detect:
+                first = manager.detect_format_with_diagnostics(temp_path, ChatGPTParser)
+                first.issues.append("caller-added issue")
+                second = CompatibilityManager().detect_format_with_diagnostics(temp_path, ChatGPTParser)
+                
+                assert mock_detect.call_count == 1
+                assert "caller-added issue" not in second.issues
+                
+                stat = os.stat(temp_path)
+                os.utime(temp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+                manager.detect_format_with_diagnostics(temp_path, ChatGPTParser)
+                
+                assert mock_detect.call_count == 2
+        finally:
+            os.unlink(temp_path)
+            CompatibilityManager.clear_format_cache()
+    
+    def test_detect_format_skips_structure_checks_when_fully_supported(self):
+        """Test that extension checks only run for supported files when deep diagnostics are on."""
+        CompatibilityManager.clear_format_cache()
+        manager = CompatibilityManager()
+        
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
+            json.dump([{"id": "conv1", "title": "Test", "mapping": {}}], f)
+            temp_path = f.name
+        
+        try:
+            with patch.dict(os.environ, {}, clear=False):
+                os.environ.pop("LLM_CTX_DEEP_DIAG", None)
+                diagnostic = manager.detect_format_with_diagnostics(temp_path, ChatGPTParser)
+            assert diagnostic.compatibility_level == CompatibilityLevel.FULLY_SUPPORTED
+            assert diagnostic.issues == []
+            
+            with patch.dict(os.environ, {"LLM_CTX_DEEP_DIAG": "1"}):
+                diagnostic = manager.detect_format_with_diagnostics(temp_path, ChatGPTParser)
+            assert "Unexpected file extension: .txt" in diagnostic.issues
+        finally:
+            os.unlink(temp_path)
+            CompatibilityManager.clear_format_cache()
+    
+    def test_analyze_file_structure_reuses_stat_and_header(self):
+        """Test that a known stat result and header avoid touching the file."""
+        manager = CompatibilityManager()
+        
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            f.write("[]")
+            temp_path = f.name
+        
+        try:
+            st = os.stat(temp_path)
+        finally:
+            os.unlink(temp_path)
+        
+        # The file is gone, so any read or stat would report an error
+        issues = manager._analyze_file_structure(temp_path, st=st, header=b"[]")
+        assert issues == []
+    
     def test_find_fallback_version(self):
         """Test fallback version detection."""
         manager = CompatibilityManager()
@@ -162,6 +239,70 @@ class TestCompatibilityManager:
         assert "Web Browsing" in feature_names
         assert "Code Interpreter" in feature_names
     
+    def test_identify_platform_features_overlapping_indicators(self):
+        """Test that indicators found inside or across other indicators are still detected."""
+        manager = CompatibilityManager()
+        
+        def export_with(*contents):
+            return ParsedExport(
+                format_version="2024-01-01",
+                export_date=datetime.now(),
+                conversations=[
+                    Conversation(
+                        id=f"conv{i}",
+                        title="Overlap Test",
+                        created_at=datetime.now(),
+                        updated_at=datetime.now(),
+                        messages=[
+                            Message(role="assistant", content=content, timestamp=datetime.now(), metadata={})
+                        ]
+                    )
+                    for i, content in enumerate(contents)
+                ],
+                metadata={}
+            )
+        
+        # "executed code" also implies the code execution hint
+        features = manager.identify_platform_features(export_with("I Executed Code for you."))
+        assert [f.name for f in features] == ["Code Interpreter"]
+        
+        # "plugin" and "in the file you shared" overlap on "in"
+        features = manager.identify_platform_features(export_with("Check the plugin the file you shared"))
+        assert [f.name for f in features] == ["Plugin Usage", "File Uploads"]
+        
+        assert manager.identify_platform_features(export_with("Nothing special here.")) == []
+    
+    def test_identify_platform_features_reuses_scan_for_same_export(self):
+        """Test that repeated calls for the same export skip rescanning messages."""
+        manager = CompatibilityManager()
+        parsed_export = ParsedExport(
+            format_version="2024-01-01",
+            export_date=datetime.now(),
+            conversations=[
+                Conversation(
+                    id="conv1",
+                    title="Cache Test",
+                    created_at=datetime.now(),
+                    updated_at=datetime.now(),
+                    messages=[
+                        Message(role="assistant", content="I browsed the web.", timestamp=datetime.now(), metadata={})
+                    ]
+                )
+            ],
+            metadata={}
+        )
+        
+        first = manager.identify_platform_features(parsed_export)
+        with patch('llm_context_exporter.core.compatibility._detect_feature_names') as mock_detect:
+            second = manager.identify_platform_features(parsed_export)
+        
+        mock_detect.assert_not_called()
+        assert [f.name for f in second] == [f.name for f in first] == ["Web Browsing"]
+        
+        # Callers mutating the returned list do not affect the cached result
+        second.clear()
+        assert len(manager.identify_platform_features(parsed_export)) == 1
+    
     def test_log_unsupported_data(self):
         """Test logging of unsupported data types."""
         manager = CompatibilityManager()
@@ -220,6 +361,16 @@ class TestCompatibilityManager:
         assert summary["total_types"] == 2
         assert summary["total_occurrences"] == 3
         assert len(summary["entries"]) == 2
+        
+        # Unchanged logs reuse the summary, handing out copies; new entries refresh it
+        summary["entries"].clear()
+        with patch.object(manager, '_build_unsupported_data_summary') as mock_build:
+            assert len(manager.get_unsupported_data_summary()["entries"]) == 2
+        mock_build.assert_not_called()
+        manager.log_unsupported_data("type2", "loc2", "reason2")
+        summary = manager.get_unsupported_data_summary()
+        assert summary["total_occurrences"] == 4
+        assert summary["entries"][1]["count"] == 2
     
     @patch('subprocess.run')
     @patch('shutil.which')
@@ -237,9 +388,10 @@ class TestCompatibilityManager:
         assert len(status_info["issues"]) > 0
         assert len(status_info["suggestions"]) > 0
     
+    @patch.object(CompatibilityManager, '_probe_ollama_daemon', return_value=True)
     @patch('subprocess.run')
     @patch('shutil.which')
-    def test_verify_ollama_installation_found_but_not_running(self, mock_which, mock_run):
+    def test_verify_ollama_installation_found_but_not_running(self, mock_which, mock_run, mock_probe):
         """Test Ollama verification when installed but not running."""
         mock_which.return_value = "/usr/local/bin/ollama"
         
@@ -252,7 +404,7 @@ class TestCompatibilityManager:
         list_result = MagicMock()
         list_result.returncode = 1
         
-        mock_run.side_effect = [version_result, list_result]
+        mock_run.side_effect = _ollama_side_effect(version_result, list_result)
         
         manager = CompatibilityManager()
         is_ready, status_info = manager.verify_ollama_installation()
@@ -264,9 +416,33 @@ class TestCompatibilityManager:
         assert status_info["version"] == "ollama version 0.1.0"
         assert "not running" in " ".join(status_info["issues"]).lower()
     
+    @patch.object(CompatibilityManager, '_probe_ollama_daemon', return_value=False)
+    @patch('subprocess.run')
+    @patch('shutil.which')
+    def test_verify_ollama_installation_daemon_unreachable(self, mock_which, mock_run, mock_probe):
+        """Test that an unreachable daemon is reported without running ollama list."""
+        mock_which.return_value = "/usr/local/bin/ollama"
+        
+        version_result = MagicMock()
+        version_result.returncode = 0
+        version_result.stdout = "ollama version 0.1.0"
+        mock_run.return_value = version_result
+        
+        manager = CompatibilityManager()
+        is_ready, status_info = manager.verify_ollama_installation()
+        
+        assert not is_ready
+        assert status_info["ollama_found"]
+        assert not status_info["ollama_running"]
+        assert status_info["version"] == "ollama version 0.1.0"
+        assert "not running" in " ".join(status_info["issues"]).lower()
+        mock_run.assert_called_once()
+        assert mock_run.call_args[0][0] == ["ollama", "--version"]
+    
+    @patch.object(CompatibilityManager, '_probe_ollama_daemon', return_value=True)
     @patch('subprocess.run')
     @patch('shutil.which')
-    def test_verify_ollama_installation_ready(self, mock_which, mock_run):
+    def test_verify_ollama_installation_ready(self, mock_which, mock_run, mock_probe):
         """Test Ollama verification when fully ready."""
         mock_which.return_value = "/usr/local/bin/ollama"
         
@@ -280,7 +456,7 @@ class TestCompatibilityManager:
         list_result.returncode = 0
         list_result.stdout = "NAME\tID\tSIZE\tMODIFIED\nqwen:latest\tabc123\t4.1GB\t2 days ago"
         
-        mock_run.side_effect = [version_result, list_result]
+        mock_run.side_effect = _ollama_side_effect(version_result, list_result)
         
         manager = CompatibilityManager()
         is_ready, status_info = manager.verify_ollama_installation()
@@ -292,6 +468,84 @@ class TestCompatibilityManager:
         assert status_info["version"] == "ollama version 0.1.0"
         assert len(status_info["issues"]) == 0
     
+    @patch.object(CompatibilityManager, '_probe_ollama_daemon', return_value=True)
+    @patch('subprocess.run')
+    @patch('shutil.which')
+    def test_verify_ollama_installation_reuses_recent_result(self, mock_which, mock_run, mock_probe):
+        """Test that a manager reuses its last verification until invalidated."""
+        mock_which.return_value = "/usr/local/bin/ollama"
+        
+        version_result = MagicMock()
+        version_result.returncode = 0
+        version_result.stdout = "ollama version 0.1.0"
+        
+        list_result = MagicMock()
+        list_result.returncode = 0
+        list_result.stdout = "NAME\tID\tSIZE\tMODIFIED\nqwen:latest\tabc123\t4.1GB\t2 days ago"
+        mock_run.side_effect = _ollama_side_effect(version_result, list_result)
+        
+        manager = CompatibilityManager()
+        _, first_status = manager.verify_ollama_installation()
+        first_status["issues"].append("caller-added issue")
+        is_ready, second_status = manager.verify_ollama_installation()
+        
+        assert is_ready
+        assert mock_run.call_count == 2
+        assert second_status["issues"] == []
+        
+        manager.invalidate_ollama_cache()
+        manager.verify_ollama_installation()
+        assert mock_run.call_count == 4
+    
+    @patch.object(CompatibilityManager, '_probe_ollama_daemon', return_value=True)
+    @patch('subprocess.run')
+    @patch('shutil.which')
+    def test_verify_ollama_installation_uses_status_cache(self, mock_which, mock_run, mock_probe):
+        """Test that cached Ollama probe results skip the subprocess calls."""
+        mock_which.return_value = "/usr/local/bin/ollama"
+        
+        version_result = MagicMock()
+        version_result.returncode = 0
+        version_result.stdout = "ollama version 0.1.0"
+        
+        list_result = MagicMock()
+        list_result.returncode = 0
+        list_result.stdout = "NAME\tID\tSIZE\tMODIFIED\nqwen:latest\tabc123\t4.1GB\t2 days ago"
+        
+        mock_run.side_effect = _ollama_side_effect(version_result, list_result)
+        
+        with tempfile.TemporaryDirectory() as cache_dir:
+            with patch('llm_context_exporter.core.compatibility.CACHE_DIR', cache_dir):
+                first_ready, _ = CompatibilityManager(cache_ollama_status=True).verify_ollama_installation()
+                second_ready, status_info = CompatibilityManager(cache_ollama_status=True).verify_ollama_installation()
+        
+        assert first_ready and second_ready
+        assert mock_run.call_count == 2
+        assert status_info["version"] == "ollama version 0.1.0"
+        assert status_info["qwen_available"]
+    
+    @patch.object(CompatibilityManager, '_probe_ollama_daemon', return_value=True)
+    @patch('subprocess.run')
+    @patch('shutil.which')
+    def test_verify_ollama_installation_falls_back_to_stale_cache(self, mock_which, mock_run, mock_probe):
+        """Test that a stale cache entry is used when the probes fail."""
+        mock_which.return_value = "/usr/local/bin/ollama"
+        
+        with tempfile.TemporaryDirectory() as cache_dir:
+            with patch('llm_context_exporter.core.compatibility.CACHE_DIR', cache_dir):
+                manager = CompatibilityManager(cache_ollama_status=True)
+                cache_key = "/usr/local/bin/ollama|" + os.environ.get('OLLAMA_HOST', '')
+                manager._status_cache.put("version", cache_key, {"version": "ollama version 0.1.0"})
+                manager._status_cache.put("service", cache_key, {"running": True, "qwen_available": True})
+                
+                with patch('llm_context_exporter.core.compatibility.time.time', return_value=time.time() + 2 * 86400):
+                    mock_run.side_effect = subprocess.TimeoutExpired(cmd="ollama", timeout=10)
+                    is_ready, status_info = manager.verify_ollama_installation()
+        
+        assert is_ready
+        assert status_info["version"] == "ollama version 0.1.0"
+        assert status_info["issues"] == []
+    
     def test_generate_compatibility_report(self):
         """Test generation of comprehensive compatibility report."""
         manager = CompatibilityManager()
@@ -354,6 +608,58 @@ class TestCompatibilityManager:
         
         # Check recommendations
         assert len(report["recommendations"]) > 0
+    
+    @patch('shutil.which')
+    def test_generate_multi_platform_report(self, mock_which):
+        """Test that a multi-platform report scans the export only once."""
+        mock_which.return_value = None
+        manager = CompatibilityManager()
+        
+        parsed_export = ParsedExport(
+            format_version="2024-01-01",
+            export_date=datetime.now(),
+            conversations=[
+                Conversation(
+                    id="conv1",
+                    title="Test with web browsing",
+                    created_at=datetime.now(),
+                    updated_at=datetime.now(),
+                    messages=[
+                        Message(
+                            role="assistant",
+                            content="I browsed the web to find this information.",
+                            timestamp=datetime.now(),
+                            metadata={}
+                        )
+                    ]
+                )
+            ],
+            metadata={}
+        )
+        
+        with patch.object(manager, 'identify_platform_features',
+                          wraps=manager.identify_platform_features) as mock_identify:
+            report = manager.generate_multi_platform_report(parsed_export, ["gemini", "ollama"])
+        
+        assert mock_identify.call_count == 1
+        assert report["gemini_status"]["ready"] is True
+        assert report["ollama_status"]["ready"] is False
+        assert report["export_info"]["conversations_count"] == 1
+        assert any(f["name"] == "Web Browsing" for f in report["platform_features"])
+        
+        gemini_report = manager.generate_compatibility_report(parsed_export, "gemini")
+        ollama_report = manager.generate_compatibility_report(parsed_export, "ollama")
+        assert report["recommendations"] == (
+            gemini_report["recommendations"] + ollama_report["recommendations"]
+        )
+        
+        # Reports share nothing with the cached analysis
+        report["export_info"]["conversations_count"] = 999
+        report["platform_features"].clear()
+        gemini_report["platform_features"][0]["name"] = "Changed"
+        fresh_report = manager.generate_compatibility_report(parsed_export, "gemini")
+        assert fresh_report["export_info"]["conversations_count"] == 1
+        assert [f["name"] for f in fresh_report["platform_features"]] == ["Web Browsing"]
 
 
 class TestCompatibilityIntegration:
@@ -437,4 +743,91 @@ class TestCompatibilityIntegration:
             assert len(parsed_export.conversations[0].messages) == 1
             
         finally:
-            os.unlink(temp_path)
\ No newline at end of file
+            os.unlink(temp_path)
+    
+    def test_attempt_fallback_parsing_uses_forced_version(self):
+        """Test that fallback parsing passes the version to the parser instead of re-detecting it."""
+        test_export = [
+            {
+                "id": "conv1",
+                "title": "Test Conversation",
+                "messages": [{"role": "user", "content": "Hello", "timestamp": 1640995200}]
+            }
+        ]
+        
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            json.dump(test_export, f)
+            temp_path = f.name
+        
+        try:
+            manager = CompatibilityManager()
+            with patch.object(CompatibilityManager, 'detect_format_with_diagnostics') as mock_detect:
+                parsed_export = manager.attempt_fallback_parsing(temp_path, ChatGPTParser, "2023-06-01")
+            
+            mock_detect.assert_not_called()
+            assert parsed_export.format_version == "2023-06-01"
+            assert ChatGPTParser(force_version="2023-06-01").detect_format_version(temp_path) == "2023-06-01"
+            
+        finally:
+            os.unlink(temp_path)
+
+
+class TestParsedExportCache:
+    """Test the on-disk parse result cache."""
+    
+    def _write_export(self, directory):
+        export_path = os.path.join(directory, "conversations.json")
+        with open(export_path, 'w') as f:
+            json.dump([{"id": "conv1", "title": "Test", "messages": []}], f)
+        return export_path
+    
+    def test_round_trip_and_invalidation(self):
+        """Test that entries are returned until the export file changes."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            export_path = self._write_export(temp_dir)
+            cache = ParsedExportCache(os.path.join(temp_dir, "cache"))
+            diagnostic = FormatDiagnostic(
+                detected_version="2024-01-01",
+                compatibility_level=CompatibilityLevel.FULLY_SUPPORTED,
+                confidence=1.0,
+                issues=[],
+                suggestions=[]
+            )
+            
+            assert cache.get(export_path, "ChatGPTParser") is None
+            cache.put(export_path, "ChatGPTParser", diagnostic, {"conversations": 1})
+            
+            cached_diagnostic, parsed_export = cache.get(export_path, "ChatGPTParser")
+            assert cached_diagnostic == diagnostic
+            assert parsed_export == {"conversations": 1}
+            assert cache.get(export_path, "OtherParser") is None
+            
+            stat = os.stat(export_path)
+            os.utime(export_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+            assert cache.get(export_path, "ChatGPTParser") is None
+    
+    def test_put_restricts_existing_cache_dir(self):
+        """Test that an existing cache directory is made private to the current user."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            export_path = self._write_export(temp_dir)
+            cache_dir = os.path.join(temp_dir, "cache")
+            os.makedirs(cache_dir, mode=0o755)
+            os.chmod(cache_dir, 0o755)
+            
+            ParsedExportCache(cache_dir).put(export_path, "ChatGPTParser", None, {"conversations": 1})
+            
+            assert stat.S_IMODE(os.stat(cache_dir).st_mode) == 0o700
+    
+    def test_sweep_removes_expired_entries(self):
+        """Test that old entries are removed when sweeping."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            export_path = self._write_export(temp_dir)
+            cache = ParsedExportCache(os.path.join(temp_dir, "cache"))
+            cache.put(export_path, "ChatGPTParser", None, {"conversations": 1})
+            
+            with patch('llm_context_exporter.core.compatibility.time.time',
+                       return_value=time.time() + 30 * 86400):
+                cache.sweep()
+            
+            assert os.listdir(cache.cache_dir) == []
+            assert cache.get(export_path, "ChatGPTParser") is None
@@ -7,6 +7,8 @@ from conversation history.
 """
 
 import pytest
+from collections import Counter
+from unittest.mock import patch
 from datetime import datetime, timedelta
 from llm_context_exporter.core.extractor import ContextExtractor
 from llm_context_exporter.core.models import (
@@ -419,4 +421,88 @@ class TestContextExtractor:
         
         assert preferences.coding_style.get("primary_language") == "Python"
         assert preferences.coding_style.get("paradigm") == "functional"
-        assert preferences.coding_style.get("testing_approach") == "test-driven"
\ No newline at end of file
+        assert preferences.coding_style.get("testing_approach") == "test-driven"
+    
+    def test_technology_scan_matches_separate_patterns(self):
+        """Test that the single-pass scan finds the same mentions as the separate patterns."""
+        text = "Python and python with Django, c++ in VS Code, postgresql not postgres-ish, React and git/github"
+        
+        mentions = self.extractor._scan_technologies(text)
+        
+        assert mentions["language"] == Counter(self.extractor.language_patterns.findall(text))
+        assert mentions["framework"] == Counter(self.extractor.framework_patterns.findall(text))
+        assert mentions["tool"] == Counter(self.extractor.tool_patterns.findall(text))
+        assert mentions["language"]["Python"] == 1 and mentions["language"]["python"] == 1
+    
+    def test_extract_context_builds_and_scans_user_text_once(self):
+        """Test that the extractors share one joined user text and one technology scan."""
+        conversations = [
+            Conversation(
+                id="conv1",
+                title="API work",
+                created_at=datetime.now(),
+                updated_at=datetime.now(),
+                messages=[
+                    Message(role="user", content="I'm a developer using Python and Flask with git",
+                            timestamp=datetime.now())
+                ]
+            ),
+            Conversation(
+                id="conv2",
+                title="Deployment",
+                created_at=datetime.now(),
+                updated_at=datetime.now(),
+                messages=[
+                    Message(role="user", content="Deploying the Flask app", timestamp=datetime.now())
+                ]
+            )
+        ]
+        
+        shared_texts = []
+        get_user_messages_text = self.extractor._get_user_messages_text
+        
+        def record_shared_text(*args, **kwargs):
+            text = get_user_messages_text(*args, **kwargs)
+            shared_texts.append(text)
+            return text
+        
+        with patch.object(self.extractor, '_get_user_messages_text',
+                          side_effect=record_shared_text) as mock_text, \
+                patch.object(self.extractor, 'technology_patterns',
+                             wraps=self.extractor.technology_patterns) as mock_patterns:
+            context_pack = self.extractor.extract_context(conversations)
+        
+        assert mock_text.call_count == 1
+        scanned_texts = [call.args[0] for call in mock_patterns.finditer.call_args_list]
+        assert sum(text is shared_texts[0] for text in scanned_texts) == 1
+        assert context_pack.technical_context.languages == ["Python"]
+        assert context_pack.technical_context.tools == ["git"]
+        assert self.extractor._shared_scan is None
+    
+    def test_challenges_are_first_three_distinct(self):
+        """Test that challenges keep the first three distinct matches in message order."""
+        contents = [
+            "I have a problem with caching",
+            "There is a bug in the parser",
+            "There is a bug in the parser",
+            "I keep failing to deploy",
+            "Another issue with logging",
+        ]
+        conversations = [
+            Conversation(
+                id="conv1",
+                title="Backend",
+                created_at=datetime.now(),
+                updated_at=datetime.now(),
+                messages=[Message(role="user", content=content, timestamp=datetime.now())
+                          for content in contents]
+            )
+        ]
+        
+        challenges = self.extractor._extract_challenges_from_conversations(conversations)
+        
+        assert challenges == [
+            "I have a problem with caching",
+            "There is a bug in the parser",
+            "I keep failing to deploy",
+        ]
@@ -0,0 +1,306 @@
+"""
+Tests for the export handler.
+
+This module tests how ExportHandler coordinates incremental updates
+against a previously saved export.
+"""
+
+import pytest
+import json
+import os
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from llm_context_exporter.core.export_handler import ExportHandler
+from llm_context_exporter.core.models import (
+    Conversation,
+    Message,
+    ParsedExport,
+    ExportConfig,
+    FilterConfig,
+    OllamaOutput,
+    ValidationQuestion,
+    ValidationSuite,
+    UniversalContextPack,
+    UserProfile,
+    UserPreferences,
+    TechnicalContext,
+)
+
+
+def _conversation(conv_id, content, updated_at, message_count=1):
+    """Build a conversation with the given number of identical messages."""
+    return Conversation(
+        id=conv_id,
+        title=f"Conversation {conv_id}",
+        created_at=updated_at - timedelta(days=1),
+        updated_at=updated_at,
+        messages=[
+            Message(role="user", content=content, timestamp=updated_at, metadata={})
+            for _ in range(message_count)
+        ]
+    )
+
+
+def _conversation_data(conversation):
+    """Serialize a conversation the way parsed_export.json stores it."""
+    return {
+        "id": conversation.id,
+        "title": conversation.title,
+        "created_at": conversation.created_at.isoformat(),
+        "updated_at": conversation.updated_at.isoformat(),
+        "messages": [
+            {
+                "role": msg.role,
+                "content": msg.content,
+                "timestamp": msg.timestamp.isoformat(),
+                "metadata": msg.metadata
+            }
+            for msg in conversation.messages
+        ]
+    }
+
+
+class TestExportHandler:
+    """Test cases for the ExportHandler class."""
+    
+    @pytest.fixture
+    def handler(self):
+        """Create an ExportHandler instance for testing."""
+        return ExportHandler()
+    
+    @pytest.fixture(params=["json", "ndjson"])
+    def previous_dir(self, request, tmp_path, handler):
+        """Save a previous context pack and parsed export, returning their directory."""
+        now = datetime(2024, 1, 10)
+        previous_conversations = [
+            _conversation("unchanged", "I use Python and Django", now),
+            _conversation("updated", "I use React", now - timedelta(days=2)),
+            _conversation("deleted", "I use Go", now),
+        ]
+        
+        context = handler.extractor.extract_context(previous_conversations)
+        handler.incremental_updater.save_context_pack(context, str(tmp_path / "context_pack.json"))
+        
+        if request.param == "ndjson":
+            handler.incremental_updater.save_parsed_export(
+                ParsedExport(
+                    format_version="2024-01-01",
+                    export_date=now,
+                    conversations=previous_conversations,
+                    metadata={}
+                ),
+                str(tmp_path / "parsed_export.ndjson")
+            )
+        else:
+            with open(tmp_path / "parsed_export.json", 'w') as f:
+                json.dump({
+                    "format_version": "2024-01-01",
+                    "export_date": now.isoformat(),
+                    "conversations": [_conversation_data(c) for c in previous_conversations],
+                    "metadata": {}
+                }, f)
+        
+        return tmp_path
+    
+    def test_incremental_update_only_rebuilds_unchanged_conversations(self, handler, previous_dir, tmp_path):
+        """Test that only conversations needing a full comparison are rebuilt from the saved export."""
+        now = datetime(2024, 1, 10)
+        current_export = ParsedExport(
+            format_version="2024-01-01",
+            export_date=now,
+            conversations=[
+                _conversation("unchanged", "I use Python and Django", now),
+                _conversation("updated", "I use React", now),
+                _conversation("new", "I use Rust", now),
+            ],
+            metadata={}
+        )
+        config = ExportConfig(
+            input_path="unused.json",
+            target_platform="gemini",
+            output_path=str(tmp_path / "out"),
+            incremental=True,
+            previous_context_path=str(previous_dir / "context_pack.json")
+        )
+        
+        with patch.object(handler, '_conversation_from_data',
+                          wraps=handler._conversation_from_data) as mock_rebuild, \
+                patch.object(handler.extractor, 'extract_context',
+                             wraps=handler.extractor.extract_context) as mock_extract:
+            handler._handle_incremental_update(current_export, config)
+        
+        assert [call.args[0]["id"] for call in mock_rebuild.call_args_list] == ["unchanged"]
+        extracted = mock_extract.call_args.args[0]
+        assert [conv.id for conv in extracted] == ["updated", "new"]
+        assert os.path.exists(tmp_path / "out" / "delta_package.json")
+    
+    def test_extract_context_with_workers_merges_shards(self, handler):
+        """Test that sharded extraction produces a single fresh context pack."""
+        now = datetime(2024, 1, 10)
+        conversations = [
+            _conversation(f"conv{i}", content, now)
+            for i, content in enumerate([
+                "I use Python and Django", "I use React", "I use Rust", "I use Python"
+            ])
+        ]
+        
+        context = handler._extract_context(conversations, workers=2)
+        
+        assert context.version == "1.0"
+        assert context.metadata["total_conversations"] == 4
+        assert context.metadata["extraction_workers"] == 2
+        assert "merge_source" not in context.metadata
+        assert "Python" in context.technical_context.languages
+        assert "Rust" in context.technical_context.languages
+    
+    def test_extract_context_runs_small_inputs_in_process(self, handler):
+        """Test that inputs too small to shard skip the process pool."""
+        conversations = [_conversation("conv1", "I use Python", datetime(2024, 1, 10))]
+        
+        with patch('llm_context_exporter.core.export_handler.ProcessPoolExecutor') as mock_pool:
+            context = handler._extract_context(conversations, workers=4)
+        
+        mock_pool.assert_not_called()
+        assert context.metadata["total_conversations"] == 1
+    
+    def test_save_ollama_output_writes_all_files_in_order(self, handler, tmp_path):
+        """Test that Ollama output files are written with their expected contents."""
+        output = OllamaOutput(
+            modelfile_content="FROM qwen\n",
+            supplementary_files={"context_notes.md": "Notes \u2013 caf\u00e9"},
+            setup_commands=["ollama create my-model -f Modelfile"],
+            test_commands=["ollama run my-model 'hi'"]
+        )
+        
+        files = handler._save_ollama_output(output, tmp_path)
+        
+        assert [os.path.basename(path) for path in files] == [
+            "Modelfile", "context_notes.md", "setup_commands.sh", "test_commands.sh"
+        ]
+        with open(files[1], encoding='utf-8') as f:
+            assert f.read() == "Notes \u2013 caf\u00e9"
+        with open(files[2], encoding='utf-8') as f:
+            assert f.read() == (
+                "#!/bin/bash\n# Ollama Model Setup Commands\n\n"
+                "ollama create my-model -f Modelfile\n"
+            )
+    
+    def test_parse_export_reuses_result_until_file_changes(self, handler, tmp_path):
+        """Test that an unchanged export file is parsed only once."""
+        export_path = tmp_path / "conversations.json"
+        export_path.write_text("[]")
+        parsed = ParsedExport(format_version="2024-01-01", export_date=datetime(2024, 1, 10),
+                              conversations=[], metadata={})
+        
+        with patch.object(handler.parser, 'parse_export', return_value=parsed) as mock_parse:
+            assert handler._parse_export(str(export_path)) is parsed
+            assert handler._parse_export(str(export_path)) is parsed
+            assert mock_parse.call_count == 1
+            
+            stat = export_path.stat()
+            os.utime(export_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+            handler._parse_export(str(export_path))
+            assert mock_parse.call_count == 2
+    
+    def test_save_validation_tests_formats_questions(self, handler, tmp_path):
+        """Test the layout of the saved validation questions."""
+        suite = ValidationSuite(
+            questions=[ValidationQuestion("What do I use?", "Python", "technical")],
+            target_platform="gemini"
+        )
+        
+        path = handler._save_validation_tests(suite, tmp_path)
+        
+        with open(path, encoding='utf-8') as f:
+            assert f.read() == (
+                "# Validation Tests for GEMINI\n\n"
+                "Use these questions to validate that your context was successfully transferred.\n\n"
+                "## Question 1 (technical)\n\n"
+                "**Question:** What do I use?\n\n"
+                "**Expected Answer:** Python\n\n"
+                "---\n\n"
+            )
+    
+    def test_get_filterable_items_topics_are_unique_and_ordered(self, handler):
+        """Test that topics keep first-seen order without duplicates."""
+        parsed = ParsedExport(format_version="2024-01-01", export_date=datetime(2024, 1, 10),
+                              conversations=[], metadata={})
+        context = UniversalContextPack(
+            version="1.0",
+            created_at=datetime(2024, 1, 10),
+            source_platform="chatgpt",
+            user_profile=UserProfile(),
+            projects=[],
+            preferences=UserPreferences(),
+            technical_context=TechnicalContext(
+                languages=["Python", "Rust"],
+                frameworks=["Django", "Python"],
+                domains=["web development", "Rust"]
+            )
+        )
+        
+        with patch.object(handler, '_parse_export', return_value=parsed), \
+                patch.object(handler.extractor, 'extract_context', return_value=context), \
+                patch.object(handler.filter_engine, 'get_filterable_items', return_value=[]):
+            items = handler.get_filterable_items("unused.json")
+        
+        assert items["topics"] == ["Python", "Rust", "Django", "web development"]
+    
+    def test_export_reuses_context_from_get_filterable_items(self, handler, tmp_path):
+        """Test that export doesn't re-extract an export already shown for filtering."""
+        parsed = ParsedExport(format_version="2024-01-01", export_date=datetime(2024, 1, 10),
+                              conversations=[], metadata={})
+        context = UniversalContextPack(
+            version="1.0",
+            created_at=datetime(2024, 1, 10),
+            source_platform="chatgpt",
+            user_profile=UserProfile(),
+            projects=[],
+            preferences=UserPreferences(),
+            technical_context=TechnicalContext()
+        )
+        config = ExportConfig(input_path="unused.json", target_platform="ollama",
+                              output_path=str(tmp_path / "out"))
+        
+        with patch.object(handler, '_parse_export', return_value=parsed), \
+                patch.object(handler.extractor, 'extract_context', return_value=context) as mock_extract, \
+                patch.object(handler.filter_engine, 'get_filterable_items', return_value=[]):
+            handler.get_filterable_items("unused.json")
+            result = handler.export(config)
+        
+        assert result["success"], result["errors"]
+        assert mock_extract.call_count == 1
+    
+    def test_export_saves_parsed_export_only_for_incremental_updates(self, handler, previous_dir, tmp_path):
+        """Test that raw conversations are only saved for incremental updates, minus excluded ones."""
+        now = datetime(2024, 1, 10)
+        parsed = ParsedExport(format_version="2024-01-01", export_date=now,
+                              conversations=[_conversation("conv1", "I use Python", now),
+                                             _conversation("private", "Something personal", now)],
+                              metadata={})
+        
+        with patch.object(handler, '_parse_export', return_value=parsed):
+            result = handler.export(ExportConfig(input_path="unused.json", target_platform="ollama",
+                                                 output_path=str(tmp_path / "full")))
+        assert result["success"], result["errors"]
+        assert not os.path.exists(tmp_path / "full" / "parsed_export.ndjson")
+        
+        config = ExportConfig(
+            input_path="unused.json",
+            target_platform="ollama",
+            output_path=str(tmp_path / "out"),
+            filters=FilterConfig(excluded_conversation_ids=["private"]),
+            incremental=True,
+            previous_context_path=str(previous_dir / "context_pack.json")
+        )
+        with patch.object(handler, '_parse_export', return_value=parsed):
+            result = handler.export(config)
+        
+        assert result["success"], result["errors"]
+        parsed_export_path = str(tmp_path / "out" / "parsed_export.ndjson")
+        assert parsed_export_path in result["output_files"]
+        
+        info, records = handler._open_previous_export(parsed_export_path)
+        assert info["format_version"] == "2024-01-01"
+        assert [record["id"] for record in records] == ["conv1"]
@@ -10,9 +10,12 @@ import tempfile
 import os
 import json
 from datetime import datetime, timedelta
+from itertools import islice
 from typing import List
+from unittest.mock import patch
 
-from llm_context_exporter.core.filter import FilterEngine, FilterableItem
+from llm_context_exporter.core import serialization
+from llm_context_exporter.core.filter import FilterEngine, FilterableItem, _CompiledFilters
 from llm_context_exporter.core.models import (
     UniversalContextPack, FilterConfig, ProjectBrief, UserProfile,
     UserPreferences, TechnicalContext, Conversation, Message
@@ -140,6 +143,23 @@ class TestFilterEngine:
         assert filtered_context.metadata["original_project_count"] == 3
         assert filtered_context.metadata["filtered_project_count"] == 3
     
+    def test_apply_filters_noop_skips_matching(self, filter_engine: FilterEngine, sample_context_pack: UniversalContextPack):
+        """Test that filters excluding nothing keep every item without matching them."""
+        assert FilterConfig().is_noop()
+        assert not FilterConfig(excluded_topics=["React"]).is_noop()
+        assert not FilterConfig(min_relevance_score=0.5).is_noop()
+        
+        with patch.object(filter_engine, "_filter_projects") as filter_projects, \
+             patch.object(filter_engine, "_filter_technical_context") as filter_technical:
+            filtered_context = filter_engine.apply_filters(sample_context_pack, FilterConfig())
+        
+        filter_projects.assert_not_called()
+        filter_technical.assert_not_called()
+        assert filtered_context.projects == sample_context_pack.projects
+        assert filtered_context.projects is not sample_context_pack.projects
+        assert filtered_context.technical_context == sample_context_pack.technical_context
+        assert filtered_context.metadata["filtered"] is True
+    
     def test_apply_filters_exclude_topics(self, filter_engine: FilterEngine, sample_context_pack: UniversalContextPack):
         """Test applying filters with topic exclusions."""
         filters = FilterConfig(excluded_topics=["React", "Python"])
@@ -226,6 +246,27 @@ class TestFilterEngine:
             assert hasattr(item, 'description')
             assert hasattr(item, 'metadata')
     
+    def test_iter_filterable_items_is_lazy(self, filter_engine: FilterEngine, sample_context_pack: UniversalContextPack):
+        """Test that iterating filterable items yields the same items one at a time."""
+        items = filter_engine.iter_filterable_items(sample_context_pack)
+        
+        assert [item.item_id for item in islice(items, 2)] == ["project_Web App", "project_Python API"]
+        
+        def fields(item):
+            return (item.item_id, item.item_type, item.title, item.description, item.metadata)
+        
+        assert [fields(item) for item in filter_engine.iter_filterable_items(sample_context_pack)] == \
+            [fields(item) for item in filter_engine.get_filterable_items(sample_context_pack)]
+    
+    def test_filterable_items_are_hashable_and_mutable(self, filter_engine: FilterEngine, sample_context_pack: UniversalContextPack):
+        """Test that filterable items hash by identity and can be updated."""
+        items = filter_engine.get_filterable_items(sample_context_pack)
+        
+        assert len(set(items)) == len(items)
+        items[0].metadata["selected"] = True
+        items[0].title = "Renamed"
+        assert items[0].title == "Renamed"
+    
     def test_get_filterable_conversations(self, filter_engine: FilterEngine, sample_conversations: List[Conversation]):
         """Test getting filterable conversations."""
         items = filter_engine.get_filterable_conversations(sample_conversations)
@@ -263,6 +304,17 @@ class TestFilterEngine:
         assert "Python" in filters.excluded_topics
         assert "web development" in filters.excluded_topics
     
+    def test_create_filter_from_exclusions_strips_prefix_once(self, filter_engine: FilterEngine):
+        """Test that only the leading item type is removed from an item ID."""
+        filters = filter_engine.create_filter_from_exclusions([
+            "conversation_conversation_7",
+            "project_side project_2",
+            "unknown_thing",
+        ])
+        
+        assert filters.excluded_conversation_ids == ["conversation_7"]
+        assert filters.excluded_topics == ["side project_2"]
+    
     def test_create_date_range_filter(self, filter_engine: FilterEngine):
         """Test creating date range filter."""
         start_date = datetime(2023, 1, 1)
@@ -331,6 +383,37 @@ class TestFilterEngine:
         assert loaded_filters.date_range == (start_date, end_date)
         assert loaded_filters.excluded_topics == original_filters.excluded_topics
     
+    def test_load_filter_preferences_reuses_unchanged_file(self, filter_engine: FilterEngine):
+        """Test that an unchanged preferences file is parsed once and copies are returned."""
+        filter_engine.save_filter_preferences(FilterConfig(excluded_topics=["Python"]))
+        
+        with patch.object(serialization, 'load_file', wraps=serialization.load_file) as mock_load:
+            first = filter_engine.load_filter_preferences()
+            first.excluded_topics.append("React")
+            second = filter_engine.load_filter_preferences()
+            
+            assert mock_load.call_count == 1
+            assert second.excluded_topics == ["Python"]
+            
+            filter_engine.save_filter_preferences(FilterConfig(excluded_topics=["Rust"]))
+            assert filter_engine.load_filter_preferences().excluded_topics == ["Rust"]
+            assert mock_load.call_count == 2
+    
+    def test_save_filter_preferences_keeps_old_file_on_failed_write(self, filter_engine: FilterEngine):
+        """Test that a failed save leaves the previous preferences in place."""
+        filter_engine.save_filter_preferences(FilterConfig(excluded_topics=["Python"]))
+        
+        with patch("llm_context_exporter.core.filter.os.replace", side_effect=OSError("disk full")):
+            filter_engine.save_filter_preferences(FilterConfig(excluded_topics=["Rust"]))
+        
+        assert filter_engine.load_filter_preferences().excluded_topics == ["Python"]
+        prefix = os.path.basename(filter_engine.preferences_file) + "."
+        leftovers = [
+            name for name in os.listdir(os.path.dirname(filter_engine.preferences_file))
+            if name.startswith(prefix) and name.endswith(".tmp")
+        ]
+        assert leftovers == []
+    
     def test_load_filter_preferences_no_file(self, filter_engine: FilterEngine):
         """Test loading filter preferences when no file exists."""
         # Ensure file doesn't exist
@@ -362,21 +445,62 @@ class TestFilterEngine:
         assert summary["projects_remaining"] >= 0
         assert len(summary["removed_project_names"]) == summary["projects_removed"]
     
-    def test_is_topic_excluded_exact_match(self, filter_engine: FilterEngine):
+    def test_excludes_topic_exact_match(self):
         """Test topic exclusion with exact match."""
-        excluded_topics = ["Python", "React"]
+        compiled = _CompiledFilters.from_config(FilterConfig(excluded_topics=["Python", "React"]))
         
-        assert filter_engine._is_topic_excluded("Python", excluded_topics)
-        assert filter_engine._is_topic_excluded("python", excluded_topics)  # Case insensitive
-        assert not filter_engine._is_topic_excluded("JavaScript", excluded_topics)
+        assert compiled.excludes_topic("Python")
+        assert compiled.excludes_topic("python")  # Case insensitive
+        assert not compiled.excludes_topic("JavaScript")
     
-    def test_is_topic_excluded_partial_match(self, filter_engine: FilterEngine):
+    def test_excludes_topic_partial_match(self):
         """Test topic exclusion with partial match."""
-        excluded_topics = ["React"]
+        compiled = _CompiledFilters.from_config(FilterConfig(excluded_topics=["React"]))
+        
+        assert compiled.excludes_topic("React Native")
+        assert compiled.excludes_topic("react-router")
+        assert not compiled.excludes_topic("Vue")
+    
+    def test_compiled_filters_lowercase_and_dedupe_topics(self):
+        """Test that excluded topics are prepared once, lowercased and deduplicated."""
+        compiled = _CompiledFilters.from_config(
+            FilterConfig(excluded_topics=["React", "react", "PostgreSQL"], min_relevance_score=0.5)
+        )
+        
+        assert compiled.excluded_substrings == ("react", "postgresql")
+        assert compiled.excluded_exact == frozenset({"react", "postgresql"})
+        assert compiled.min_relevance_score == 0.5
+        assert compiled.excludes_topic("REACT")
+        assert compiled.excludes_topic("Amazon PostgreSQL")
+        assert not compiled.excludes_topic("Postgres")
+        assert compiled.checked_topics == {"REACT": True, "Amazon PostgreSQL": True, "Postgres": False}
+    
+    def test_apply_filters_delta_narrows_previous_result(self, filter_engine: FilterEngine, sample_context_pack: UniversalContextPack):
+        """Test that stricter filters only revisit items the previous filters kept."""
+        previous_filters = FilterConfig(excluded_topics=["PostgreSQL"])
+        previous = filter_engine.apply_filters(sample_context_pack, previous_filters)
+        filters = FilterConfig(excluded_topics=["postgresql", "Firebase"], min_relevance_score=0.5)
+        
+        with patch.object(filter_engine, '_should_exclude_project',
+                          wraps=filter_engine._should_exclude_project) as mock_exclude:
+            delta = filter_engine.apply_filters_delta(sample_context_pack, previous, previous_filters, filters)
+        
+        full = filter_engine.apply_filters(sample_context_pack, filters)
+        assert [p.name for p in delta.projects] == [p.name for p in full.projects] == ["Web App"]
+        assert delta.technical_context == full.technical_context
+        assert mock_exclude.call_count == len(previous.projects)
+        assert delta.metadata["original_project_count"] == len(sample_context_pack.projects)
+    
+    def test_apply_filters_delta_refilters_when_loosened(self, filter_engine: FilterEngine, sample_context_pack: UniversalContextPack):
+        """Test that removing an exclusion re-admits items from the original context."""
+        previous_filters = FilterConfig(excluded_topics=["React"])
+        previous = filter_engine.apply_filters(sample_context_pack, previous_filters)
+        filters = FilterConfig()
+        
+        delta = filter_engine.apply_filters_delta(sample_context_pack, previous, previous_filters, filters)
         
-        assert filter_engine._is_topic_excluded("React Native", excluded_topics)
-        assert filter_engine._is_topic_excluded("react-router", excluded_topics)
-        assert not filter_engine._is_topic_excluded("Vue", excluded_topics)
+        assert [p.name for p in delta.projects] == [p.name for p in sample_context_pack.projects]
+        assert delta.technical_context == sample_context_pack.technical_context
     
     def test_filter_preserves_coherence(self, filter_engine: FilterEngine, sample_context_pack: UniversalContextPack):
         """Test that filtering preserves context coherence."""
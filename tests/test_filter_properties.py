@@ -12,7 +12,7 @@ from typing import List
 import tempfile
 import os
 
-from llm_context_exporter.core.filter import FilterEngine, FilterableItem
+from llm_context_exporter.core.filter import FilterEngine, FilterableItem, _CompiledFilters
 from llm_context_exporter.core.models import (
     UniversalContextPack, FilterConfig, ProjectBrief, UserProfile,
     UserPreferences, TechnicalContext, Conversation, Message
@@ -248,39 +248,40 @@ class TestFilterProperties:
         try:
             # Apply filters
             filtered_context = filter_engine.apply_filters(context, filters)
+            excludes_topic = _CompiledFilters.from_config(filters).excludes_topic
             
             # Property: No project should contain excluded topics in its name or tech stack
             for project in filtered_context.projects:
                 for excluded_topic in filters.excluded_topics:
                     # Check project name doesn't match excluded topic
-                    assert not filter_engine._is_topic_excluded(project.name, filters.excluded_topics), \
+                    assert not excludes_topic(project.name), \
                         f"Project '{project.name}' should be excluded due to topic '{excluded_topic}'"
                     
                     # Check tech stack doesn't contain excluded topics
                     for tech in project.tech_stack:
-                        assert not filter_engine._is_topic_excluded(tech, filters.excluded_topics), \
+                        assert not excludes_topic(tech), \
                             f"Project '{project.name}' should be excluded due to tech '{tech}' matching topic '{excluded_topic}'"
             
             # Property: Technical context should not contain excluded topics
             for excluded_topic in filters.excluded_topics:
                 # Check languages
                 for language in filtered_context.technical_context.languages:
-                    assert not filter_engine._is_topic_excluded(language, filters.excluded_topics), \
+                    assert not excludes_topic(language), \
                         f"Language '{language}' should be excluded due to topic '{excluded_topic}'"
             
             # Check frameworks
             for framework in filtered_context.technical_context.frameworks:
-                assert not filter_engine._is_topic_excluded(framework, filters.excluded_topics), \
+                assert not excludes_topic(framework), \
                     f"Framework '{framework}' should be excluded due to topic '{excluded_topic}'"
             
             # Check tools
             for tool in filtered_context.technical_context.tools:
-                assert not filter_engine._is_topic_excluded(tool, filters.excluded_topics), \
+                assert not excludes_topic(tool), \
                     f"Tool '{tool}' should be excluded due to topic '{excluded_topic}'"
             
             # Check domains
             for domain in filtered_context.technical_context.domains:
-                assert not filter_engine._is_topic_excluded(domain, filters.excluded_topics), \
+                assert not excludes_topic(domain), \
                     f"Domain '{domain}' should be excluded due to topic '{excluded_topic}'"
         
         finally:
@@ -0,0 +1,99 @@
+"""
+Tests for the JSON serialization helpers.
+
+Both the orjson and standard library backends must produce files the
+other can read.
+"""
+
+import pytest
+from dataclasses import dataclass
+from datetime import datetime
+from unittest.mock import patch
+
+from llm_context_exporter.core import serialization
+
+
+class TestSerialization:
+    """Test cases for the serialization helpers."""
+    
+    @pytest.fixture(params=["orjson", "stdlib"])
+    def backend(self, request):
+        """Run each test with and without orjson."""
+        if request.param == "orjson":
+            if serialization.orjson is None:
+                pytest.skip("orjson is not installed")
+            yield
+        else:
+            with patch.object(serialization, "orjson", None):
+                yield
+    
+    def test_round_trip(self, backend, tmp_path):
+        """Test that data survives a dump and load through a file."""
+        data = {"name": "Café", "tags": ["python", "ml"], "score": 0.5, "nested": {"ok": True}}
+        path = tmp_path / "data.json"
+        
+        serialization.dump_file(data, str(path))
+        
+        assert serialization.load_file(str(path)) == data
+        assert path.read_bytes().startswith(b"{\n  ")
+    
+    def test_unsupported_values_use_str(self, backend):
+        """Test that values JSON can't represent are written with str()."""
+        data = serialization.loads(serialization.dumps({"value": _Token()}))
+        assert data == {"value": "token"}
+    
+    def test_dataclasses_serialize_the_same_on_every_backend(self):
+        """Test that dataclasses and datetimes encode identically with and without orjson."""
+        pack = {"profile": _Profile(name="Ada", joined=datetime(2024, 1, 1, 12, 30, 5, 250))}
+        expected = {"profile": {"name": "Ada", "joined": "2024-01-01T12:30:05.000250"}}
+        
+        with patch.object(serialization, "orjson", None):
+            assert serialization.loads(serialization.dumps(pack)) == expected
+        if serialization.orjson is not None:
+            assert serialization.loads(serialization.dumps(pack)) == expected
+    
+    def test_backends_read_each_other(self, tmp_path):
+        """Test that files written by one backend are readable by the other."""
+        data = {"created_at": datetime(2024, 1, 1).isoformat(), "items": [1, 2, 3]}
+        path = tmp_path / "data.json"
+        
+        with patch.object(serialization, "orjson", None):
+            serialization.dump_file(data, str(path))
+        assert serialization.load_file(str(path)) == data
+    
+    def test_lines_round_trip(self, backend, tmp_path):
+        """Test that newline-delimited documents stream back in order."""
+        documents = [{"header": True}, {"id": "a", "text": "line\nbreak"}, {"id": "b"}]
+        path = tmp_path / "data.ndjson"
+        
+        serialization.dump_lines(iter(documents), str(path))
+        
+        assert path.read_bytes().count(b"\n") == len(documents)
+        assert list(serialization.iter_lines(str(path))) == documents
+    
+    def test_invalid_json_raises_value_error(self, backend):
+        """Test that invalid documents raise ValueError on every backend."""
+        with pytest.raises(ValueError):
+            serialization.loads(b"{not json")
+    
+    def test_parse_datetime_reads_isoformat(self):
+        """Test that timestamps written with isoformat() parse back unchanged."""
+        for value in (datetime(2024, 1, 1), datetime(2024, 1, 1, 12, 30, 5, 250)):
+            assert serialization.parse_datetime(value.isoformat()) == value
+        
+        with pytest.raises(ValueError):
+            serialization.parse_datetime("not a date")
+
+
+class _Token:
+    """Object without a JSON representation."""
+    
+    def __str__(self):
+        return "token"
+
+
+@dataclass
+class _Profile:
+    """Small dataclass for serialization tests."""
+    name: str
+    joined: datetime